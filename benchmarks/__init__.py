@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the Library Management System.
+
+Each module can be run as a script from the project root, e.g.:
+    python benchmarks/benchmark_carga_isbn.py
+"""
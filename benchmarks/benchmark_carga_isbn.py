@@ -0,0 +1,56 @@
+"""
+Benchmark: bulk load of books through GestorBiblioteca before and after the
+ISBN hash index.
+
+"Antes" reproduces the previous behavior of InventarioGeneral, which ran a
+linear `buscar_por_isbn` scan for every insert (O(n²) for a bulk load).
+Since that version is quadratic, it is only measured up to LIMITE_ANTES books;
+larger sizes are reported as skipped.
+
+Books are loaded in ascending ISBN order, so the ordered inventory performs no
+insertion swaps and the measurement isolates the duplicate check.
+
+Use:
+    python benchmarks/benchmark_carga_isbn.py [tamaño ...]
+"""
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.gestor_biblioteca import GestorBiblioteca
+from controllers.listas.inventario_general import InventarioGeneral
+
+LIMITE_ANTES = 100_000
+
+class InventarioGeneralLineal(InventarioGeneral):
+    """InventarioGeneral with the previous linear duplicate check."""
+
+    def agregar_libro(self, libro):
+        for existente in self:
+            if existente.isbn == libro.isbn:
+                return False
+        return super().agregar_libro(libro)
+
+def cargar(libros, lineal=False):
+    """Loads all books into a new manager and returns it."""
+    gestor = GestorBiblioteca()
+    if lineal:
+        gestor.inventario_general = InventarioGeneralLineal()
+    for libro in libros:
+        gestor.agregar_libro(libro)
+    return gestor
+
+def main():
+    tamanios = leer_tamanios([10_000, 100_000, 1_000_000])
+    print(f"{'Libros':>10} | {'Antes (s)':>12} | {'Después (s)':>12} | {'Aceleración':>11}")
+    print("-" * 54)
+    for n in tamanios:
+        libros = generar_libros(n, ordenados=True)
+        _, despues = medir(cargar, libros)
+        if n <= LIMITE_ANTES:
+            _, antes = medir(cargar, libros, lineal=True)
+            print(f"{n:>10,} | {antes:>12.3f} | {despues:>12.3f} | {antes / despues:>10.1f}x")
+        else:
+            print(f"{n:>10,} | {'omitido':>12} | {despues:>12.3f} | {'-':>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: per-author statistics before and after the fused single pass.
+
+"Antes" reproduces the previous multi-pass computations on the stack-safe
+engine: calcular_estadisticas_peso walked the list four times (total, count,
+minimum, maximum) and analizar_valor_por_autor three times (total, count,
+books) plus a calcular_valor_menor pass. "Después" is the current version,
+which does a single pass (agregar_autor) for each analysis.
+
+Use:
+    python benchmarks/benchmark_estadisticas_autor.py [tamaño ...]
+    (default: 100000 1000000)
+"""
+
+import math
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.recursion.motor import Llamada, trampolin
+from controllers.recursion.peso_promedio import calcular_estadisticas_peso
+from controllers.recursion.valor_total import (
+    analizar_valor_por_autor, calcular_valor_total, calcular_valor_menor,
+    contar_libros_autor, obtener_libros_autor
+)
+from models.diccionario_valores import AUTORES
+
+AUTOR = "garcia"
+
+def estadisticas_peso_varias_pasadas(lista_libros, autor):
+    """Previous calcular_estadisticas_peso: one tail recursion per statistic."""
+    autores = AUTORES.coincidentes(autor)
+
+    def calcular_peso_total(libros, indice=0, acumulado=0.0):
+        if indice >= len(libros):
+            return acumulado
+        libro = libros[indice]
+        if libro.autor in autores:
+            return Llamada(calcular_peso_total, libros, indice + 1, acumulado + libro.peso)
+        return Llamada(calcular_peso_total, libros, indice + 1, acumulado)
+
+    def contar_libros(libros, indice=0, contador=0):
+        if indice >= len(libros):
+            return contador
+        if libros[indice].autor in autores:
+            return Llamada(contar_libros, libros, indice + 1, contador + 1)
+        return Llamada(contar_libros, libros, indice + 1, contador)
+
+    def calcular_peso_minimo(libros, indice=0, minimo=float('inf')):
+        if indice >= len(libros):
+            return minimo if minimo != float('inf') else 0.0
+        libro = libros[indice]
+        if libro.autor in autores:
+            return Llamada(calcular_peso_minimo, libros, indice + 1, min(minimo, libro.peso))
+        return Llamada(calcular_peso_minimo, libros, indice + 1, minimo)
+
+    def calcular_peso_maximo(libros, indice=0, maximo=0.0):
+        if indice >= len(libros):
+            return maximo
+        libro = libros[indice]
+        if libro.autor in autores:
+            return Llamada(calcular_peso_maximo, libros, indice + 1, max(maximo, libro.peso))
+        return Llamada(calcular_peso_maximo, libros, indice + 1, maximo)
+
+    peso_total = trampolin(calcular_peso_total, lista_libros)
+    cantidad = trampolin(contar_libros, lista_libros)
+    return {
+        'autor': autor,
+        'cantidad_libros': cantidad,
+        'peso_total': peso_total,
+        'peso_promedio': peso_total / cantidad if cantidad > 0 else 0.0,
+        'peso_minimo': trampolin(calcular_peso_minimo, lista_libros),
+        'peso_maximo': trampolin(calcular_peso_maximo, lista_libros)
+    }
+
+def analisis_valor_varias_pasadas(lista_libros, autor):
+    """Previous analizar_valor_por_autor: three recursive passes plus the global minimum."""
+    valor_total = calcular_valor_total(lista_libros, autor)
+    cantidad_libros = contar_libros_autor(lista_libros, autor)
+    libros_encontrados = obtener_libros_autor(lista_libros, autor)
+    resultado_menor = calcular_valor_menor(lista_libros)
+    return {
+        'autor': autor,
+        'cantidad_libros': cantidad_libros,
+        'valor_total': valor_total,
+        'valor_promedio': valor_total / cantidad_libros if cantidad_libros > 0 else 0,
+        'libros': libros_encontrados,
+        'valor_menor': resultado_menor['valor_menor'] if resultado_menor else 0,
+        'libro_menor': resultado_menor['libro'] if resultado_menor else None,
+    }
+
+def mismos_resultados(esperado, obtenido):
+    """
+    Compares two analyses field by field.
+
+    The float totals only have to be close: the fused pass adds left to right
+    and the stack recursion adds while returning (right to left).
+    """
+    if esperado.keys() != obtenido.keys():
+        return False
+    for clave, valor in esperado.items():
+        if isinstance(valor, float):
+            if not math.isclose(valor, obtenido[clave], rel_tol=1e-9):
+                return False
+        elif valor != obtenido[clave]:
+            return False
+    return True
+
+def main():
+    tamanios = leer_tamanios([100_000, 1_000_000])
+    print(f"Estadísticas del autor '{AUTOR}'\n")
+    print(f"{'Libros':>10} | {'Análisis':<18} | {'Antes (s)':>10} | {'Después (s)':>11} | {'Aceleración':>11}")
+    print("-" * 72)
+    casos = [
+        ("Peso (4 pasadas)", estadisticas_peso_varias_pasadas, calcular_estadisticas_peso),
+        ("Valor (4 pasadas)", analisis_valor_varias_pasadas, analizar_valor_por_autor),
+    ]
+    for n in tamanios:
+        libros = generar_libros(n)
+        for nombre, antes, despues in casos:
+            esperado, tiempo_antes = medir(antes, libros, AUTOR)
+            obtenido, tiempo_despues = medir(despues, libros, AUTOR)
+            # Mismo resultado en todos los campos (libros y libro_menor idénticos)
+            assert mismos_resultados(esperado, obtenido), nombre
+            print(f"{n:>10,} | {nombre:<18} | {tiempo_antes:>10.3f} | {tiempo_despues:>11.3f} | "
+                  f"{tiempo_antes / tiempo_despues:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: Insertion Sort methods (lineal, binaria, tramos).
+
+ordenamiento_insercion is timed with each method on a shuffled catalog and on
+a nearly sorted one (sorted by ISBN with 1% of the books moved, like a
+nightly import), together with the comparisons and movements counted by
+contar_comparaciones_insercion.
+
+The last table builds a sorted list by inserting the books one by one with
+insertar_libro_ordenado. "Antes" reproduces the previous version (append and
+pairwise swaps, reading the attribute on every step); "Después" is the
+current one (binary search and a single list.insert).
+
+Use:
+    python benchmarks/benchmark_insercion.py [tamaño ...]
+    (default: 1000 5000)
+"""
+
+import random
+from operator import attrgetter
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.ordenamiento.insercion import (
+    METODOS, contar_comparaciones_insercion, insertar_libro_ordenado,
+    obtener_valor_criterio, ordenamiento_insercion
+)
+
+CRITERIO = 'isbn'
+
+def casi_ordenados(libros, semilla=7):
+    """Books sorted by the criterion with 1% of them moved to random positions."""
+    aleatorio = random.Random(semilla)
+    resultado = sorted(libros, key=attrgetter(CRITERIO))
+    for _ in range(max(1, len(resultado) // 100)):
+        resultado.insert(aleatorio.randrange(len(resultado)), resultado.pop(aleatorio.randrange(len(resultado))))
+    return resultado
+
+def insertar_por_intercambios(lista_ordenada, libro_nuevo, criterio='isbn'):
+    """Previous insertar_libro_ordenado: append and swap backwards."""
+    valor_nuevo = obtener_valor_criterio(libro_nuevo, criterio)
+    lista_ordenada.append(libro_nuevo)
+    i = len(lista_ordenada) - 1
+    while i > 0 and obtener_valor_criterio(lista_ordenada[i - 1], criterio) > valor_nuevo:
+        lista_ordenada[i], lista_ordenada[i - 1] = lista_ordenada[i - 1], lista_ordenada[i]
+        i -= 1
+    return i
+
+def insertar_todos(libros, insertar):
+    """Builds a sorted list inserting the books one by one."""
+    lista = []
+    for libro in libros:
+        insertar(lista, libro, CRITERIO)
+    return lista
+
+def main():
+    tamanios = leer_tamanios([1_000, 5_000])
+    print(f"ordenamiento_insercion por '{CRITERIO}'\n")
+    print(f"{'Libros':>8} | {'Entrada':<13} | {'Método':<8} | {'Tiempo (s)':>10} | {'Comparaciones':>13} | {'Movimientos':>11}")
+    print("-" * 78)
+    for n in tamanios:
+        libros = generar_libros(n)
+        for nombre, entrada in (("aleatoria", libros), ("casi ordenada", casi_ordenados(libros))):
+            esperado = sorted(entrada, key=attrgetter(CRITERIO))
+            for metodo in METODOS:
+                obtenido, segundos = medir(ordenamiento_insercion, list(entrada), CRITERIO, 'asc', metodo)
+                assert obtenido == esperado
+                _, comparaciones, movimientos = contar_comparaciones_insercion(list(entrada), CRITERIO, metodo)
+                print(f"{n:>8,} | {nombre:<13} | {metodo:<8} | {segundos:>10.3f} | {comparaciones:>13,} | {movimientos:>11,}")
+
+    print("\ninsertar_libro_ordenado, un libro a la vez\n")
+    print(f"{'Libros':>8} | {'Antes (s)':>10} | {'Después (s)':>11} | {'Aceleración':>11}")
+    print("-" * 50)
+    for n in tamanios:
+        libros = generar_libros(n)
+        esperado, antes = medir(insertar_todos, libros, insertar_por_intercambios)
+        obtenido, despues = medir(insertar_todos, libros, insertar_libro_ordenado)
+        assert obtenido == esperado
+        print(f"{n:>8,} | {antes:>10.3f} | {despues:>11.3f} | {antes / despues:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark: memory of the models before and after __slots__.
+
+"Antes" uses dict-backed copies of Libro and Prestamo (the previous
+definition of the models); "Después" uses the current slotted models.
+Each variant runs in its own process so the resident memory (RSS) of one
+does not pollute the other. Loans are pushed into PilaHistorial stacks of
+USUARIOS users, as in the system.
+
+For each variant it reports:
+    - bytes per instance measured with tracemalloc (object + its own data)
+    - size of the bare instance (sys.getsizeof, plus its __dict__ if any)
+    - RSS of the process after building all the objects
+
+Use:
+    python benchmarks/benchmark_memoria.py [libros] [prestamos]
+    (default: 1000000 libros, 5000000 préstamos)
+"""
+
+import json
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from utilidades import generar_libros
+
+from controllers.estructuras.pila_historial import PilaHistorial
+from models import Libro, Prestamo
+
+USUARIOS = 10_000
+
+class LibroConDiccionario:
+    """Previous dict-backed Libro (same attributes, no __slots__)."""
+
+class PrestamoConDiccionario:
+    """Previous dict-backed Prestamo."""
+
+    def __init__(self, id, usuario_id, libro_isbn, fecha_prestamo, fecha_devolucion_esperada,
+                 fecha_devolucion_real=None, estado="prestado"):
+        self.id = id
+        self.usuario_id = usuario_id
+        self.libro_isbn = libro_isbn
+        self.fecha_prestamo = fecha_prestamo
+        self.fecha_devolucion_esperada = fecha_devolucion_esperada
+        self.fecha_devolucion_real = fecha_devolucion_real
+        self.estado = estado
+
+def rss_actual():
+    """Current resident memory of the process in bytes (Linux), or peak RSS elsewhere."""
+    try:
+        with open('/proc/self/statm') as f:
+            import os
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def copiar_libro(clase, libro):
+    """Copies the attributes of a book into a new instance of clase (same values, no re-folding)."""
+    copia = object.__new__(clase)
+    for atributo in Libro.__slots__:
+        setattr(copia, atributo, getattr(libro, atributo))
+    return copia
+
+def tamanio_instancia(objeto):
+    """Size of the instance plus its __dict__ (if it has one)."""
+    tamanio = sys.getsizeof(objeto)
+    if hasattr(objeto, '__dict__'):
+        tamanio += sys.getsizeof(objeto.__dict__)
+    return tamanio
+
+def medir_variante(variante, cantidad_libros, cantidad_prestamos):
+    """Builds the objects of one variant and returns its measurements."""
+    # Los libros base se generan fuera de la medición
+    base = generar_libros(cantidad_libros, ordenados=True)
+    isbns = [libro.isbn for libro in base]
+    usuarios = [f"U{i:05d}" for i in range(USUARIOS)]
+    fecha = datetime(2025, 1, 1)
+    devolucion = fecha + timedelta(days=15)
+    clase_libro = LibroConDiccionario if variante == 'antes' else Libro
+    clase_prestamo = PrestamoConDiccionario if variante == 'antes' else Prestamo
+
+    # Ambas variantes copian los mismos valores: solo cambia el objeto
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    libros = [copiar_libro(clase_libro, libro) for libro in base]
+    del base
+    memoria_libros = tracemalloc.get_traced_memory()[0] - inicio
+
+    inicio = tracemalloc.get_traced_memory()[0]
+    pilas = [PilaHistorial(usuario) for usuario in usuarios]
+    for i in range(cantidad_prestamos):
+        usuario = i % USUARIOS
+        pilas[usuario].apilar(clase_prestamo(
+            f"P{i:08d}", usuarios[usuario], isbns[i % cantidad_libros], fecha, devolucion
+        ))
+    memoria_prestamos = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+
+    return {
+        'variante': variante,
+        'bytes_libro': memoria_libros / cantidad_libros,
+        'instancia_libro': tamanio_instancia(libros[0]),
+        'bytes_prestamo': memoria_prestamos / max(1, cantidad_prestamos),
+        'instancia_prestamo': tamanio_instancia(pilas[0].ver_tope()) if cantidad_prestamos else 0,
+        'rss': rss_actual()
+    }
+
+def ejecutar_en_proceso(variante, cantidad_libros, cantidad_prestamos):
+    """Runs one variant in a separate Python process and reads its result."""
+    salida = subprocess.run(
+        [sys.executable, __file__, '--variante', variante, str(cantidad_libros), str(cantidad_prestamos)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+def main():
+    argumentos = sys.argv[1:]
+    if argumentos and argumentos[0] == '--variante':
+        variante = argumentos[1]
+        cantidad_libros, cantidad_prestamos = (int(arg.replace("_", "")) for arg in argumentos[2:4])
+        print(json.dumps(medir_variante(variante, cantidad_libros, cantidad_prestamos)))
+        return
+
+    cantidad_libros = int(argumentos[0].replace("_", "")) if len(argumentos) > 0 else 1_000_000
+    cantidad_prestamos = int(argumentos[1].replace("_", "")) if len(argumentos) > 1 else 5_000_000
+
+    print(f"Memoria de modelos: {cantidad_libros:,} libros y {cantidad_prestamos:,} préstamos "
+          f"en {USUARIOS:,} pilas de historial\n")
+    antes = ejecutar_en_proceso('antes', cantidad_libros, cantidad_prestamos)
+    despues = ejecutar_en_proceso('despues', cantidad_libros, cantidad_prestamos)
+
+    print(f"{'Medida':<34} {'Antes (dict)':>15} {'Después (slots)':>17}")
+    print("-" * 68)
+    print(f"{'Bytes por Libro (tracemalloc)':<34} {antes['bytes_libro']:>15.1f} {despues['bytes_libro']:>17.1f}")
+    print(f"{'Instancia Libro (getsizeof)':<34} {antes['instancia_libro']:>15} {despues['instancia_libro']:>17}")
+    print(f"{'Bytes por Préstamo (tracemalloc)':<34} {antes['bytes_prestamo']:>15.1f} {despues['bytes_prestamo']:>17.1f}")
+    print(f"{'Instancia Préstamo (getsizeof)':<34} {antes['instancia_prestamo']:>15} {despues['instancia_prestamo']:>17}")
+    print(f"{'RSS total del proceso (MB)':<34} {antes['rss'] / 2**20:>15.1f} {despues['rss'] / 2**20:>17.1f}")
+
+if __name__ == "__main__":
+    main()
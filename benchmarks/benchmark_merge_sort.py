@@ -0,0 +1,61 @@
+"""
+Benchmark: merge_sort before and after the bottom-up engine.
+
+"Antes" is the classic recursive version (merge_sort_recursivo), which slices
+new lists at every level and reads the attribute on every comparison.
+"Después" is merge_sort (keys extracted once, natural runs, one buffer).
+The built-in sorted() with a key is shown as reference.
+
+Each size is measured on a shuffled catalog and on a nearly sorted one (sorted
+by the criterion with 1% of the books moved), like a re-sorted report.
+The second table measures the run cutoff (MINIMO_RUN) on the shuffled catalog.
+
+Use:
+    python benchmarks/benchmark_merge_sort.py [tamaño ...]
+    (default: 10000 100000 1000000)
+"""
+
+import random
+from operator import attrgetter
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.ordenamiento.merge_sort import merge_sort, merge_sort_recursivo
+from controllers.ordenamiento.merge_sort_iterativo import extraer_claves, ordenar_posiciones
+
+CRITERIO = 'valor'
+CORTES = [1, 8, 16, 32, 64, 128]
+
+def casi_ordenados(libros, semilla=7):
+    """Books sorted by the criterion with 1% of them moved to random positions."""
+    aleatorio = random.Random(semilla)
+    resultado = sorted(libros, key=attrgetter(CRITERIO))
+    for _ in range(max(1, len(resultado) // 100)):
+        resultado.insert(aleatorio.randrange(len(resultado)), resultado.pop(aleatorio.randrange(len(resultado))))
+    return resultado
+
+def main():
+    tamanios = leer_tamanios([10_000, 100_000, 1_000_000])
+    print(f"merge_sort por '{CRITERIO}' (desc)\n")
+    print(f"{'Libros':>10} | {'Entrada':<14} | {'Antes (s)':>10} | {'Después (s)':>11} | {'sorted() (s)':>12} | {'Aceleración':>11}")
+    print("-" * 84)
+    for n in tamanios:
+        libros = generar_libros(n)
+        for nombre, entrada in (("aleatoria", libros), ("casi ordenada", casi_ordenados(libros))):
+            esperado, antes = medir(merge_sort_recursivo, entrada, CRITERIO, 'desc')
+            obtenido, despues = medir(merge_sort, entrada, CRITERIO, 'desc')
+            _, nativo = medir(sorted, entrada, key=attrgetter(CRITERIO), reverse=True)
+            assert obtenido == esperado
+            print(f"{n:>10,} | {nombre:<14} | {antes:>10.3f} | {despues:>11.3f} | {nativo:>12.3f} | {antes / despues:>10.1f}x")
+
+    n = tamanios[-1]
+    claves = extraer_claves(generar_libros(n), CRITERIO)
+    print(f"\nCorte de inserción binaria (MINIMO_RUN), {n:,} claves aleatorias\n")
+    print(f"{'MINIMO_RUN':>10} | {'Tiempo (s)':>10}")
+    print("-" * 24)
+    for corte in CORTES:
+        _, segundos = medir(ordenar_posiciones, claves, minimo_run=corte)
+        print(f"{corte:>10} | {segundos:>10.3f}")
+
+if __name__ == "__main__":
+    main()
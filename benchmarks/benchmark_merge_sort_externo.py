@@ -0,0 +1,66 @@
+"""
+Benchmark: CSV report of a catalog file, in memory vs External Merge Sort.
+
+"En memoria" loads the whole file (LectorArchivo.cargar_libros) and calls
+generar_reporte_global. "Externo" streams the file through
+generar_reporte_externo with several maximo_en_memoria values. Both reports
+must be identical. The peak of traced memory (tracemalloc) shows that the
+external sort depends on maximo_en_memoria and not on the size of the catalog.
+
+Use:
+    python benchmarks/benchmark_merge_sort_externo.py [tamaño ...]
+    (default: 100000 300000)
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.adquisicion.lector_archivo import LectorArchivo
+from controllers.ordenamiento.merge_sort import generar_reporte_global, generar_reporte_externo
+
+CRITERIO = 'titulo'
+MEMORIAS = [10_000, 50_000]
+
+def con_pico(funcion, *args, **kwargs):
+    """Runs a function and returns (seconds, peak of traced memory in MB)."""
+    tracemalloc.start()
+    _, segundos = medir(funcion, *args, **kwargs)
+    pico = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return segundos, pico
+
+def reporte_en_memoria(ruta_catalogo, ruta_reporte):
+    """Previous path: load the whole catalog and sort it in memory."""
+    libros = LectorArchivo.cargar_libros(ruta_catalogo)
+    generar_reporte_global(libros, CRITERIO, 'asc', formato='csv', ruta_archivo=ruta_reporte)
+
+def main():
+    tamanios = leer_tamanios([100_000, 300_000])
+    filas = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for n in tamanios:
+            catalogo = os.path.join(directorio, f'catalogo_{n}.csv')
+            LectorArchivo.guardar_csv(generar_libros(n), catalogo)
+            segundos, pico = con_pico(reporte_en_memoria, catalogo, 'bench_memoria.csv')
+            filas.append((n, "en memoria", segundos, pico))
+            for maximo in MEMORIAS:
+                segundos, pico = con_pico(generar_reporte_externo, catalogo, CRITERIO, 'asc', formato='csv',
+                                          ruta_archivo='bench_externo.csv', maximo_en_memoria=maximo)
+                filas.append((n, f"externo ({maximo:,})", segundos, pico))
+                with open('reports/bench_memoria.csv', encoding='utf-8') as esperado, \
+                        open('reports/bench_externo.csv', encoding='utf-8') as obtenido:
+                    assert esperado.read() == obtenido.read()
+    for nombre in ('bench_memoria.csv', 'bench_externo.csv'):
+        os.remove(os.path.join('reports', nombre))
+
+    print(f"\nReporte CSV por '{CRITERIO}'\n")
+    print(f"{'Libros':>10} | {'Modo':<18} | {'Tiempo (s)':>10} | {'Pico (MB)':>10}")
+    print("-" * 58)
+    for n, modo, segundos, pico in filas:
+        print(f"{n:>10,} | {modo:<18} | {segundos:>10.2f} | {pico:>10.1f}")
+
+if __name__ == "__main__":
+    main()
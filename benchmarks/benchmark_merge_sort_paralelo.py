@@ -0,0 +1,63 @@
+"""
+Benchmark: merge_sort speedup vs number of processes.
+
+For each size, merge_sort is timed serially (procesos=1) and with 2, 4, 8...
+processes (up to os.cpu_count(), at least 4), sorting by 'valor' (desc) and
+'titulo' (asc). Every result must equal the serial one.
+
+The second table compares serial and 2 processes on small lists with the
+threshold disabled, to place UMBRAL_PARALELO (where the fixed cost of
+starting the processes and sending the keys is recovered).
+
+Use:
+    python benchmarks/benchmark_merge_sort_paralelo.py [tamaño ...]
+    (default: 1000000 3000000)
+"""
+
+import os
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.ordenamiento.merge_sort import merge_sort
+from controllers.ordenamiento.merge_sort_iterativo import extraer_claves, ordenar_posiciones
+from controllers.ordenamiento.merge_sort_paralelo import UMBRAL_PARALELO, ordenar_posiciones_paralelo
+
+CRITERIOS = [('valor', 'desc'), ('titulo', 'asc')]
+TAMANIOS_UMBRAL = [10_000, 25_000, 50_000, 100_000, 200_000]
+
+def main():
+    tamanios = leer_tamanios([1_000_000, 3_000_000])
+    nucleos = os.cpu_count() or 1
+    procesos = [1]
+    while procesos[-1] * 2 <= max(nucleos, 4):
+        procesos.append(procesos[-1] * 2)
+
+    print(f"merge_sort con varios procesos ({nucleos} núcleos disponibles)\n")
+    print(f"{'Libros':>10} | {'Criterio':<13} | {'Procesos':>8} | {'Tiempo (s)':>10} | {'Aceleración':>11}")
+    print("-" * 65)
+    for n in tamanios:
+        libros = generar_libros(n)
+        for criterio, orden in CRITERIOS:
+            esperado, serial = medir(merge_sort, libros, criterio, orden)
+            for cantidad in procesos:
+                if cantidad == 1:
+                    segundos = serial
+                else:
+                    obtenido, segundos = medir(merge_sort, libros, criterio, orden, procesos=cantidad)
+                    assert obtenido == esperado
+                print(f"{n:>10,} | {criterio + ' ' + orden:<13} | {cantidad:>8} | {segundos:>10.3f} | "
+                      f"{serial / segundos:>10.2f}x")
+
+    print(f"\nUmbral (UMBRAL_PARALELO = {UMBRAL_PARALELO:,}), 'titulo' asc\n")
+    print(f"{'Libros':>10} | {'Serial (s)':>10} | {'2 procesos (s)':>14}")
+    print("-" * 42)
+    libros = generar_libros(TAMANIOS_UMBRAL[-1])
+    for n in TAMANIOS_UMBRAL:
+        claves = extraer_claves(libros[:n], 'titulo')
+        esperado, serial = medir(ordenar_posiciones, claves)
+        obtenido, paralelo = medir(ordenar_posiciones_paralelo, claves, procesos=2, umbral=0, minimo_fragmento=1)
+        assert obtenido == esperado
+        print(f"{n:>10,} | {serial:>10.3f} | {paralelo:>14.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: "top K" reports before and after the bounded heap.
+
+"Antes" sorts the whole inventory with merge_sort and keeps the first K books
+(what generar_reporte_global did for every report). "Después" is
+seleccionar_primeros, which keeps a heap of K positions (O(n log K)).
+Both must return exactly the same books in the same order.
+
+Use:
+    python benchmarks/benchmark_top_k.py [tamaño ...]
+    (default: 100000 1000000)
+"""
+
+from utilidades import generar_libros, medir, leer_tamanios
+
+from controllers.ordenamiento.merge_sort import merge_sort
+from controllers.ordenamiento.seleccion import seleccionar_primeros
+
+CASOS = [
+    ("100 más valiosos", 100, 'valor', 'desc'),
+    ("50 más pesados", 50, 'peso', 'desc'),
+    ("1000 por título", 1000, 'titulo', 'asc'),
+    ("100 género/valor", 100, [('genero', 'asc'), ('valor', 'desc')], 'asc'),
+]
+
+def ordenar_y_cortar(lista_libros, limite, criterio, orden):
+    """Previous behavior: full Merge Sort followed by a cut."""
+    return merge_sort(lista_libros, criterio, orden)[:limite]
+
+def main():
+    tamanios = leer_tamanios([100_000, 1_000_000])
+    print(f"{'Libros':>10} | {'Reporte':<18} | {'Antes (s)':>10} | {'Después (s)':>11} | {'Aceleración':>11}")
+    print("-" * 72)
+    for n in tamanios:
+        libros = generar_libros(n)
+        for nombre, limite, criterio, orden in CASOS:
+            esperado, antes = medir(ordenar_y_cortar, libros, limite, criterio, orden)
+            obtenido, despues = medir(seleccionar_primeros, libros, limite, criterio, orden)
+            assert obtenido == esperado
+            print(f"{n:>10,} | {nombre:<18} | {antes:>10.3f} | {despues:>11.3f} | {antes / despues:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
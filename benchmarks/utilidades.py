@@ -0,0 +1,80 @@
+"""
+Shared helpers for the benchmarks: synthetic catalog generation and timing.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Permitir ejecutar los benchmarks como scripts desde la raíz del proyecto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Libro
+
+AUTORES = [
+    "Gabriel García Márquez", "Julio Cortázar", "Jorge Luis Borges",
+    "Isabel Allende", "Mario Vargas Llosa", "Laura Restrepo",
+    "Juan Rulfo", "Octavio Paz", "Pablo Neruda", "Rosario Castellanos",
+]
+GENEROS = ["Ficción", "Poesía", "Ensayo", "Historia", "Ciencia", "Infantil"]
+PALABRAS = [
+    "cien", "años", "soledad", "amor", "tiempos", "cólera", "ciudad",
+    "perros", "casa", "espíritus", "laberinto", "noche", "mar", "río",
+]
+
+def generar_libros(cantidad, ordenados=False, semilla=42):
+    """
+    Generates a synthetic catalog of books.
+
+    Args:
+        cantidad (int): Number of books to generate.
+        ordenados (bool, optional): If True, books are returned in ascending
+            ISBN order (like a catalog export). Default: False (shuffled).
+        semilla (int, optional): Random seed. Default: 42.
+
+    Returns:
+        list: List of Book objects with unique ISBNs.
+    """
+    aleatorio = random.Random(semilla)
+    libros = []
+    for i in range(cantidad):
+        titulo = " ".join(aleatorio.choice(PALABRAS) for _ in range(3)).title()
+        libros.append(Libro(
+            isbn=f"978-{i:010d}",
+            titulo=titulo,
+            autor=aleatorio.choice(AUTORES),
+            peso=round(aleatorio.uniform(0.1, 2.5), 2),
+            valor=float(aleatorio.randrange(10_000, 150_000, 500)),
+            genero=aleatorio.choice(GENEROS),
+            cantidad_disponible=aleatorio.randint(0, 5),
+            cantidad_total=5
+        ))
+    if not ordenados:
+        aleatorio.shuffle(libros)
+    return libros
+
+def medir(funcion, *args, **kwargs):
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Returns:
+        tuple: (resultado, segundos)
+    """
+    inicio = time.perf_counter()
+    resultado = funcion(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+def leer_tamanios(por_defecto):
+    """
+    Reads the benchmark sizes from the command line (e.g. `10000 100000`).
+
+    Args:
+        por_defecto (list): Sizes used when no arguments are given.
+
+    Returns:
+        list: List of integer sizes.
+    """
+    if len(sys.argv) > 1:
+        return [int(arg.replace("_", "")) for arg in sys.argv[1:]]
+    return por_defecto
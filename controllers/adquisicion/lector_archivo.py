@@ -3,9 +3,27 @@ import json
 import os
 from models.libro import Libro
 
+# Caracteres leídos por bloque al recorrer un arreglo JSON sin cargarlo completo
+TAMANO_BLOQUE_JSON = 1 << 16
+
+# Distancia máxima entre un error y el final del búfer cuando el error se debe
+# a un token cortado por el bloque ('-Infinity', escapes \uXXXX); más lejos, el
+# JSON está mal formado
+MAXIMO_TOKEN_CORTADO = 9
+
+# Espacios permitidos entre los elementos de un documento JSON
+ESPACIOS_JSON = ' \t\r\n'
+
 class LectorArchivo:
     """
     Class responsible for loading book data from a .csv or .json file
+
+    Repeated authors and genres of a file end up as a single shared object:
+    Libro interns them in the models' pools (AUTORES, GENEROS) and the
+    per-row strings created by the parser are released.
+
+    The iterar_* methods yield the books one by one without holding the
+    whole file in memory (used by the external sort of the reports).
     """
 
     @staticmethod
@@ -21,14 +39,31 @@ class LectorArchivo:
         Returns:
             list: List of Book objects loaded from the CSV file.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file format does not match.
+        """
+        libros = list(LectorArchivo.iterar_csv(ruta_archivo))
+        print(f"Se cargaron {len(libros)} libros desde {ruta_archivo}")
+        return libros
+
+    @staticmethod
+    def iterar_csv(ruta_archivo: str):
+        """
+        Yields the books of a CSV file one by one (streaming).
+
+        Args:
+            ruta_archivo (str): Path to the CSV file.
+
+        Yields:
+            Libro: Each book, in file order.
+
         Raises:
             FileNotFoundError: If the file does not exist.
             ValueError: If the file format does not match.
         """
         if not os.path.exists(ruta_archivo):
             raise FileNotFoundError(f"El archivo {ruta_archivo} no existe")
-        
-        libros = []
 
         with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
             lector = csv.DictReader(archivo)
@@ -45,16 +80,13 @@ class LectorArchivo:
                         cantidad_disponible=int(fila.get('cantidad_disponible', 1)),
                         cantidad_total=int(fila.get('cantidad_total', 1))
                     )
-                    libros.append(libro)
-
                 except KeyError as e:
                     raise ValueError(f"Columna faltante en línea {linea_num}: {e}"
                     )
                 except ValueError as e:
                     raise ValueError(f"Error en línea {linea_num}: {e}"
                     )
-        print(f"Se cargaron {len(libros)} libros desde {ruta_archivo}")
-        return libros
+                yield libro
     
     @staticmethod
     def cargar_json(ruta_archivo: str):
@@ -69,22 +101,37 @@ class LectorArchivo:
         Returns:
             list: List of Book objects loaded from the JSON file.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file format does not match.
+        """
+        libros = list(LectorArchivo.iterar_json(ruta_archivo))
+        print(f"Se cargaron {len(libros)} libros desde {ruta_archivo}")
+        return libros
+
+    @staticmethod
+    def iterar_json(ruta_archivo: str):
+        """
+        Yields the books of a JSON file one by one (streaming).
+
+        The array is decoded element by element from blocks of the file, so
+        only one block and one book are in memory at a time.
+
+        Args:
+            ruta_archivo (str): Path to the JSON file.
+
+        Yields:
+            Libro: Each book, in file order.
+
         Raises:
             FileNotFoundError: If the file does not exist.
             ValueError: If the file format does not match.
         """
         if not os.path.exists(ruta_archivo):
             raise FileNotFoundError(f"El archivo {ruta_archivo} no existe")
-        
-        libros = []
 
         with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
-            datos = json.load(archivo)
-
-            if not isinstance(datos, list):
-                raise ValueError("El archivo JSON debe contener un arreglo de libros")
-            
-            for idx, item in enumerate(datos):
+            for idx, item in enumerate(LectorArchivo._elementos_json(archivo)):
                 try:
                     libro = Libro(
                         isbn=item['isbn'],
@@ -96,14 +143,85 @@ class LectorArchivo:
                         cantidad_disponible=int(item.get('cantidad_disponible', 1)),
                         cantidad_total=int(item.get('cantidad_total', 1))
                     )
-                    libros.append(libro)
-
                 except KeyError as e:
                     raise ValueError(f"Falta una propiedad en {idx}: {e}")
                 except ValueError as e:
                     raise ValueError(f"Error en el elemento {idx}: {e}")
-        print(f"Se cargaron {len(libros)} libros desde {ruta_archivo}")
-        return libros
+                yield libro
+
+    @staticmethod
+    def _elementos_json(archivo, tamano_bloque=TAMANO_BLOQUE_JSON):
+        """Yields the elements of the top-level JSON array of a file, reading it by blocks."""
+        decodificador = json.JSONDecoder()
+        # inicio: carácter del archivo en el que empieza el búfer (para los mensajes de error)
+        bufer = ''
+        inicio = 0
+        while not bufer:
+            bloque = archivo.read(tamano_bloque)
+            bufer = bloque.lstrip(ESPACIOS_JSON)
+            inicio += len(bloque) - len(bufer)
+            if not bloque:
+                break
+        if not bufer.startswith('['):
+            raise ValueError("El archivo JSON debe contener un arreglo de libros")
+        posicion = 1
+        fin_archivo = False
+        esperando_elemento = True
+        despues_de_coma = False
+        while True:
+            # Saltar espacios y separadores
+            while posicion < len(bufer) and bufer[posicion] in ESPACIOS_JSON:
+                posicion += 1
+            if posicion == len(bufer):
+                if fin_archivo:
+                    raise ValueError("El arreglo JSON está incompleto")
+                bloque = archivo.read(tamano_bloque)
+                fin_archivo = not bloque
+                bufer, posicion, inicio = bufer[posicion:] + bloque, 0, inicio + posicion
+                continue
+            caracter = bufer[posicion]
+            if caracter == ']':
+                if despues_de_coma:
+                    raise ValueError(f"Coma sobrante al final del arreglo JSON (carácter {inicio + posicion})")
+                # Después del arreglo solo puede haber espacios hasta el final
+                resto, inicio = bufer[posicion + 1:], inicio + posicion + 1
+                while True:
+                    if resto.strip(ESPACIOS_JSON):
+                        desplazamiento = len(resto) - len(resto.lstrip(ESPACIOS_JSON))
+                        raise ValueError(f"Datos adicionales después del arreglo JSON (carácter {inicio + desplazamiento})")
+                    inicio += len(resto)
+                    resto = archivo.read(tamano_bloque)
+                    if not resto:
+                        return
+            if not esperando_elemento:
+                if caracter != ',':
+                    raise ValueError(f"Se esperaba ',' en el arreglo JSON: {caracter!r} (carácter {inicio + posicion})")
+                posicion += 1
+                esperando_elemento = despues_de_coma = True
+                continue
+            try:
+                item, fin_item = decodificador.raw_decode(bufer, posicion)
+            except json.JSONDecodeError as e:
+                # Solo un error al final del búfer (o un string sin cerrar)
+                # puede ser un elemento cortado por el bloque; otro es JSON mal formado
+                cortado = (len(bufer) - e.pos <= MAXIMO_TOKEN_CORTADO
+                           or e.msg.startswith('Unterminated string'))
+                bloque = '' if fin_archivo or not cortado else archivo.read(tamano_bloque)
+                if not bloque:
+                    raise ValueError(f"JSON no válido: {e.msg} (carácter {inicio + e.pos})") from None
+                # Elemento cortado por el bloque: leer más y reintentar
+                bufer, posicion, inicio = bufer[posicion:] + bloque, 0, inicio + posicion
+                continue
+            if (not fin_archivo and not isinstance(item, (dict, list, str))
+                    and (fin_item == len(bufer) or bufer[fin_item] not in ESPACIOS_JSON + ',]')):
+                # Un número puede continuar en el siguiente bloque
+                bloque = archivo.read(tamano_bloque)
+                fin_archivo = not bloque
+                bufer, posicion, inicio = bufer[posicion:] + bloque, 0, inicio + posicion
+                continue
+            yield item
+            posicion = fin_item
+            esperando_elemento = despues_de_coma = False
     
     @staticmethod
     def cargar_libros(ruta_archivo: str):
@@ -131,6 +249,31 @@ class LectorArchivo:
                 f"Formato de archivo no soportado: {extension}. "
                 "Solo se soportan .csv y .json"
             )
+
+    @staticmethod
+    def iterar_libros(ruta_archivo: str):
+        """
+        Yields the books of a .csv or .json file one by one (streaming).
+
+        Args:
+            ruta_archivo (str): Path to the file.
+
+        Returns:
+            generator: Books of the file, in file order.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+        extension = os.path.splitext(ruta_archivo)[1].lower()
+        if extension == '.csv':
+            return LectorArchivo.iterar_csv(ruta_archivo)
+        elif extension == '.json':
+            return LectorArchivo.iterar_json(ruta_archivo)
+        else:
+            raise ValueError(
+                f"Formato de archivo no soportado: {extension}. "
+                "Solo se soportan .csv y .json"
+            )
         
     @staticmethod
     def guardar_csv(libros: list, ruta_archivo: str):
@@ -5,6 +5,8 @@ adapted to work with Book objects:
 - Linear Search (Búsqueda Lineal): For general inventory
 
 - Binary Search (Búsqueda Binaria): For ordered inventory 
+
+- Query Planner (Planificador): Multiple search using the inventory indexes
 Use:
     from controllers.busqueda import (
         busqueda_lineal_por_titulo,
@@ -16,6 +18,11 @@ Use:
     
     # Búsqueda binaria en inventario ordenado 
     libro, indice = busqueda_binaria_por_isbn(inventario_ordenado, isbn)
+    
+    # Búsqueda múltiple con los índices del inventario general
+    planificador = PlanificadorConsultas(inventario_general)
+    resultados = busqueda_multiple(libros, planificador, autor="garcia", genero="ficcion")
+    print(planificador.explicar(autor="garcia", genero="ficcion"))
 """
 
 from .busqueda_lineal import (
@@ -25,6 +32,7 @@ from .busqueda_lineal import (
     busqueda_lineal_por_criterio,
     busqueda_lineal_recursiva,
     busqueda_multiple,
+    cumple_criterio,
     contar_comparaciones_lineal
 )
 
@@ -34,10 +42,15 @@ from .busqueda_binaria import (
     busqueda_binaria_por_criterio,
     encontrar_primera_ocurrencia,
     encontrar_ultima_ocurrencia,
+    encontrar_limite_inferior,
+    encontrar_limite_superior,
+    busqueda_binaria_por_rango,
     verificar_lista_ordenada,
     contar_comparaciones_binarias
 )
 
+from .planificador import PlanificadorConsultas, coincide_valor
+
 __all__ = [
     # Búsqueda Lineal
     'busqueda_lineal_por_isbn',
@@ -46,6 +59,7 @@ __all__ = [
     'busqueda_lineal_por_criterio',
     'busqueda_lineal_recursiva',
     'busqueda_multiple',
+    'cumple_criterio',
     'contar_comparaciones_lineal',
     
     # Búsqueda Binaria
@@ -54,6 +68,13 @@ __all__ = [
     'busqueda_binaria_por_criterio',
     'encontrar_primera_ocurrencia',
     'encontrar_ultima_ocurrencia',
+    'encontrar_limite_inferior',
+    'encontrar_limite_superior',
+    'busqueda_binaria_por_rango',
     'verificar_lista_ordenada',
-    'contar_comparaciones_binarias'
+    'contar_comparaciones_binarias',
+    
+    # Planificador de consultas
+    'PlanificadorConsultas',
+    'coincide_valor'
 ]
\ No newline at end of file
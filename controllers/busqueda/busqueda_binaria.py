@@ -97,15 +97,18 @@ def busqueda_binaria_por_criterio(lista_ordenada, criterio, valor):
             derecha = medio - 1
     return None, -1
 
-def encontrar_primera_ocurrencia(lista_libros, isbn):
+def encontrar_primera_ocurrencia(lista_libros, isbn, criterio='isbn'):
     """
     Finds the first occurrence of an ISBN in a sorted list.
     
     Useful if there are duplicate books (same ISBN) in the inventory.
+    With `criterio` it finds the first occurrence of any value in a list
+    sorted by that attribute (e.g. all books of a genre).
     
     Args:
-        lista_libros_ordenados (list): List sorted by ISBN.
-        isbn (str): ISBN to search for.
+        lista_libros_ordenados (list): List sorted by ISBN (or by `criterio`).
+        isbn (str): ISBN (or value of `criterio`) to search for.
+        criterio (str, optional): Attribute the list is sorted by. Default: 'isbn'.
     
     Returns:
         tuple: (libro, índice) of the first occurrence, or (None, -1).
@@ -116,7 +119,7 @@ def encontrar_primera_ocurrencia(lista_libros, isbn):
     libro_encontrado = None
     while izquierda <= derecha:
         medio = izquierda + (derecha - izquierda) // 2
-        isbn_medio = lista_libros[medio].isbn
+        isbn_medio = getattr(lista_libros[medio], criterio)
         if isbn_medio == isbn:
             resultado = medio
             libro_encontrado = lista_libros[medio]
@@ -128,13 +131,14 @@ def encontrar_primera_ocurrencia(lista_libros, isbn):
             izquierda = medio + 1
     return libro_encontrado, resultado
 
-def encontrar_ultima_ocurrencia(lista_libros, isbn):
+def encontrar_ultima_ocurrencia(lista_libros, isbn, criterio='isbn'):
     """
     Finds the last occurrence of an ISBN in a sorted list.
     
     Args:
-        lista_libros_ordenados (list): List sorted by ISBN.
-        isbn (str): ISBN to search for.
+        lista_libros_ordenados (list): List sorted by ISBN (or by `criterio`).
+        isbn (str): ISBN (or value of `criterio`) to search for.
+        criterio (str, optional): Attribute the list is sorted by. Default: 'isbn'.
     
     Returns:
         tuple: (libro, índice) of the last occurrence, or (None, -1).
@@ -145,7 +149,7 @@ def encontrar_ultima_ocurrencia(lista_libros, isbn):
     libro_encontrado = None
     while izquierda <= derecha:
         medio = izquierda + (derecha - izquierda) // 2
-        isbn_medio = lista_libros[medio].isbn
+        isbn_medio = getattr(lista_libros[medio], criterio)
         if isbn_medio == isbn:
             resultado = medio
             libro_encontrado = lista_libros[medio]
@@ -157,6 +161,82 @@ def encontrar_ultima_ocurrencia(lista_libros, isbn):
             izquierda = medio + 1
     return libro_encontrado, resultado
 
+def encontrar_limite_inferior(lista_ordenada, valor, criterio):
+    """
+    Finds the index of the first element whose attribute is >= valor.
+    
+    Same strategy as `encontrar_primera_ocurrencia`, but it also stops on
+    values that are not present (lower bound of a range).
+    
+    Args:
+        lista_ordenada (list): List sorted by `criterio` (ascending).
+        valor: Lower bound of the range.
+        criterio (str): Attribute the list is sorted by.
+    
+    Returns:
+        int: Index of the first element >= valor, or len(lista) if none.
+    """
+    izquierda = 0
+    derecha = len(lista_ordenada) - 1
+    resultado = len(lista_ordenada)
+    while izquierda <= derecha:
+        medio = izquierda + (derecha - izquierda) // 2
+        if getattr(lista_ordenada[medio], criterio) >= valor:
+            resultado = medio
+            # Seguir buscando a la izquierda
+            derecha = medio - 1
+        else:
+            izquierda = medio + 1
+    return resultado
+
+def encontrar_limite_superior(lista_ordenada, valor, criterio):
+    """
+    Finds the index of the last element whose attribute is <= valor.
+    
+    Same strategy as `encontrar_ultima_ocurrencia` (upper bound of a range).
+    
+    Args:
+        lista_ordenada (list): List sorted by `criterio` (ascending).
+        valor: Upper bound of the range.
+        criterio (str): Attribute the list is sorted by.
+    
+    Returns:
+        int: Index of the last element <= valor, or -1 if none.
+    """
+    izquierda = 0
+    derecha = len(lista_ordenada) - 1
+    resultado = -1
+    while izquierda <= derecha:
+        medio = izquierda + (derecha - izquierda) // 2
+        if getattr(lista_ordenada[medio], criterio) <= valor:
+            resultado = medio
+            # Seguir buscando a la derecha
+            izquierda = medio + 1
+        else:
+            derecha = medio - 1
+    return resultado
+
+def busqueda_binaria_por_rango(lista_ordenada, criterio, minimo=None, maximo=None):
+    """
+    Obtains all elements whose attribute is within [minimo, maximo].
+    
+    The list must be sorted by the given criterion. Cost: O(log n + k).
+    
+    Args:
+        lista_ordenada (list): List sorted by `criterio` (ascending).
+        criterio (str): Attribute to filter by.
+        minimo (optional): Lower bound (inclusive). None = no lower bound.
+        maximo (optional): Upper bound (inclusive). None = no upper bound.
+    
+    Returns:
+        list: Elements within the range, in ascending order.
+    """
+    inicio = 0 if minimo is None else encontrar_limite_inferior(lista_ordenada, minimo, criterio)
+    fin = len(lista_ordenada) - 1 if maximo is None else encontrar_limite_superior(lista_ordenada, maximo, criterio)
+    if inicio > fin:
+        return []
+    return list(lista_ordenada[inicio:fin + 1])
+
 def contar_comparaciones_binarias(lista_libros, isbn):
     """
     Counts the number of comparisons made during binary search.
@@ -2,8 +2,16 @@
 This algorithm is used to search for books by Title or Author in the
 General Inventory (unordered list). . It sequentially traverses the entire
 collection until it finds matches.
+
+Text comparisons are case- and accent-insensitive and use the folded keys
+cached on each Libro (titulo_plegado, autor_plegado, genero_plegado). For
+the interned attributes (autor, genero, estante_id) a partial match is
+resolved once per distinct value and books are checked by set membership.
 """
 
+from models.texto import plegar_consulta
+from models.diccionario_valores import DICCIONARIOS
+
 def busqueda_lineal_por_isbn(lista_libros, isbn):
     """
     Search for a book by ISBN using linear search.
@@ -22,7 +30,7 @@ def busqueda_lineal_por_isbn(lista_libros, isbn):
             return libro, indice
     return None, -1
 
-def busqueda_lineal_por_titulo(lista_libros, titulo, parcial=True):
+def busqueda_lineal_por_titulo(lista_libros, titulo, parcial=True, indice_trigramas=None):
     """
     Search for books by title using linear search.
     
@@ -33,14 +41,19 @@ def busqueda_lineal_por_titulo(lista_libros, titulo, parcial=True):
         titulo (str): Title or part of the title to search for.
         parcial (bool, optional): If True, searches for partial matches.
             Default: True.
+        indice_trigramas (IndiceTrigramas, optional): Index of the titles built
+            with `IndiceTrigramas.desde_lista(lista_libros, 'titulo')`. If given,
+            only the candidates of the index are checked. Default: None.
     
     Returns:
         list: List of tuples (libro, índice) with found matches.
     """
     resultados = []
-    titulo_busqueda = titulo.lower()
+    titulo_busqueda = plegar_consulta(titulo)
+    if indice_trigramas is not None:
+        return _filtrar_candidatos(lista_libros, indice_trigramas.buscar(titulo), 'titulo', titulo_busqueda, parcial)
     for indice, libro in enumerate(lista_libros):
-        titulo_libro = libro.titulo.lower()
+        titulo_libro = libro.titulo_plegado
         if parcial:
             # Búsqueda parcial (substring)
             if titulo_busqueda in titulo_libro:
@@ -51,7 +64,7 @@ def busqueda_lineal_por_titulo(lista_libros, titulo, parcial=True):
                 resultados.append((libro, indice))
     return resultados
 
-def busqueda_lineal_por_autor(lista_libros, autor, parcial=True):
+def busqueda_lineal_por_autor(lista_libros, autor, parcial=True, indice_trigramas=None):
     """
     Search for books by author using linear search.
     
@@ -62,14 +75,19 @@ def busqueda_lineal_por_autor(lista_libros, autor, parcial=True):
         autor (str): Author or part of the author's name to search for.
         parcial (bool, optional): If True, searches for partial matches.
             Default: True.
+        indice_trigramas (IndiceTrigramas, optional): Index of the authors built
+            with `IndiceTrigramas.desde_lista(lista_libros, 'autor')`. If given,
+            only the candidates of the index are checked. Default: None.
     
     Returns:
         list: List of tuples (libro, índice) with found matches.
     """
     resultados = []
-    autor_busqueda = autor.lower()
+    autor_busqueda = plegar_consulta(autor)
+    if indice_trigramas is not None:
+        return _filtrar_candidatos(lista_libros, indice_trigramas.buscar(autor), 'autor', autor_busqueda, parcial)
     for indice, libro in enumerate(lista_libros):
-        autor_libro = libro.autor.lower()
+        autor_libro = libro.autor_plegado
         if parcial:
             # Búsqueda parcial (substring)
             if autor_busqueda in autor_libro:
@@ -80,6 +98,29 @@ def busqueda_lineal_por_autor(lista_libros, autor, parcial=True):
                 resultados.append((libro, indice))
     return resultados
 
+def _filtrar_candidatos(lista_libros, posiciones, campo, valor_busqueda, parcial):
+    """
+    Builds the (libro, índice) results from the positions returned by a trigram index.
+    
+    The index already verified the substring; exact searches are filtered here.
+    
+    Args:
+        lista_libros (list): List of Book objects.
+        posiciones (list): Candidate positions in the list.
+        campo (str): Attribute searched ('titulo' or 'autor').
+        valor_busqueda (str): Folded searched value.
+        parcial (bool): If False, only exact matches are kept.
+    
+    Returns:
+        list: List of tuples (libro, índice).
+    """
+    resultados = []
+    for indice in posiciones:
+        libro = lista_libros[indice]
+        if parcial or libro.obtener_plegado(campo) == valor_busqueda:
+            resultados.append((libro, indice))
+    return resultados
+
 def busqueda_lineal_por_criterio(lista_libros, criterio, valor, parcial=False):
     """
     Generic linear search by any attribute of the book.
@@ -101,7 +142,7 @@ def busqueda_lineal_por_criterio(lista_libros, criterio, valor, parcial=False):
         valor_libro = getattr(libro, criterio)
         # Si es string y se busca parcialmente
         if isinstance(valor, str) and isinstance(valor_libro, str) and parcial:
-            if valor.lower() in valor_libro.lower():
+            if plegar_consulta(valor) in libro.obtener_plegado(criterio):
                 resultados.append((libro, indice))
         else:
             # Comparación exacta
@@ -153,34 +194,60 @@ def contar_comparaciones_lineal(lista_libros, isbn):
             return libro, indice, comparaciones
     return None, -1, comparaciones
 
-def busqueda_multiple(lista_libros, **criterios):
+def cumple_criterio(libro, atributo, valor):
+    """
+    Checks if a book meets one criterion of a multiple search.
+    
+    Strings are compared as case- and accent-insensitive partial matches,
+    any other value by equality.
+    
+    Args:
+        libro (Libro): Book to check.
+        atributo (str): Name of the attribute.
+        valor: Value searched for.
+    
+    Returns:
+        bool: True if the book meets the criterion.
+    """
+    if not hasattr(libro, atributo):
+        return False
+    valor_libro = getattr(libro, atributo)
+    if atributo in DICCIONARIOS and isinstance(valor, str):
+        # Valores internados: pertenencia al conjunto de valores coincidentes
+        return valor_libro in DICCIONARIOS[atributo].coincidentes(valor)
+    # Comparación parcial para strings
+    if isinstance(valor, str) and isinstance(valor_libro, str):
+        return plegar_consulta(valor) in libro.obtener_plegado(atributo)
+    return valor_libro == valor
+
+def busqueda_multiple(lista_libros, planificador=None, **criterios):
     """
     Search for books that meet multiple criteria simultaneously.
     
     Args:
         lista_libros (list): List of Book objects.
+        planificador (PlanificadorConsultas, optional): Query planner of the
+            General Inventory. If given, the criteria are resolved with the
+            inventory indexes and `lista_libros` must be the inventory books
+            in order (e.g. `obtener_libros()`). Default: None (linear scan).
         **criterios: Key=value pairs to filter by.
     
     Returns:
         list: List of tuples (libro, indice) that meet all criteria.
     """
+    if planificador is not None:
+        return planificador.ejecutar(**criterios)
+    # Los valores coincidentes de los atributos internados se calculan una vez
+    conjuntos = []
+    restantes = []
+    for atributo, valor in criterios.items():
+        if atributo in DICCIONARIOS and isinstance(valor, str):
+            conjuntos.append((atributo, DICCIONARIOS[atributo].coincidentes(valor)))
+        else:
+            restantes.append((atributo, valor))
     resultados = []
     for indice, libro in enumerate(lista_libros):
-        cumple_todos = True
-        for atributo, valor in criterios.items():
-            if not hasattr(libro, atributo):
-                cumple_todos = False
-                break
-            valor_libro = getattr(libro, atributo)
-            # Comparación parcial para strings
-            if isinstance(valor, str) and isinstance(valor_libro, str):
-                if valor.lower() not in valor_libro.lower():
-                    cumple_todos = False
-                    break
-            else:
-                if valor_libro != valor:
-                    cumple_todos = False
-                    break
-        if cumple_todos:
+        if (all(getattr(libro, atributo, None) in coincidentes for atributo, coincidentes in conjuntos)
+                and all(cumple_criterio(libro, atributo, valor) for atributo, valor in restantes)):
             resultados.append((libro, indice))
     return resultados
\ No newline at end of file
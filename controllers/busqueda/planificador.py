@@ -0,0 +1,208 @@
+"""
+This module resolves multi-criteria searches (busqueda_multiple) on the
+General Inventory using its indexes instead of checking every criterion
+against every book.
+
+For each criterion the planner looks for an access path and estimates how
+many books it returns:
+
+- ISBN: hash index (only when a partial search is equivalent to an exact one)
+- Title / Author: trigram index (queries of 3+ characters)
+- Value / Weight: sorted index (equality as an equal range)
+- Genre / Shelf: bitmap index (the criterion is evaluated per distinct value)
+
+The most selective path produces the candidates, the next paths are
+intersected while they are smaller than the candidates, and the remaining
+criteria are verified only on the candidates. Results are the same as the
+linear search: (libro, indice) tuples in inventory order, with partial
+case- and accent-insensitive matching for strings.
+"""
+
+import math
+import time
+from controllers.busqueda.busqueda_lineal import cumple_criterio
+from models.texto import plegar_consulta, plegar_texto
+
+def coincide_valor(valor_libro, valor):
+    """
+    Checks a single attribute value with the semantics of busqueda_multiple.
+
+    Args:
+        valor_libro: Value of the book attribute.
+        valor: Value searched for.
+
+    Returns:
+        bool: True if the value matches (partial for strings, equality otherwise).
+    """
+    if isinstance(valor, str) and isinstance(valor_libro, str):
+        return plegar_consulta(valor) in plegar_texto(valor_libro)
+    return valor_libro == valor
+
+class PlanificadorConsultas:
+    """
+    Index-aware query planner over a General Inventory.
+
+    Attributes:
+        inventario (InventarioGeneral): Inventory whose indexes are used.
+        ultimo_plan (dict|None): Plan of the last executed query.
+    """
+
+    def __init__(self, inventario):
+        """
+        Initializes the planner.
+
+        Args:
+            inventario (InventarioGeneral): Inventory to query.
+        """
+        self.inventario = inventario
+        self.ultimo_plan = None
+
+    def ejecutar(self, **criterios):
+        """
+        Searches the books that meet all the criteria.
+
+        Args:
+            **criterios: Key=value pairs to filter by.
+
+        Returns:
+            list: List of tuples (libro, indice) in inventory order.
+        """
+        inicio = time.perf_counter()
+        total = len(self.inventario)
+        pasos = self._planificar(criterios)
+
+        # Rutas con índice, de la más selectiva a la menos selectiva
+        candidatos = None
+        verificar = [paso for paso in pasos if paso['acceso'] is None]
+        for paso in sorted((p for p in pasos if p['acceso'] is not None), key=lambda p: p['estimado']):
+            if candidatos is not None and not candidatos:
+                paso['uso'] = 'omitido'
+                continue
+            if candidatos is None and paso['estimado'] < total:
+                t = time.perf_counter()
+                candidatos = {libro.isbn: libro for libro in paso['obtener']()}
+                paso['uso'] = 'principal'
+                paso['reales'] = len(candidatos)
+                paso['tiempo'] = time.perf_counter() - t
+            elif candidatos is not None and paso['estimado'] < len(candidatos):
+                t = time.perf_counter()
+                isbns = {libro.isbn for libro in paso['obtener']()}
+                candidatos = {isbn: libro for isbn, libro in candidatos.items() if isbn in isbns}
+                paso['uso'] = 'intersección'
+                paso['reales'] = len(isbns)
+                paso['tiempo'] = time.perf_counter() - t
+            else:
+                verificar.append(paso)
+        for paso in verificar:
+            paso['uso'] = 'verificación'
+
+        # Verificar los criterios restantes solo sobre los candidatos
+        t = time.perf_counter()
+        condiciones = [(paso['atributo'], paso['valor']) for paso in verificar]
+        if candidatos is None:
+            revisados = total
+            resultados = [(libro, indice) for indice, libro in enumerate(self.inventario)
+                          if all(cumple_criterio(libro, a, v) for a, v in condiciones)]
+        else:
+            revisados = len(candidatos)
+            posicion_de = self.inventario.posicion_de
+            resultados = sorted(
+                ((libro, posicion_de(isbn)) for isbn, libro in candidatos.items()
+                 if all(cumple_criterio(libro, a, v) for a, v in condiciones)),
+                key=lambda par: par[1]
+            )
+
+        self.ultimo_plan = {
+            'total_libros': total,
+            'pasos': pasos,
+            'recorrido_completo': candidatos is None,
+            'revisados': revisados,
+            'resultados': len(resultados),
+            'tiempo_verificacion': time.perf_counter() - t,
+            'tiempo_total': time.perf_counter() - inicio
+        }
+        return resultados
+
+    def explicar(self, **criterios):
+        """
+        Executes a query and describes the chosen plan with its timings.
+
+        Args:
+            **criterios: Key=value pairs to filter by.
+
+        Returns:
+            str: Readable description of the plan.
+        """
+        self.ejecutar(**criterios)
+        plan = self.ultimo_plan
+        lineas = [f"PLAN DE CONSULTA ({plan['total_libros']} libros)"]
+        for numero, paso in enumerate(plan['pasos'], 1):
+            linea = (f"  {numero}. {paso['atributo']} = {paso['valor']!r}"
+                     f" -> {paso['acceso'] or 'sin índice'}")
+            if paso['acceso'] is not None:
+                linea += f" (estimado: {paso['estimado']}, planificación: {paso['tiempo_plan'] * 1000:.3f} ms)"
+            linea += f" [{paso['uso']}]"
+            if 'reales' in paso:
+                linea += f" {paso['reales']} libros en {paso['tiempo'] * 1000:.3f} ms"
+            lineas.append(linea)
+        origen = "recorrido completo" if plan['recorrido_completo'] else "candidatos"
+        lineas.append(f"  Verificación ({origen}): {plan['revisados']} libros revisados, "
+                      f"{plan['resultados']} resultados en {plan['tiempo_verificacion'] * 1000:.3f} ms")
+        lineas.append(f"  Tiempo total: {plan['tiempo_total'] * 1000:.3f} ms")
+        return "\n".join(lineas)
+
+    def _planificar(self, criterios):
+        """Builds one step per criterion with its access path and estimate."""
+        pasos = []
+        for atributo, valor in criterios.items():
+            t = time.perf_counter()
+            paso = {'atributo': atributo, 'valor': valor, 'acceso': None}
+            ruta = self._ruta_acceso(atributo, valor)
+            if ruta is not None:
+                paso['acceso'], paso['estimado'], paso['obtener'] = ruta
+            paso['tiempo_plan'] = time.perf_counter() - t
+            pasos.append(paso)
+        return pasos
+
+    def _ruta_acceso(self, atributo, valor):
+        """
+        Chooses the index that can answer a criterion.
+
+        Returns:
+            tuple|None: (acceso, estimado, obtener) or None if no index applies.
+        """
+        inventario = self.inventario
+        if atributo == 'isbn':
+            if isinstance(valor, str) and not inventario.busqueda_isbn_exacta(valor):
+                return None
+            libro = inventario.buscar_por_isbn(valor)
+            if libro is None and isinstance(valor, str):
+                # La verificación ignora mayúsculas ('x' == 'X'): se prueba la
+                # forma habitual y, si aún no aparece, se deja al recorrido
+                libro = inventario.buscar_por_isbn(valor.upper())
+                if libro is None and valor.lower() != valor.upper():
+                    return None
+            encontrados = [libro] if libro is not None else []
+            return 'hash ISBN', len(encontrados), lambda: encontrados
+
+        if atributo in ('titulo', 'autor'):
+            # Consultas cortas no tienen trigramas: se verifican en el recorrido
+            if not isinstance(valor, str) or len(plegar_consulta(valor)) < 3:
+                return None
+            buscar = inventario.buscar_por_titulo if atributo == 'titulo' else inventario.buscar_por_autor
+            return 'trigramas', inventario.estimar_por_subcadena(atributo, valor), lambda: buscar(valor)
+
+        if atributo in ('valor', 'peso'):
+            if not isinstance(valor, (int, float)) or math.isnan(valor):
+                return None
+            estimado = inventario.contar_por_rango(atributo, valor, valor)
+            return 'índice ordenado', estimado, lambda: inventario.buscar_por_rango(atributo, valor, valor)
+
+        if atributo in ('genero', 'estante_id'):
+            mapa = inventario.mapa_por_faceta(atributo, lambda valor_faceta: coincide_valor(valor_faceta, valor))
+            return 'bitmap', mapa.bit_count(), lambda: inventario.libros_de_mapa(mapa)
+
+        return None
+
+    def __repr__(self):
+        return f"PlanificadorConsultas(libros={len(self.inventario)})"
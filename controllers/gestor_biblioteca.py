@@ -10,12 +10,15 @@ Responsibilities:
 - Coordinate shelving
 """
 
-from models import Libro, Usuario, Prestamo, Reserva, Estante
+from models import Libro, Usuario, Prestamo, Reserva, Estante, AUTORES
 from controllers.listas.inventario_general import InventarioGeneral
 from controllers.listas.inventario_ordenado import InventarioOrdenado
+from controllers.listas.almacen_columnar import AlmacenColumnar
+from controllers.indices.indice_autores import IndiceAutores
+from controllers.indices.normalizacion import tokenizar
+from controllers.busqueda.planificador import PlanificadorConsultas
 from controllers.estructuras.pila_historial import PilaHistorial
 from controllers.estructuras.cola_reservas import ColaReservas
-from controllers.busqueda.busqueda_binaria import busqueda_binaria_por_isbn
 from datetime import datetime, timedelta
 
 class GestorBiblioteca:
@@ -24,20 +27,38 @@ class GestorBiblioteca:
     
     Implements the Facade pattern to simplify access to subsystems.
     
+    The intern pools of authors, genres and shelves (models.diccionario_valores)
+    are global: every instance shares them and they keep the values of
+    removed books, so they may hold more values than this inventory uses.
+    
     Attributes:
         inventario_general (InventarioGeneral): Unordered list of books.
         inventario_ordenado (InventarioOrdenado): Ordered list of books by ISBN.
+        planificador (PlanificadorConsultas): Query planner over the general inventory.
+        almacen_columnar (AlmacenColumnar): Columnar copy of the books for analytics.
+        indice_autores (IndiceAutores): Books and running aggregates per author.
+        _resumenes (dict): Cached per-group summaries {grupo: resumen}, cleared on every mutation.
         usuarios (dict): Dictionary of users by ID.
         colas_reservas (dict): Reservation queues by ISBN.
         estantes (dict): Dictionary of shelves by ID.
         contador_prestamos (int): Counter to generate loan IDs.
         contador_reservas (int): Counter to generate reservation IDs.
     """
-    def __init__(self):
-        """Initializes the library manager."""
+    def __init__(self, motor_ordenado='lista'):
+        """
+        Initializes the library manager.
+        
+        Args:
+            motor_ordenado (str, optional): Storage engine of the ordered
+                inventory, 'lista' or 'bloques'. Default: 'lista'.
+        """
         # Inventories
         self.inventario_general = InventarioGeneral()
-        self.inventario_ordenado = InventarioOrdenado()
+        self.inventario_ordenado = InventarioOrdenado(motor=motor_ordenado)
+        self.planificador = PlanificadorConsultas(self.inventario_general)
+        self.almacen_columnar = AlmacenColumnar()
+        self.indice_autores = IndiceAutores()
+        self._resumenes = {}
         
         # Usuarios (dict: {id: Usuario})
         self.usuarios = {}
@@ -63,7 +84,13 @@ class GestorBiblioteca:
         
         Returns:
             bool: True if added successfully.
+        
+        Raises:
+            ValueError: If a numeric attribute is not valid (no inventory is modified).
         """
+        # Validar las columnas numéricas antes de tocar ningún inventario
+        self.almacen_columnar.fila_de_libro(libro)
+        
         # Agregar a inventario general
         if not self.inventario_general.agregar_libro(libro):
             return False
@@ -73,11 +100,46 @@ class GestorBiblioteca:
             self.inventario_general.eliminar_libro(libro.isbn)
             return False
         
+        self.almacen_columnar.agregar(libro)
+        self.indice_autores.agregar(libro)
+        self._resumenes.clear()
         return True
     
+    def agregar_libros(self, lista_libros):
+        """
+        Adds multiple books to both inventories (bulk load).
+        
+        The ordered inventory receives the accepted books in a single
+        sorted merge, so a full catalog load costs O(n log n).
+        
+        Args:
+            lista_libros (list): List of Book objects to add.
+        
+        Returns:
+            int: Number of books added.
+        
+        Raises:
+            ValueError: If a numeric attribute of any book is not valid (no
+                inventory is modified).
+        """
+        # Validar todo el lote antes de tocar ningún inventario
+        for libro in lista_libros:
+            self.almacen_columnar.fila_de_libro(libro)
+        
+        # Agregar a inventario general (descarta ISBN repetidos)
+        agregados = [libro for libro in lista_libros if self.inventario_general.agregar_libro(libro)]
+        
+        # Agregar al inventario ordenado en bloque
+        self.inventario_ordenado.agregar_libros(agregados)
+        self.almacen_columnar.agregar_libros(agregados)
+        self.indice_autores.agregar_libros(agregados)
+        if agregados:
+            self._resumenes.clear()
+        return len(agregados)
+    
     def buscar_libro_por_isbn(self, isbn):
         """
-        Search for a book by ISBN in the sorted inventory (binary search).
+        Search for a book by ISBN using the inventory hash index (O(1)).
         
         Args:
             isbn (str): Book ISBN.
@@ -85,35 +147,143 @@ class GestorBiblioteca:
         Returns:
             Libro|None: Found book or None.
         """
-        libro, _ = busqueda_binaria_por_isbn(
-            self.inventario_ordenado.obtener_libros(), 
-            isbn
-        )
-        return libro
+        return self.inventario_ordenado.buscar_por_isbn(isbn)
     
-    def buscar_libros_por_titulo(self, titulo):
+    def buscar_libros_por_titulo(self, titulo, relevancia=False):
         """
-        Search for books by title (linear search).
+        Search for books by title.
+        
+        Single-word queries use the partial (substring) search, e.g. "rquez"
+        or "amor" (which also finds "Amores perros"). Multi-word queries are
+        first resolved with the inverted word index (AND of all words) and
+        the books that only match as a substring (e.g. "Cien Añ") follow.
         
         Args:
-            titulo (str): Title or part of the title.
+            titulo (str): Title, words of the title or part of the title.
+            relevancia (bool, optional): If True, word matches are ranked
+                by BM25. Default: False.
         
         Returns:
             list: List of found books.
         """
-        return self.inventario_general.buscar_por_titulo(titulo)
+        subcadena = self.inventario_general.buscar_por_titulo(titulo)
+        if len(tokenizar(titulo)) < 2:
+            return subcadena
+        libros = self.inventario_general.buscar_por_palabras(titulo, 'titulo', relevancia)
+        return self._unir_resultados(libros, subcadena)
     
-    def buscar_libros_por_autor(self, autor):
+    def buscar_libros_por_autor(self, autor, relevancia=False):
         """
-        Search for books by author (linear search).
+        Search for books by author.
+        
+        Single-word queries use the partial (substring) match over the
+        distinct authors of the author index, which returns their books
+        without scanning the inventory ("borges" also finds "Borgesiano").
+        Multi-word queries are first resolved with the inverted word index
+        (AND of all words) and the substring matches follow.
         
         Args:
-            autor (str): Author or part of the name.
+            autor (str): Author, words of the name or part of the name.
+            relevancia (bool, optional): If True, word matches are ranked
+                by BM25. Default: False.
         
         Returns:
             list: List of found books.
         """
-        return self.inventario_general.buscar_por_autor(autor)
+        subcadena = self.indice_autores.libros_de(autor)
+        if len(tokenizar(autor)) < 2:
+            return subcadena
+        libros = self.inventario_general.buscar_por_palabras(autor, 'autor', relevancia)
+        return self._unir_resultados(libros, subcadena)
+
+    @staticmethod
+    def _unir_resultados(libros, adicionales):
+        """Word matches followed by the additional books not already in them."""
+        vistos = {libro.isbn for libro in libros}
+        return libros + [libro for libro in adicionales if libro.isbn not in vistos]
+    
+    def autocompletar(self, prefijo, campo='titulo', limite=10):
+        """
+        Suggests titles or authors for a partially typed text.
+        
+        Args:
+            prefijo (str): Text typed so far.
+            campo (str, optional): 'titulo' or 'autor'. Default: 'titulo'.
+            limite (int, optional): Maximum number of suggestions. Default: 10.
+        
+        Returns:
+            list: Suggested titles or authors.
+        """
+        return self.inventario_general.autocompletar(prefijo, campo, limite)
+    
+    def buscar_libros_por_rango(self, criterio, minimo=None, maximo=None):
+        """
+        Search for books by a range of value, weight or genre.
+        
+        Args:
+            criterio (str): 'valor', 'peso' or 'genero'.
+            minimo (optional): Lower bound (inclusive). None = no lower bound.
+            maximo (optional): Upper bound (inclusive). None = no upper bound.
+        
+        Returns:
+            list: Books within the range, in ascending order of the criterion.
+        """
+        return self.inventario_general.buscar_por_rango(criterio, minimo, maximo)
+    
+    def buscar_libros_por_genero(self, genero):
+        """
+        Search for all books of a genre (case- and accent-insensitive).
+        
+        Args:
+            genero (str): Genre to search for.
+        
+        Returns:
+            list: Books of the genre.
+        """
+        return self.inventario_general.buscar_por_igualdad('genero', genero)
+    
+    def filtrar_libros(self, **criterios):
+        """
+        Search for books by genre, availability and shelf using the bitmaps.
+        
+        Example: filtrar_libros(genero='Ficción', disponible=True)
+        
+        Args:
+            **criterios: genero=str|list, disponible=bool, estante_id=id|list|None.
+        
+        Returns:
+            list: Books that meet all the criteria.
+        """
+        return self.inventario_general.filtrar_por_facetas(**criterios)
+    
+    def buscar_libros_multiple(self, **criterios):
+        """
+        Search for books that meet several criteria using the query planner.
+        
+        Same semantics as busqueda_multiple: partial case-insensitive
+        matching for strings, equality for other values.
+        
+        Example: buscar_libros_multiple(autor='garcia', genero='ficcion', valor=45000)
+        
+        Args:
+            **criterios: Key=value pairs to filter by.
+        
+        Returns:
+            list: Books that meet all the criteria (order in which they were added).
+        """
+        return [libro for libro, _ in self.planificador.ejecutar(**criterios)]
+    
+    def explicar_busqueda(self, **criterios):
+        """
+        Executes a multiple search and describes the plan chosen by the planner.
+        
+        Args:
+            **criterios: Key=value pairs to filter by.
+        
+        Returns:
+            str: Description of the plan with its timings.
+        """
+        return self.planificador.explicar(**criterios)
     
     def eliminar_libro(self, isbn):
         """
@@ -127,12 +297,122 @@ class GestorBiblioteca:
         """
         result1 = self.inventario_general.eliminar_libro(isbn)
         result2 = self.inventario_ordenado.eliminar_libro(isbn)
+        self.indice_autores.eliminar(isbn)
+        if self.almacen_columnar.eliminar(isbn):
+            self._resumenes.clear()
         return result1 and result2
     
     def obtener_todos_los_libros(self):
-        """Gets all books from the inventory."""
+        """Gets a read-only snapshot of all books (no copy of the catalog)."""
         return self.inventario_general.obtener_libros()
     
+    def _libro_modificado(self, libro):
+        """
+        Propagates a change of stock or shelf of a book to the derived
+        structures (bitmaps, columnar store and author index).
+        
+        Args:
+            libro (Libro): Modified book.
+        """
+        self.inventario_general.actualizar_facetas(libro)
+        self.almacen_columnar.actualizar(libro)
+        self.indice_autores.actualizar(libro)
+        self._resumenes.clear()
+    
+    def totales_inventario(self):
+        """
+        Total value and weight of the inventory (each book times its
+        cantidad_total), as reductions over the columnar store.
+        
+        Returns:
+            tuple: (valor_total, peso_total).
+        """
+        return (self.almacen_columnar.total('valor', ponderado_por='cantidad_total'),
+                self.almacen_columnar.total('peso', ponderado_por='cantidad_total'))
+    
+    def resumen_por(self, grupo='autor'):
+        """
+        Summary of value and weight for every author or genre at once.
+        
+        Computed in a single pass over the columnar store and cached until
+        the next change to the inventory.
+        
+        Args:
+            grupo (str, optional): 'autor' or 'genero'. Default: 'autor'.
+        
+        Returns:
+            dict: {autor|genero: {'cantidad', 'valor_total', 'valor_promedio',
+                'valor_minimo', 'valor_maximo', 'peso_total', ...}}.
+        """
+        resumen = self._resumenes.get(grupo)
+        if resumen is None:
+            resumen = self._resumenes[grupo] = self.almacen_columnar.resumen_por(grupo)
+        return resumen
+    
+    def resumen_autor(self, autor):
+        """
+        Summary of value and weight of the authors that match a partial
+        name, merged from resumen_por('autor') in O(authors).
+        
+        Args:
+            autor (str): Name or part of the name of the author.
+        
+        Returns:
+            dict: {'cantidad', 'valor_total', 'valor_promedio', 'valor_minimo',
+                'valor_maximo', 'peso_total', ...}; minimums and maximums are
+                None if no author matches.
+        """
+        return AlmacenColumnar.combinar_resumen(self.resumen_por('autor'), AUTORES.coincidentes(autor))
+    
+    def analizar_valor_autor(self, autor):
+        """
+        Value analysis of the books of an author from the author index,
+        without scanning the inventory.
+        
+        Args:
+            autor (str): Name or part of the name of the author.
+        
+        Returns:
+            dict: Same keys as analizar_valor_por_autor ('autor',
+                'cantidad_libros', 'valor_total', 'valor_promedio', 'libros',
+                'valor_menor', 'libro_menor').
+        """
+        estadisticas = self.indice_autores.estadisticas(autor)
+        cantidad = estadisticas['cantidad']
+        libro_menor = self.indice_autores.menor_valor()
+        return {
+            'autor': autor,
+            'cantidad_libros': cantidad,
+            'valor_total': estadisticas['valor_total'],
+            'valor_promedio': estadisticas['valor_total'] / cantidad if cantidad > 0 else 0,
+            'libros': self.indice_autores.libros_de(autor),
+            'valor_menor': libro_menor.valor if libro_menor else 0,
+            'libro_menor': libro_menor
+        }
+    
+    def estadisticas_peso_autor(self, autor):
+        """
+        Weight statistics of the books of an author from the author index (O(1) per author).
+        
+        Args:
+            autor (str): Name or part of the name of the author.
+        
+        Returns:
+            dict: Same keys as calcular_estadisticas_peso ('autor',
+                'cantidad_libros', 'peso_total', 'peso_promedio',
+                'peso_minimo', 'peso_maximo').
+        """
+        estadisticas = self.indice_autores.estadisticas(autor)
+        cantidad = estadisticas['cantidad']
+        return {
+            'autor': autor,
+            'cantidad_libros': cantidad,
+            'peso_total': estadisticas['peso_total'],
+            'peso_promedio': estadisticas['peso_total'] / cantidad if cantidad > 0 else 0.0,
+            'peso_minimo': estadisticas['peso_minimo'].peso if cantidad > 0 else 0.0,
+            'peso_maximo': max(0.0, estadisticas['peso_maximo'].peso) if cantidad > 0 else 0.0
+        }
+    
     # Gestión de Usuarios
 
     def agregar_usuario(self, usuario):
@@ -214,6 +494,7 @@ class GestorBiblioteca:
         
         # Reducir stock
         libro.cantidad_disponible -= 1
+        self._libro_modificado(libro)
         
         # Crear préstamo
         prestamo_id = f"P{self.contador_prestamos:04d}"
@@ -239,7 +520,7 @@ class GestorBiblioteca:
         """
         Process the return of a book.
         
-        CRITICAL FLOW: Checks pending reservations using binary search.
+        CRITICAL FLOW: Checks pending reservations after an O(1) ISBN lookup.
         
         Args:
             usuario_id (str): User ID.
@@ -262,13 +543,10 @@ class GestorBiblioteca:
         prestamo.estado = "devuelto"
         prestamo.fecha_devolucion_real = datetime.now()
         
-        # Buscar libro en inventario ordenado (BÚSQUEDA BINARIA - CRÍTICO)
-        libro, indice = busqueda_binaria_por_isbn(
-            self.inventario_ordenado.obtener_libros(),
-            isbn
-        )
+        # Buscar libro en el índice hash del inventario (CRÍTICO)
+        libro = self.buscar_libro_por_isbn(isbn)
         
-        if indice == -1:
+        if libro is None:
             return False, "Error: Libro no encontrado en inventario"
         
         # FLUJO CRÍTICO: Verificar reservas pendientes
@@ -288,6 +566,7 @@ class GestorBiblioteca:
         
         # No hay reservas: incrementar stock disponible
         libro.cantidad_disponible += 1
+        self._libro_modificado(libro)
         
         return True, "Libro devuelto exitosamente"
     
@@ -424,6 +703,7 @@ class GestorBiblioteca:
         estante.libros_asignados.append(isbn)
         estante.peso_actual += libro.peso
         libro.estante_id = estante_id
+        self._libro_modificado(libro)
         
         return True, "Libro asignado al estante exitosamente"
     
@@ -455,10 +735,18 @@ class GestorBiblioteca:
             for cola in self.colas_reservas.values()
         )
         
+        # Conteos por faceta (bitmaps, sin recorrer el inventario)
+        disponibilidad = self.inventario_general.contar_por_faceta('disponible')
+        por_estante = self.inventario_general.contar_por_faceta('estante_id')
+        
         return {
             'total_libros': total_libros,
             'total_usuarios': total_usuarios,
             'prestamos_activos': prestamos_activos,
             'total_reservas': total_reservas,
-            'total_estantes': len(self.estantes)
+            'total_estantes': len(self.estantes),
+            'libros_disponibles': disponibilidad.get(True, 0),
+            'libros_agotados': disponibilidad.get(False, 0),
+            'libros_sin_estante': por_estante.get(None, 0),
+            'libros_por_genero': self.inventario_general.contar_por_faceta('genero')
         }
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+This package contains the search indexes maintained by the inventories:
+
+- Inverted Index (Índice Invertido): Word search on titles and authors
+- Trigram Index (Índice de Trigramas): Substring search on titles and authors
+- Prefix Index (Índice de Prefijos): Autocomplete of titles and authors
+- Sorted Index (Índice Ordenado): Range queries on value, weight and genre
+- Bitmap Index (Índice Bitmap): Filters and counts by genre, availability and shelf
+- Author Index (Índice de Autores): Books and running aggregates per author
+
+Use:
+    from controllers.indices import IndiceInvertido
+    
+    indice = IndiceInvertido()
+    indice.agregar(libro.isbn, libro.titulo)
+    isbns = indice.buscar("cien soledad", relevancia=True)
+    
+    trigramas = IndiceTrigramas()
+    trigramas.agregar(libro.isbn, libro.autor)
+    isbns = trigramas.buscar("rquez")
+    
+    prefijos = IndicePrefijos()
+    prefijos.agregar(libro.isbn, libro.autor)
+    sugerencias = prefijos.completar("marq", limite=5)
+    
+    por_valor = IndiceOrdenado('valor')
+    por_valor.agregar(libro)
+    libros = por_valor.buscar_rango(20000, 50000)
+    
+    facetas = IndiceBitmap(('genero', 'disponible'))
+    facetas.actualizar(libro.isbn, {'genero': libro.genero, 'disponible': True})
+    isbns = facetas.identificadores(facetas.filtrar(genero='Ficción', disponible=True))
+    
+    por_autor = IndiceAutores()
+    por_autor.agregar(libro)
+    estadisticas = por_autor.estadisticas("garcia")
+"""
+
+from .normalizacion import normalizar_texto, tokenizar
+from .indice_invertido import IndiceInvertido
+from .indice_trigramas import IndiceTrigramas
+from .indice_prefijos import IndicePrefijos
+from .indice_ordenado import IndiceOrdenado
+from .indice_bitmap import IndiceBitmap
+from .indice_autores import IndiceAutores
+
+__all__ = [
+    # Normalización
+    'normalizar_texto',
+    'tokenizar',
+    
+    # Índices
+    'IndiceInvertido',
+    'IndiceTrigramas',
+    'IndicePrefijos',
+    'IndiceOrdenado',
+    'IndiceBitmap',
+    'IndiceAutores'
+]
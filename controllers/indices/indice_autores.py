@@ -0,0 +1,302 @@
+"""
+This structure is used to answer per-author questions (books, totals,
+averages, lightest/heaviest and cheapest/most expensive book) without
+scanning the inventory.
+
+Every author keeps its books in inventory order together with running
+aggregates of Value, Weight and available copies, and four heaps with the
+minimum and maximum of Value and Weight. The aggregates are updated on every
+add, remove and stock change:
+
+    - Additions extend the running sums in inventory order, so the totals are
+      exactly the ones a forward scan would compute.
+    - Removals only mark the sums of the author as stale; they are recomputed
+      over its k books on the next query (no floating-point drift).
+    - Removed books are discarded from the heaps lazily, when they reach the top.
+
+A global heap keeps the minimum-value book of the whole inventory (the first
+one added among ties, like a scan).
+
+Time Complexity:
+    - Add a book: O(log k)
+    - Remove a book / stock change: O(1)
+    - Statistics of an author: O(1) (O(k) after a removal), plus O(d) to
+      resolve a partial query over d distinct authors
+    - Books of an author: O(k)
+"""
+
+from heapq import heapify, heappop, heappush, merge
+from models.diccionario_valores import AUTORES
+
+class EntradaAutor:
+    """
+    Books and running aggregates of one author.
+
+    Attributes:
+        libros (dict): Books of the author in inventory order {isbn: Libro}.
+        valor_total (float): Sum of the values.
+        peso_total (float): Sum of the weights.
+        disponibles (int): Sum of the available copies.
+        sumas_validas (bool): False if a removal left the sums stale.
+        extremos (dict): Heaps of (clave, secuencia, isbn) per statistic
+            {'valor_minimo', 'valor_maximo', 'peso_minimo', 'peso_maximo'};
+            maximums store the negated key.
+    """
+    __slots__ = ('libros', 'valor_total', 'peso_total', 'disponibles', 'sumas_validas', 'extremos')
+
+    # Estadística -> (atributo, signo de la clave en el montículo)
+    EXTREMOS = {
+        'valor_minimo': ('valor', 1),
+        'valor_maximo': ('valor', -1),
+        'peso_minimo': ('peso', 1),
+        'peso_maximo': ('peso', -1)
+    }
+
+    def __init__(self):
+        self.libros = {}
+        self.valor_total = 0.0
+        self.peso_total = 0.0
+        self.disponibles = 0
+        self.sumas_validas = True
+        self.extremos = {nombre: [] for nombre in self.EXTREMOS}
+
+    def __repr__(self):
+        return f"EntradaAutor(libros={len(self.libros)})"
+
+class IndiceAutores:
+    """
+    Materialized author -> books index with incrementally maintained aggregates.
+
+    Attributes:
+        _entradas (dict): Entry of each author {autor: EntradaAutor}.
+        _registro (dict): Indexed state of each book {isbn: (autor, secuencia, libro, disponibles)}.
+        _menores (list): Global heap of (valor, secuencia, isbn) for the minimum-value book.
+        _secuencia (int): Insertion counter (keeps the inventory order).
+    """
+
+    # Entradas eliminadas toleradas en un montículo antes de reconstruirlo
+    MINIMO_COMPACTACION = 64
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self.limpiar()
+
+    def agregar(self, libro):
+        """
+        Adds a book to the entry of its author.
+
+        Args:
+            libro (Libro): Book to add.
+
+        Returns:
+            bool: True if added, False if the ISBN is already indexed.
+        """
+        if libro.isbn in self._registro:
+            return False
+        secuencia = self._secuencia
+        self._secuencia += 1
+        entrada = self._entradas.get(libro.autor)
+        if entrada is None:
+            entrada = self._entradas[libro.autor] = EntradaAutor()
+        self._registro[libro.isbn] = (libro.autor, secuencia, libro, libro.cantidad_disponible)
+
+        entrada.libros[libro.isbn] = libro
+        if entrada.sumas_validas:
+            entrada.valor_total += libro.valor
+            entrada.peso_total += libro.peso
+        entrada.disponibles += libro.cantidad_disponible
+        for nombre, (atributo, signo) in EntradaAutor.EXTREMOS.items():
+            heappush(entrada.extremos[nombre], (signo * getattr(libro, atributo), secuencia, libro.isbn))
+        heappush(self._menores, (libro.valor, secuencia, libro.isbn))
+        return True
+
+    def agregar_libros(self, libros):
+        """
+        Adds several books.
+
+        Args:
+            libros (iterable): Books to add.
+
+        Returns:
+            int: Number of books added.
+        """
+        agregados = 0
+        for libro in libros:
+            if self.agregar(libro):
+                agregados += 1
+        return agregados
+
+    def eliminar(self, isbn):
+        """
+        Removes a book from the entry of its author.
+
+        Args:
+            isbn (str): ISBN of the book.
+
+        Returns:
+            bool: True if removed, False if not indexed.
+        """
+        registro = self._registro.pop(isbn, None)
+        if registro is None:
+            return False
+        autor, _, _, disponibles = registro
+        entrada = self._entradas[autor]
+        del entrada.libros[isbn]
+        entrada.disponibles -= disponibles
+        if not entrada.libros:
+            del self._entradas[autor]
+        else:
+            # Las sumas se recalculan en la siguiente consulta (sin restas acumuladas)
+            entrada.sumas_validas = False
+            if len(entrada.extremos['valor_minimo']) > 2 * len(entrada.libros) + self.MINIMO_COMPACTACION:
+                self._reconstruir_extremos(entrada)
+        if len(self._menores) > 2 * len(self._registro) + self.MINIMO_COMPACTACION:
+            self._menores = [tope for tope in self._menores if self._vigente(tope, self._registro)]
+            heapify(self._menores)
+        return True
+
+    def actualizar(self, libro):
+        """
+        Propagates a change of stock of a book.
+
+        Args:
+            libro (Libro): Modified book.
+
+        Returns:
+            bool: True if the book is indexed.
+        """
+        registro = self._registro.get(libro.isbn)
+        if registro is None:
+            return False
+        autor, secuencia, _, disponibles = registro
+        if libro.cantidad_disponible != disponibles:
+            self._entradas[autor].disponibles += libro.cantidad_disponible - disponibles
+            self._registro[libro.isbn] = (autor, secuencia, libro, libro.cantidad_disponible)
+        return True
+
+    def limpiar(self):
+        """Removes all books from the index."""
+        self._entradas = {}
+        self._registro = {}
+        self._menores = []
+        self._secuencia = 0
+
+    def autores_coincidentes(self, consulta):
+        """
+        Obtains the indexed authors whose name contains the query
+        (partial, case- and accent-insensitive).
+
+        Args:
+            consulta (str): Name or part of the name of the author.
+
+        Returns:
+            list: Matching authors that have books.
+        """
+        coincidentes = AUTORES.coincidentes(consulta)
+        # El pool es global y nunca olvida autores: se recorre el lado más pequeño
+        if len(self._entradas) < len(coincidentes):
+            return [autor for autor in self._entradas if autor in coincidentes]
+        return [autor for autor in coincidentes if autor in self._entradas]
+
+    def libros_de(self, consulta):
+        """
+        Obtains the books of the matching authors in inventory order.
+
+        Args:
+            consulta (str): Name or part of the name of the author.
+
+        Returns:
+            list: Books of the matching authors.
+        """
+        entradas = [self._entradas[autor] for autor in self.autores_coincidentes(consulta)]
+        if len(entradas) == 1:
+            return list(entradas[0].libros.values())
+        # Cada autor ya está en orden de inventario: mezcla por secuencia
+        return list(merge(*(entrada.libros.values() for entrada in entradas),
+                          key=lambda libro: self._registro[libro.isbn][1]))
+
+    def estadisticas(self, consulta):
+        """
+        Aggregates of the matching authors.
+
+        Args:
+            consulta (str): Name or part of the name of the author.
+
+        Returns:
+            dict: {'cantidad', 'valor_total', 'peso_total', 'disponibles',
+                'valor_minimo', 'valor_maximo', 'peso_minimo', 'peso_maximo',
+                'autores'} where the minimums and maximums are books
+                (None if there are no books).
+        """
+        resultado = {
+            'cantidad': 0, 'valor_total': 0.0, 'peso_total': 0.0, 'disponibles': 0,
+            'valor_minimo': None, 'valor_maximo': None, 'peso_minimo': None, 'peso_maximo': None,
+            'autores': self.autores_coincidentes(consulta)
+        }
+        extremos = dict.fromkeys(EntradaAutor.EXTREMOS)
+        for autor in resultado['autores']:
+            entrada = self._entradas[autor]
+            self._validar_sumas(entrada)
+            resultado['cantidad'] += len(entrada.libros)
+            resultado['valor_total'] += entrada.valor_total
+            resultado['peso_total'] += entrada.peso_total
+            resultado['disponibles'] += entrada.disponibles
+            for nombre, monticulo in entrada.extremos.items():
+                tope = self._tope(monticulo, entrada.libros)
+                if extremos[nombre] is None or tope < extremos[nombre]:
+                    extremos[nombre] = tope
+        for nombre, tope in extremos.items():
+            if tope is not None:
+                resultado[nombre] = self._registro[tope[2]][2]
+        return resultado
+
+    def menor_valor(self):
+        """
+        Obtains the minimum-value book of the whole inventory.
+
+        Returns:
+            Libro|None: First book added among those with the lowest value.
+        """
+        tope = self._tope(self._menores, self._registro)
+        return None if tope is None else self._registro[tope[2]][2]
+
+    def _vigente(self, tope, libros):
+        """True if a heap entry still belongs to an indexed book (same insertion)."""
+        registro = self._registro.get(tope[2])
+        return tope[2] in libros and registro is not None and registro[1] == tope[1]
+
+    def _tope(self, monticulo, libros):
+        """Top of a heap after discarding the books no longer indexed (lazy deletion)."""
+        while monticulo:
+            if self._vigente(monticulo[0], libros):
+                return monticulo[0]
+            heappop(monticulo)
+        return None
+
+    def _reconstruir_extremos(self, entrada):
+        """Rebuilds the heaps of an author with only its current books."""
+        for nombre, monticulo in entrada.extremos.items():
+            vigentes = [tope for tope in monticulo if self._vigente(tope, entrada.libros)]
+            heapify(vigentes)
+            entrada.extremos[nombre] = vigentes
+
+    @staticmethod
+    def _validar_sumas(entrada):
+        """Recomputes the sums of an author after a removal, in inventory order."""
+        if entrada.sumas_validas:
+            return
+        entrada.valor_total = 0.0
+        entrada.peso_total = 0.0
+        for libro in entrada.libros.values():
+            entrada.valor_total += libro.valor
+            entrada.peso_total += libro.peso
+        entrada.sumas_validas = True
+
+    def __contains__(self, isbn):
+        return isbn in self._registro
+
+    def __len__(self):
+        return len(self._registro)
+
+    def __repr__(self):
+        return f"IndiceAutores(autores={len(self._entradas)}, libros={len(self._registro)})"
@@ -0,0 +1,286 @@
+"""
+This structure is used to filter and count books by low-cardinality
+attributes (Genre, Availability, Shelf) without scanning the inventory.
+
+Every book receives a bit position, and every distinct value of a facet
+keeps a bitset (bit i = 1 if the book in position i has that value). The
+bitsets are stored as mutable bytearrays, so setting or clearing a bit is
+O(1); filters convert them to Python integers and combine them with bitwise
+AND/OR. The number of documents per value is kept as a counter.
+
+Removed positions are left empty until the owner renumbers the index
+(renumerar), which packs the live documents into consecutive positions.
+
+Time Complexity:
+    - Add / update / remove a book: O(f) where f = number of facets
+    - Renumber: O(n · f)
+    - Filter: O(v · n/8) where v = number of bitsets combined (C-level bit operations)
+    - Count per value: O(1)
+"""
+
+class IndiceBitmap:
+    """
+    Bitmap index over several facets that share the same bit positions.
+
+    Positions are assigned in insertion order, so the results keep the order
+    in which the books were added. Removed positions are only reused after
+    renumerar(), which receives the documents in their new order.
+
+    Attributes:
+        facetas (tuple): Names of the indexed facets.
+        _posiciones (dict): Bit position of each identifier {id: posicion}.
+        _identificadores (list): Identifier of each position (None if removed).
+        _valores (dict): Current value of each identifier per facet {id: {faceta: valor}}.
+        _mapas (dict): Bitsets per facet and value {faceta: {valor: bytearray}}.
+        _conteos (dict): Documents per facet and value {faceta: {valor: int}}.
+        _todos (bytearray): Bitset with all the live positions.
+    """
+
+    def __init__(self, facetas):
+        """
+        Initializes an empty index.
+
+        Args:
+            facetas (iterable): Names of the facets to index.
+        """
+        self.facetas = tuple(facetas)
+        self._posiciones = {}
+        self._identificadores = []
+        self._valores = {}
+        self._mapas = {faceta: {} for faceta in self.facetas}
+        self._conteos = {faceta: {} for faceta in self.facetas}
+        self._todos = bytearray()
+
+    def actualizar(self, identificador, valores):
+        """
+        Adds a document or updates the values of its facets.
+
+        Only the facets whose value changed are touched.
+
+        Args:
+            identificador (str): Identifier of the document (e.g. ISBN).
+            valores (dict): Value of each facet {faceta: valor}.
+
+        Raises:
+            ValueError: If a facet is not indexed.
+        """
+        posicion = self._posiciones.get(identificador)
+        if posicion is None:
+            posicion = len(self._identificadores)
+            self._posiciones[identificador] = posicion
+            self._identificadores.append(identificador)
+            self._valores[identificador] = {}
+            self._poner_bit(self._todos, posicion)
+        actuales = self._valores[identificador]
+
+        for faceta, valor in valores.items():
+            if faceta not in self._mapas:
+                raise ValueError(f"Faceta no indexada: {faceta}")
+            if faceta in actuales:
+                if actuales[faceta] == valor:
+                    continue
+                self._quitar(faceta, actuales[faceta], posicion)
+            mapa = self._mapas[faceta].get(valor)
+            if mapa is None:
+                mapa = self._mapas[faceta][valor] = bytearray()
+            self._poner_bit(mapa, posicion)
+            conteos = self._conteos[faceta]
+            conteos[valor] = conteos.get(valor, 0) + 1
+            actuales[faceta] = valor
+
+    def eliminar(self, identificador):
+        """
+        Removes a document from all the facets.
+
+        Args:
+            identificador (str): Identifier of the document.
+
+        Returns:
+            bool: True if it was removed, False if it was not indexed.
+        """
+        posicion = self._posiciones.pop(identificador, None)
+        if posicion is None:
+            return False
+        for faceta, valor in self._valores.pop(identificador).items():
+            self._quitar(faceta, valor, posicion)
+        self._identificadores[posicion] = None
+        self._quitar_bit(self._todos, posicion)
+        return True
+
+    def renumerar(self, identificadores):
+        """
+        Reassigns consecutive bit positions following a new order of the documents.
+
+        The bitsets are rebuilt without the removed positions, so bit i
+        becomes the i-th identifier received.
+
+        Args:
+            identificadores (iterable): All the indexed identifiers, in the new order.
+
+        Raises:
+            ValueError: If the identifiers are not exactly the indexed documents.
+        """
+        identificadores = list(identificadores)
+        if len(identificadores) != len(self._posiciones) or not self._posiciones.keys() >= set(identificadores):
+            raise ValueError("Los identificadores no coinciden con los documentos indexados")
+        tamano = (len(identificadores) + 7) >> 3
+        mapas = {
+            faceta: {valor: bytearray(tamano) for valor in mapas_faceta}
+            for faceta, mapas_faceta in self._mapas.items()
+        }
+        for posicion, identificador in enumerate(identificadores):
+            byte, bit = posicion >> 3, 1 << (posicion & 7)
+            for faceta, valor in self._valores[identificador].items():
+                mapas[faceta][valor][byte] |= bit
+        self._mapas = mapas
+        self._posiciones = {identificador: i for i, identificador in enumerate(identificadores)}
+        self._identificadores = identificadores
+        self._todos = bytearray(((1 << len(identificadores)) - 1).to_bytes(tamano, 'little'))
+
+    def limpiar(self):
+        """Removes all documents from the index."""
+        self._posiciones.clear()
+        self._identificadores.clear()
+        self._valores.clear()
+        self._mapas = {faceta: {} for faceta in self.facetas}
+        self._conteos = {faceta: {} for faceta in self.facetas}
+        self._todos = bytearray()
+
+    def mapa(self, faceta, valor):
+        """
+        Obtains the bitset of a facet value.
+
+        Args:
+            faceta (str): Facet name.
+            valor: Value of the facet.
+
+        Returns:
+            int: Bitset of the documents with that value (0 if none).
+        """
+        return int.from_bytes(self._mapas[faceta].get(valor, b''), 'little')
+
+    def mapa_cualquiera(self, faceta, valores):
+        """
+        Obtains the union (OR) of the bitsets of several values of a facet.
+
+        Args:
+            faceta (str): Facet name.
+            valores (iterable): Accepted values.
+
+        Returns:
+            int: Bitset of the documents with any of the values.
+        """
+        resultado = 0
+        for valor in valores:
+            resultado |= self.mapa(faceta, valor)
+        return resultado
+
+    def filtrar(self, **criterios):
+        """
+        Combines facet filters with AND (a list or set of values means OR).
+
+        Example: filtrar(genero=['Ficción', 'Novela'], disponible=True)
+
+        Args:
+            **criterios: Pairs faceta=valor or faceta=[valores].
+
+        Returns:
+            int: Bitset of the documents that meet all the criteria.
+        """
+        resultado = int.from_bytes(self._todos, 'little')
+        for faceta, valor in criterios.items():
+            if faceta not in self._mapas:
+                raise ValueError(f"Faceta no indexada: {faceta}")
+            if isinstance(valor, (list, tuple, set, frozenset)):
+                resultado &= self.mapa_cualquiera(faceta, valor)
+            else:
+                resultado &= self.mapa(faceta, valor)
+            if not resultado:
+                break
+        return resultado
+
+    def identificadores(self, mapa):
+        """
+        Converts a bitset into the list of identifiers (insertion order).
+
+        Args:
+            mapa (int): Bitset obtained from this index.
+
+        Returns:
+            list: Identifiers of the set bits.
+        """
+        # Los bits se recorren sobre la representación binaria invertida
+        # (una sola conversión O(n) en lugar de un desplazamiento por bit)
+        bits = bin(mapa)[:1:-1]
+        resultado = []
+        posicion = bits.find('1')
+        while posicion != -1:
+            resultado.append(self._identificadores[posicion])
+            posicion = bits.find('1', posicion + 1)
+        return resultado
+
+    def valores(self, faceta):
+        """
+        Obtains the distinct values currently present in a facet.
+
+        Args:
+            faceta (str): Facet name.
+
+        Returns:
+            list: Values with at least one document.
+        """
+        return list(self._mapas[faceta])
+
+    def conteos(self, faceta):
+        """
+        Counts the documents of each value of a facet.
+
+        Args:
+            faceta (str): Facet name.
+
+        Returns:
+            dict: {valor: cantidad} for the values with at least one document.
+        """
+        return dict(self._conteos[faceta])
+
+    def contar(self, faceta, valor):
+        """
+        Counts the documents with a facet value in O(1).
+
+        Args:
+            faceta (str): Facet name.
+            valor: Value of the facet.
+
+        Returns:
+            int: Number of documents with that value.
+        """
+        return self._conteos[faceta].get(valor, 0)
+
+    def _quitar(self, faceta, valor, posicion):
+        """Clears the bit of a value, dropping the value when it becomes empty."""
+        conteos = self._conteos[faceta]
+        conteos[valor] -= 1
+        if conteos[valor]:
+            self._quitar_bit(self._mapas[faceta][valor], posicion)
+        else:
+            del conteos[valor]
+            del self._mapas[faceta][valor]
+
+    @staticmethod
+    def _poner_bit(mapa, posicion):
+        """Sets a bit of a bytearray bitset, growing it if needed."""
+        byte = posicion >> 3
+        if byte >= len(mapa):
+            mapa.extend(bytes(byte - len(mapa) + 1))
+        mapa[byte] |= 1 << (posicion & 7)
+
+    @staticmethod
+    def _quitar_bit(mapa, posicion):
+        """Clears a bit of a bytearray bitset."""
+        mapa[posicion >> 3] &= ~(1 << (posicion & 7)) & 0xFF
+
+    def __len__(self):
+        return len(self._posiciones)
+
+    def __repr__(self):
+        return f"IndiceBitmap(facetas={self.facetas}, documentos={len(self._posiciones)})"
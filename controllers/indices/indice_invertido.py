@@ -0,0 +1,158 @@
+"""
+This structure is used to search books by the words of their Title or Author.
+It maps every normalized word (token) to the documents that contain it
+(posting lists), so a query only touches the books that share its words.
+
+Multi-word queries are resolved as an AND (intersection of posting lists),
+optionally ranked by relevance with BM25.
+
+Time Complexity:
+    - Add / remove a document: O(t) where t = number of tokens of the text
+    - AND query: O(q + min posting) lookups, independent of the catalog size
+"""
+
+from math import log
+from controllers.indices.normalizacion import tokenizar
+
+class IndiceInvertido:
+    """
+    Inverted index from normalized word tokens to document identifiers.
+
+    Attributes:
+        _postings (dict): {token: {id_documento: frecuencia}}. Each posting keeps
+            the insertion order of the documents.
+        _terminos (dict): {id_documento: {token: frecuencia}} used for removals.
+        _longitudes (dict): {id_documento: number of tokens}.
+        _longitud_total (int): Sum of all document lengths (for BM25).
+    """
+
+    # Parámetros de BM25
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._postings = {}
+        self._terminos = {}
+        self._longitudes = {}
+        self._longitud_total = 0
+
+    def agregar(self, id_documento, texto):
+        """
+        Indexes a document. If it was already indexed it is replaced.
+
+        Args:
+            id_documento: Document identifier (e.g. the ISBN).
+            texto (str): Text to index.
+        """
+        if id_documento in self._terminos:
+            self.eliminar(id_documento)
+        tokens = tokenizar(texto)
+        frecuencias = {}
+        for token in tokens:
+            frecuencias[token] = frecuencias.get(token, 0) + 1
+        for token, frecuencia in frecuencias.items():
+            self._postings.setdefault(token, {})[id_documento] = frecuencia
+        self._terminos[id_documento] = frecuencias
+        self._longitudes[id_documento] = len(tokens)
+        self._longitud_total += len(tokens)
+
+    def eliminar(self, id_documento):
+        """
+        Removes a document from the index.
+
+        Args:
+            id_documento: Document identifier.
+
+        Returns:
+            bool: True if the document was indexed, False otherwise.
+        """
+        frecuencias = self._terminos.pop(id_documento, None)
+        if frecuencias is None:
+            return False
+        for token in frecuencias:
+            posting = self._postings[token]
+            del posting[id_documento]
+            if not posting:
+                del self._postings[token]
+        self._longitud_total -= self._longitudes.pop(id_documento)
+        return True
+
+    def limpiar(self):
+        """Removes all documents from the index."""
+        self._postings.clear()
+        self._terminos.clear()
+        self._longitudes.clear()
+        self._longitud_total = 0
+
+    def buscar(self, consulta, relevancia=False):
+        """
+        Searches the documents that contain ALL the words of the query.
+
+        Args:
+            consulta (str): One or more words.
+            relevancia (bool, optional): If True, results are ranked by BM25
+                score (highest first). Default: False (insertion order).
+
+        Returns:
+            list: Identifiers of the matching documents.
+        """
+        tokens = list(dict.fromkeys(tokenizar(consulta)))
+        if not tokens:
+            return []
+        postings = []
+        for token in tokens:
+            posting = self._postings.get(token)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # Intersección: recorrer la lista más corta y verificar en las demás
+        postings.sort(key=len)
+        menor, resto = postings[0], postings[1:]
+        resultados = [id_doc for id_doc in menor if all(id_doc in posting for posting in resto)]
+
+        if relevancia:
+            puntajes = {id_doc: self._puntaje_bm25(id_doc, tokens) for id_doc in resultados}
+            resultados.sort(key=puntajes.__getitem__, reverse=True)
+        return resultados
+
+    def _puntaje_bm25(self, id_documento, tokens):
+        """
+        Computes the BM25 relevance score of a document for the query tokens.
+
+        Args:
+            id_documento: Document identifier.
+            tokens (list): Normalized query tokens.
+
+        Returns:
+            float: BM25 score.
+        """
+        total_documentos = len(self._longitudes)
+        longitud_media = self._longitud_total / total_documentos if total_documentos else 0
+        longitud = self._longitudes[id_documento]
+        puntaje = 0.0
+        for token in tokens:
+            posting = self._postings.get(token, {})
+            frecuencia = posting.get(id_documento, 0)
+            if frecuencia == 0:
+                continue
+            idf = log(1 + (total_documentos - len(posting) + 0.5) / (len(posting) + 0.5))
+            normalizacion = self.K1 * (1 - self.B + self.B * longitud / longitud_media) if longitud_media else self.K1
+            puntaje += idf * frecuencia * (self.K1 + 1) / (frecuencia + normalizacion)
+        return puntaje
+
+    def cantidad_terminos(self):
+        """
+        Obtains the number of distinct tokens in the index.
+
+        Returns:
+            int: Vocabulary size.
+        """
+        return len(self._postings)
+
+    def __len__(self):
+        return len(self._terminos)
+
+    def __repr__(self):
+        return f"IndiceInvertido(documentos={len(self._terminos)}, terminos={len(self._postings)})"
@@ -0,0 +1,128 @@
+"""
+This structure is used to answer range and equality queries on a book
+attribute (Value, Weight, Genre) without scanning or re-sorting the inventory.
+
+It maintains the books sorted by (attribute, ISBN) in a ListaOrdenadaBloques,
+and the queries use the binary search algorithms of the system
+(first/last occurrence and range bounds).
+
+Time Complexity:
+    - Add / remove a book: O(log b + m) (~O(√n) element moves)
+    - Range or equality query: O(log n + k) where k = number of results
+"""
+
+from controllers.busqueda.busqueda_binaria import (
+    encontrar_primera_ocurrencia,
+    encontrar_ultima_ocurrencia,
+    encontrar_limite_inferior,
+    encontrar_limite_superior,
+    busqueda_binaria_por_rango
+)
+from controllers.listas.lista_bloques import ListaOrdenadaBloques
+
+class IndiceOrdenado:
+    """
+    Secondary index that keeps books sorted by one attribute.
+
+    Attributes:
+        criterio (str): Attribute the books are sorted by.
+        _libros (ListaOrdenadaBloques): Books sorted by (criterio, isbn).
+    """
+
+    def __init__(self, criterio):
+        """
+        Initializes an empty index.
+
+        Args:
+            criterio (str): Attribute to sort by (e.g. 'valor', 'peso', 'genero_plegado').
+        """
+        self.criterio = criterio
+        self._libros = ListaOrdenadaBloques(clave=self._clave)
+
+    def _clave(self, libro):
+        """Sort key: the attribute, with the ISBN to break ties."""
+        return (getattr(libro, self.criterio), libro.isbn)
+
+    def agregar(self, libro):
+        """
+        Adds a book to the index.
+
+        Args:
+            libro (Libro): Book to add.
+        """
+        self._libros.agregar(libro)
+
+    def eliminar(self, libro):
+        """
+        Removes a book from the index.
+
+        Args:
+            libro (Libro): Book to remove (its attribute must not have changed).
+
+        Returns:
+            bool: True if the book was removed, False if not found.
+        """
+        return self._libros.eliminar(self._clave(libro))
+
+    def limpiar(self):
+        """Removes all books from the index."""
+        self._libros.clear()
+
+    def buscar_rango(self, minimo=None, maximo=None):
+        """
+        Obtains the books whose attribute is within [minimo, maximo].
+
+        Args:
+            minimo (optional): Lower bound (inclusive). None = no lower bound.
+            maximo (optional): Upper bound (inclusive). None = no upper bound.
+
+        Returns:
+            list: Books in ascending order of the attribute.
+        """
+        return busqueda_binaria_por_rango(self._libros, self.criterio, minimo, maximo)
+
+    def buscar_igual(self, valor):
+        """
+        Obtains all books whose attribute equals the value (equal range).
+
+        Args:
+            valor: Value to search for.
+
+        Returns:
+            list: Books with that value, ordered by ISBN.
+        """
+        _, primero = encontrar_primera_ocurrencia(self._libros, valor, self.criterio)
+        if primero == -1:
+            return []
+        _, ultimo = encontrar_ultima_ocurrencia(self._libros, valor, self.criterio)
+        return self._libros[primero:ultimo + 1]
+
+    def contar_rango(self, minimo=None, maximo=None):
+        """
+        Counts the books within [minimo, maximo] in O(log n) (without building the list).
+
+        Args:
+            minimo (optional): Lower bound (inclusive). None = no lower bound.
+            maximo (optional): Upper bound (inclusive). None = no upper bound.
+
+        Returns:
+            int: Number of books within the range.
+        """
+        inicio = 0 if minimo is None else encontrar_limite_inferior(self._libros, minimo, self.criterio)
+        fin = len(self._libros) - 1 if maximo is None else encontrar_limite_superior(self._libros, maximo, self.criterio)
+        return max(0, fin - inicio + 1)
+
+    def obtener_ordenados(self):
+        """
+        Obtains all books sorted by the attribute.
+
+        Returns:
+            ListaOrdenadaBloques: Read-only sorted sequence of books.
+        """
+        return self._libros
+
+    def __len__(self):
+        return len(self._libros)
+
+    def __repr__(self):
+        return f"IndiceOrdenado(criterio={self.criterio!r}, libros={len(self._libros)})"
@@ -0,0 +1,106 @@
+"""
+This structure is used to autocomplete Titles and Authors while the user types.
+
+It keeps the folded texts in a sorted container (ListaOrdenadaBloques), so all
+the texts that start with a prefix are contiguous: the first one is found with
+binary search and the completions are read in order from there. Besides the
+full text, every word start is indexed ("marq" completes "Gabriel García Márquez").
+
+Time Complexity:
+    - Add / remove a document: O(w · (log b + m)) where w = words of the text
+    - Completion: O(log n + k) where k = entries read until N distinct completions
+"""
+
+from controllers.indices.normalizacion import normalizar_texto
+from controllers.listas.lista_bloques import ListaOrdenadaBloques
+
+class IndicePrefijos:
+    """
+    Sorted-key prefix index for autocomplete.
+
+    Attributes:
+        _entradas (ListaOrdenadaBloques): Sorted entries (clave_plegada, texto, id_documento).
+        _por_documento (dict): {id_documento: list of entries} used for removals.
+    """
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._entradas = ListaOrdenadaBloques()
+        self._por_documento = {}
+
+    def agregar(self, id_documento, texto, texto_plegado=None):
+        """
+        Indexes the full text and every word start of a document.
+
+        Args:
+            id_documento: Document identifier (e.g. the ISBN).
+            texto (str): Text to index (original form, shown in completions).
+            texto_plegado (str, optional): Already folded text (e.g. the key
+                cached on Libro). If None it is computed.
+        """
+        if id_documento in self._por_documento:
+            self.eliminar(id_documento)
+        if texto_plegado is None:
+            texto_plegado = normalizar_texto(texto)
+        entradas = []
+        inicio_palabra = True
+        for i, caracter in enumerate(texto_plegado):
+            if caracter.isspace():
+                inicio_palabra = True
+            elif inicio_palabra:
+                entradas.append((texto_plegado[i:], texto, id_documento))
+                inicio_palabra = False
+        for entrada in entradas:
+            self._entradas.agregar(entrada)
+        self._por_documento[id_documento] = entradas
+
+    def eliminar(self, id_documento):
+        """
+        Removes a document from the index.
+
+        Args:
+            id_documento: Document identifier.
+
+        Returns:
+            bool: True if the document was indexed, False otherwise.
+        """
+        entradas = self._por_documento.pop(id_documento, None)
+        if entradas is None:
+            return False
+        for entrada in entradas:
+            self._entradas.eliminar(entrada)
+        return True
+
+    def limpiar(self):
+        """Removes all documents from the index."""
+        self._entradas.clear()
+        self._por_documento.clear()
+
+    def completar(self, prefijo, limite=10):
+        """
+        Obtains the first N distinct texts that contain a word starting with the prefix.
+
+        Args:
+            prefijo (str): Text typed by the user (case- and accent-insensitive).
+            limite (int, optional): Maximum number of completions. Default: 10.
+
+        Returns:
+            list: Distinct original texts, in alphabetical order of the matched key.
+        """
+        prefijo_plegado = normalizar_texto(prefijo).lstrip()
+        if not prefijo_plegado:
+            return []
+        completados = {}
+        for clave, texto, _ in self._entradas.iterar_desde((prefijo_plegado,)):
+            if not clave.startswith(prefijo_plegado):
+                break
+            completados.setdefault(texto, None)
+            if len(completados) >= limite:
+                break
+        return list(completados)
+
+    def __len__(self):
+        return len(self._por_documento)
+
+    def __repr__(self):
+        return f"IndicePrefijos(documentos={len(self._por_documento)}, entradas={len(self._entradas)})"
@@ -0,0 +1,155 @@
+"""
+This structure is used for partial (substring) search on Titles and Authors,
+e.g. "rquez" matching "García Márquez", which a word index cannot answer.
+
+Every normalized text is split into its overlapping 3-character fragments
+(trigrams). A substring query can only match texts that contain all of its
+trigrams, so the candidates are obtained by intersecting posting lists and
+then verified with a real substring check.
+
+Time Complexity:
+    - Add / remove a document: O(L) where L = length of the text
+    - Query: O(g + min posting) for queries of 3+ characters;
+      shorter queries fall back to a scan of the normalized texts
+"""
+
+from controllers.indices.normalizacion import normalizar_texto
+
+TAMANIO_NGRAMA = 3
+
+def obtener_trigramas(texto_normalizado):
+    """
+    Obtains the distinct trigrams of an already normalized text.
+
+    Args:
+        texto_normalizado (str): Normalized text.
+
+    Returns:
+        set: Set of trigrams (empty if the text is shorter than 3 characters).
+    """
+    return {texto_normalizado[i:i + TAMANIO_NGRAMA]
+            for i in range(len(texto_normalizado) - TAMANIO_NGRAMA + 1)}
+
+class IndiceTrigramas:
+    """
+    Trigram (n-gram) index for substring search.
+
+    Attributes:
+        _postings (dict): {trigrama: {id_documento: None}}. Dicts are used as
+            ordered sets so results keep the insertion order of the documents.
+        _textos (dict): {id_documento: normalized text} used for verification.
+    """
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._postings = {}
+        self._textos = {}
+
+    @classmethod
+    def desde_lista(cls, lista_libros, campo):
+        """
+        Builds an index over a list of books using their positions as identifiers.
+
+        Args:
+            lista_libros (list): List of Book objects.
+            campo (str): Attribute to index ('titulo' or 'autor').
+
+        Returns:
+            IndiceTrigramas: Index whose identifiers are list indexes.
+        """
+        indice = cls()
+        for posicion, libro in enumerate(lista_libros):
+            indice.agregar(posicion, getattr(libro, campo))
+        return indice
+
+    def agregar(self, id_documento, texto):
+        """
+        Indexes a document. If it was already indexed it is replaced.
+
+        Args:
+            id_documento: Document identifier (e.g. the ISBN).
+            texto (str): Text to index.
+        """
+        if id_documento in self._textos:
+            self.eliminar(id_documento)
+        texto_normalizado = normalizar_texto(texto)
+        self._textos[id_documento] = texto_normalizado
+        for trigrama in obtener_trigramas(texto_normalizado):
+            self._postings.setdefault(trigrama, {})[id_documento] = None
+
+    def eliminar(self, id_documento):
+        """
+        Removes a document from the index.
+
+        Args:
+            id_documento: Document identifier.
+
+        Returns:
+            bool: True if the document was indexed, False otherwise.
+        """
+        texto_normalizado = self._textos.pop(id_documento, None)
+        if texto_normalizado is None:
+            return False
+        for trigrama in obtener_trigramas(texto_normalizado):
+            posting = self._postings[trigrama]
+            del posting[id_documento]
+            if not posting:
+                del self._postings[trigrama]
+        return True
+
+    def limpiar(self):
+        """Removes all documents from the index."""
+        self._postings.clear()
+        self._textos.clear()
+
+    def buscar(self, consulta):
+        """
+        Searches the documents whose text contains the query (case-insensitive).
+
+        Args:
+            consulta (str): Text fragment to search for.
+
+        Returns:
+            list: Identifiers of the matching documents (insertion order).
+        """
+        consulta_normalizada = normalizar_texto(consulta)
+        trigramas = obtener_trigramas(consulta_normalizada)
+        if not trigramas:
+            # Consultas cortas (< 3 caracteres): recorrer los textos normalizados
+            return [id_doc for id_doc, texto in self._textos.items() if consulta_normalizada in texto]
+
+        postings = []
+        for trigrama in trigramas:
+            posting = self._postings.get(trigrama)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # Intersección desde la lista más corta y verificación de la subcadena
+        postings.sort(key=len)
+        menor, resto = postings[0], postings[1:]
+        return [id_doc for id_doc in menor
+                if all(id_doc in posting for posting in resto)
+                and consulta_normalizada in self._textos[id_doc]]
+
+    def estimar(self, consulta):
+        """
+        Estimates the number of matches of a query without verifying them.
+
+        Args:
+            consulta (str): Text fragment to search for.
+
+        Returns:
+            int: Upper bound of matches (size of the shortest posting list,
+                or all the documents for queries shorter than 3 characters).
+        """
+        trigramas = obtener_trigramas(normalizar_texto(consulta))
+        if not trigramas:
+            return len(self._textos)
+        return min(len(self._postings.get(trigrama, ())) for trigrama in trigramas)
+
+    def __len__(self):
+        return len(self._textos)
+
+    def __repr__(self):
+        return f"IndiceTrigramas(documentos={len(self._textos)}, trigramas={len(self._postings)})"
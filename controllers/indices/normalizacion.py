@@ -0,0 +1,37 @@
+"""
+Text normalization shared by the search indexes.
+
+Every index stores and queries normalized text (case folding plus accent
+removal, the same folding cached on Libro) so that "García", "GARCIA" and
+"garcia" are treated as the same term.
+"""
+
+import re
+from models.texto import plegar_texto
+
+_PATRON_PALABRA = re.compile(r"\w+")
+
+def normalizar_texto(texto):
+    """
+    Normalizes a text for comparisons (case folding and accent removal).
+
+    Args:
+        texto (str): Text to normalize. None (e.g. a null title in a JSON
+            catalog) is treated as an empty text.
+
+    Returns:
+        str: Normalized text.
+    """
+    return plegar_texto('' if texto is None else str(texto))
+
+def tokenizar(texto):
+    """
+    Splits a text into normalized word tokens.
+
+    Args:
+        texto (str): Text to split.
+
+    Returns:
+        list: List of normalized tokens (in order, may repeat).
+    """
+    return _PATRON_PALABRA.findall(normalizar_texto(texto))
@@ -0,0 +1,481 @@
+"""
+This structure is used as a columnar (struct-of-arrays) copy of the book
+inventory for analytics: totals, per-author and per-genre aggregates.
+
+Instead of one Libro object per book, every numeric attribute is stored in
+its own contiguous array (array('d') / array('q')) and the text attributes
+Author and Genre are dictionary-encoded as integer codes (the codes of the
+shared intern pools of the models, so encoding a book is a dict lookup). Aggregates become
+reductions over arrays: with NumPy installed they run vectorized over the
+same memory (zero-copy np.frombuffer); without it they use C-level
+iterators (sum, map, itertools.compress).
+
+Time Complexity:
+    - Add / update / remove a book: O(1) (removal moves the last row)
+    - Total of a column: O(n) vectorized
+    - Aggregate by author or genre: O(n) vectorized + O(d) for d distinct values
+    - Summary of every author or genre (count, total, mean, min, max of
+      several columns): one O(n) pass for all the groups at once
+"""
+
+from array import array
+from itertools import compress
+from operator import index, mul
+from models.diccionario_valores import DICCIONARIOS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+class AlmacenColumnar:
+    """
+    Columnar store of the numeric and categorical attributes of the books.
+
+    Rows are not kept in insertion order: removing a book moves the last
+    row into its place so the arrays stay dense.
+
+    Attributes:
+        _columnas (dict): Arrays of each column {nombre: array}.
+        _codificadores (dict): Shared pools of the categorical columns {nombre: DiccionarioValores}.
+        _isbns (list): ISBN of each row.
+        _fila_de (dict): Row of each ISBN {isbn: fila}.
+    """
+
+    # Columnas numéricas -> código de tipo del array
+    COLUMNAS_NUMERICAS = {
+        'peso': 'd',
+        'valor': 'd',
+        'cantidad_disponible': 'q',
+        'cantidad_total': 'q'
+    }
+
+    # Columnas de texto codificadas como enteros
+    COLUMNAS_CODIFICADAS = ('autor', 'genero')
+
+    def __init__(self, libros=None):
+        """
+        Initializes the store.
+
+        Args:
+            libros (iterable, optional): Initial books. Default: None.
+        """
+        self._codificadores = {nombre: DICCIONARIOS[nombre] for nombre in self.COLUMNAS_CODIFICADAS}
+        self.limpiar()
+        if libros:
+            self.agregar_libros(libros)
+
+    def agregar(self, libro):
+        """
+        Adds the row of a book.
+
+        Args:
+            libro (Libro): Book to add.
+
+        Returns:
+            bool: True if added, False if the ISBN is already in the store.
+
+        Raises:
+            ValueError: If a numeric attribute is not valid (nothing is modified).
+        """
+        if libro.isbn in self._fila_de:
+            return False
+        # Todos los valores se convierten antes de tocar las columnas
+        fila = self.fila_de_libro(libro)
+        self._fila_de[libro.isbn] = len(self._isbns)
+        self._isbns.append(libro.isbn)
+        for nombre, valor in fila.items():
+            self._columnas[nombre].append(valor)
+        return True
+
+    def fila_de_libro(self, libro):
+        """
+        Converts a book into the values of its row without modifying the store.
+
+        Float columns accept any real number; integer columns only integers.
+
+        Args:
+            libro (Libro): Book to convert.
+
+        Returns:
+            dict: Value of each column {nombre: valor}.
+
+        Raises:
+            ValueError: If a numeric attribute cannot be stored in its column.
+        """
+        fila = {}
+        for nombre, tipo in self.COLUMNAS_NUMERICAS.items():
+            valor = getattr(libro, nombre)
+            try:
+                if isinstance(valor, (str, bytes)):
+                    raise TypeError
+                fila[nombre] = float(valor) if tipo == 'd' else index(valor)
+            except (TypeError, ValueError):
+                raise ValueError(f"Valor no válido para {nombre}: {valor!r}") from None
+        for nombre in self.COLUMNAS_CODIFICADAS:
+            fila[nombre] = self._codificadores[nombre].codificar(getattr(libro, nombre))
+        return fila
+
+    def agregar_libros(self, libros):
+        """
+        Adds the rows of several books.
+
+        Args:
+            libros (iterable): Books to add.
+
+        Returns:
+            int: Number of books added.
+        """
+        agregados = 0
+        for libro in libros:
+            if self.agregar(libro):
+                agregados += 1
+        return agregados
+
+    def actualizar(self, libro):
+        """
+        Rewrites the row of a book after a change (e.g. stock of a loan).
+
+        Args:
+            libro (Libro): Modified book.
+
+        Returns:
+            bool: True if updated, False if the book is not in the store.
+
+        Raises:
+            ValueError: If a numeric attribute is not valid (nothing is modified).
+        """
+        fila = self._fila_de.get(libro.isbn)
+        if fila is None:
+            return False
+        for nombre, valor in self.fila_de_libro(libro).items():
+            self._columnas[nombre][fila] = valor
+        return True
+
+    def eliminar(self, isbn):
+        """
+        Removes the row of a book in O(1) by moving the last row into its place.
+
+        Args:
+            isbn (str): ISBN of the book.
+
+        Returns:
+            bool: True if removed, False if not found.
+        """
+        fila = self._fila_de.pop(isbn, None)
+        if fila is None:
+            return False
+        ultima = len(self._isbns) - 1
+        if fila != ultima:
+            for columna in self._columnas.values():
+                columna[fila] = columna[ultima]
+            self._isbns[fila] = self._isbns[ultima]
+            self._fila_de[self._isbns[fila]] = fila
+        for columna in self._columnas.values():
+            columna.pop()
+        self._isbns.pop()
+        return True
+
+    def limpiar(self):
+        """Removes all rows (the shared pools keep their codes)."""
+        self._columnas = {nombre: array(tipo) for nombre, tipo in self.COLUMNAS_NUMERICAS.items()}
+        for nombre in self.COLUMNAS_CODIFICADAS:
+            self._columnas[nombre] = array('q')
+        self._isbns = []
+        self._fila_de = {}
+
+    def columna(self, nombre):
+        """
+        Obtains a column as a NumPy array (zero-copy) or as the raw array.
+
+        The result must be treated as read-only and not kept across mutations.
+
+        Args:
+            nombre (str): Column name.
+
+        Returns:
+            numpy.ndarray|array.array: Values of the column.
+
+        Raises:
+            ValueError: If the column does not exist.
+        """
+        if nombre not in self._columnas:
+            raise ValueError(f"Columna no soportada: {nombre}")
+        datos = self._columnas[nombre]
+        if np is None or not datos:
+            return datos
+        return np.frombuffer(datos, dtype=np.float64 if datos.typecode == 'd' else np.int64)
+
+    def total(self, columna, ponderado_por=None):
+        """
+        Sums a column, optionally weighted by another one.
+
+        Example: total('valor', ponderado_por='cantidad_total') is the
+        value of the inventory counting all the copies.
+
+        Args:
+            columna (str): Numeric column to sum.
+            ponderado_por (str, optional): Column to multiply by. Default: None.
+
+        Returns:
+            float: Sum of the column.
+        """
+        valores = self.columna(columna)
+        if ponderado_por is None:
+            return float(valores.sum()) if np is not None and len(valores) else float(sum(valores))
+        pesos = self.columna(ponderado_por)
+        if np is not None and len(valores):
+            return float(np.dot(valores, pesos))
+        return float(sum(map(mul, valores, pesos)))
+
+    def totales_por(self, grupo, columna=None, ponderado_por=None):
+        """
+        Aggregates a column per author or genre in a single pass.
+
+        Args:
+            grupo (str): 'autor' or 'genero'.
+            columna (str, optional): Column to sum. None counts the books. Default: None.
+            ponderado_por (str, optional): Column to multiply by. Default: None.
+
+        Returns:
+            dict: {valor del grupo: suma (o cantidad)} for the groups with books.
+        """
+        codificador = self._codificador(grupo)
+        codigos = self.columna(grupo)
+        if not len(codigos):
+            return {}
+        if np is not None:
+            valores = None if columna is None else self.columna(columna)
+            if valores is not None and ponderado_por is not None:
+                valores = valores * self.columna(ponderado_por)
+            conteos = np.bincount(codigos, minlength=len(codificador))
+            sumas = conteos if valores is None else np.bincount(codigos, weights=valores, minlength=len(codificador))
+            return {codificador.decodificar(c): sumas[c].item() for c in np.flatnonzero(conteos)}
+
+        acumulado = {}
+        if columna is None:
+            for codigo in codigos:
+                acumulado[codigo] = acumulado.get(codigo, 0) + 1
+        else:
+            valores = self.columna(columna)
+            if ponderado_por is not None:
+                valores = map(mul, valores, self.columna(ponderado_por))
+            for codigo, valor in zip(codigos, valores):
+                acumulado[codigo] = acumulado.get(codigo, 0) + valor
+        return {codificador.decodificar(codigo): suma for codigo, suma in acumulado.items()}
+
+    def resumen_por(self, grupo, columnas=('valor', 'peso')):
+        """
+        Summarizes several columns for every author or genre in a single pass.
+
+        With NumPy the counts and sums are bincounts and the minimums and
+        maximums unbuffered ufunc reductions (np.minimum.at / np.maximum.at);
+        without it, a single hash aggregation over the zipped columns.
+
+        Args:
+            grupo (str): 'autor' or 'genero'.
+            columnas (tuple, optional): Numeric columns to summarize.
+                Default: ('valor', 'peso').
+
+        Returns:
+            dict: {valor del grupo: {'cantidad', '<columna>_total',
+                '<columna>_promedio', '<columna>_minimo', '<columna>_maximo'}}
+                for the groups with books.
+        """
+        codificador = self._codificador(grupo)
+        codigos = self.columna(grupo)
+        if not len(codigos):
+            return {}
+        for columna in columnas:
+            if columna not in self.COLUMNAS_NUMERICAS:
+                raise ValueError(f"Columna no soportada: {columna}")
+
+        if np is not None:
+            tamanio = len(codificador)
+            conteos = np.bincount(codigos, minlength=tamanio)
+            presentes = np.flatnonzero(conteos)
+            agregados = {}
+            for columna in columnas:
+                valores = self.columna(columna).astype(np.float64, copy=False)
+                minimos = np.full(tamanio, np.inf)
+                maximos = np.full(tamanio, -np.inf)
+                np.minimum.at(minimos, codigos, valores)
+                np.maximum.at(maximos, codigos, valores)
+                agregados[columna] = (np.bincount(codigos, weights=valores, minlength=tamanio), minimos, maximos)
+            resumen = {}
+            for codigo in presentes.tolist():
+                cantidad = int(conteos[codigo])
+                resumen[codificador.decodificar(codigo)] = fila = {'cantidad': cantidad}
+                for columna, (sumas, minimos, maximos) in agregados.items():
+                    total = sumas[codigo].item()
+                    fila[f'{columna}_total'] = total
+                    fila[f'{columna}_promedio'] = total / cantidad
+                    fila[f'{columna}_minimo'] = minimos[codigo].item()
+                    fila[f'{columna}_maximo'] = maximos[codigo].item()
+            return resumen
+
+        # Sin NumPy: agregación por hash en un solo recorrido de las columnas
+        # Acumulador por código: [cantidad, total_1, minimo_1, maximo_1, total_2, ...]
+        acumulado = {}
+        for fila in zip(codigos, *(self._columnas[columna] for columna in columnas)):
+            acumulador = acumulado.get(fila[0])
+            if acumulador is None:
+                acumulador = acumulado[fila[0]] = [0] + [0.0, float('inf'), float('-inf')] * len(columnas)
+            acumulador[0] += 1
+            posicion = 1
+            for valor in fila[1:]:
+                acumulador[posicion] += valor
+                if valor < acumulador[posicion + 1]:
+                    acumulador[posicion + 1] = valor
+                if valor > acumulador[posicion + 2]:
+                    acumulador[posicion + 2] = valor
+                posicion += 3
+
+        resumen = {}
+        for codigo, acumulador in acumulado.items():
+            cantidad = acumulador[0]
+            resumen[codificador.decodificar(codigo)] = fila = {'cantidad': cantidad}
+            for i, columna in enumerate(columnas):
+                total, minimo, maximo = acumulador[1 + 3 * i:4 + 3 * i]
+                fila[f'{columna}_total'] = total
+                fila[f'{columna}_promedio'] = total / cantidad
+                fila[f'{columna}_minimo'] = minimo
+                fila[f'{columna}_maximo'] = maximo
+        return resumen
+
+    @staticmethod
+    def combinar_resumen(resumen, grupos, columnas=('valor', 'peso')):
+        """
+        Merges the summaries of several groups (e.g. all the authors that
+        match a partial query) in O(groups) instead of rescanning the books.
+
+        Args:
+            resumen (dict): Result of resumen_por().
+            grupos (iterable): Group values to merge (missing ones are ignored).
+            columnas (tuple, optional): Columns present in the summary.
+                Default: ('valor', 'peso').
+
+        Returns:
+            dict: Same keys as one entry of the summary; minimos/maximos are
+                None if no group has books.
+        """
+        combinado = {'cantidad': 0}
+        for columna in columnas:
+            combinado.update({f'{columna}_total': 0.0, f'{columna}_minimo': None, f'{columna}_maximo': None})
+        for grupo in grupos:
+            fila = resumen.get(grupo)
+            if fila is None:
+                continue
+            combinado['cantidad'] += fila['cantidad']
+            for columna in columnas:
+                combinado[f'{columna}_total'] += fila[f'{columna}_total']
+                minimo, maximo = combinado[f'{columna}_minimo'], combinado[f'{columna}_maximo']
+                if minimo is None or fila[f'{columna}_minimo'] < minimo:
+                    combinado[f'{columna}_minimo'] = fila[f'{columna}_minimo']
+                if maximo is None or fila[f'{columna}_maximo'] > maximo:
+                    combinado[f'{columna}_maximo'] = fila[f'{columna}_maximo']
+        cantidad = combinado['cantidad']
+        for columna in columnas:
+            combinado[f'{columna}_promedio'] = combinado[f'{columna}_total'] / cantidad if cantidad else 0.0
+        return combinado
+
+    def codigos_coincidentes(self, grupo, consulta):
+        """
+        Obtains the codes whose value contains the query (partial,
+        case- and accent-insensitive, like the searches by author).
+
+        The query is evaluated once per distinct value, not per book (and
+        cached by the pool).
+
+        Args:
+            grupo (str): 'autor' or 'genero'.
+            consulta (str): Text to search for.
+
+        Returns:
+            set: Codes of the matching values.
+        """
+        return self._codificador(grupo).codigos_coincidentes(consulta)
+
+    def valores_de_codigos(self, grupo, codigos):
+        """
+        Decodes a set of codes.
+
+        Args:
+            grupo (str): 'autor' or 'genero'.
+            codigos (iterable): Codes to decode.
+
+        Returns:
+            set: Original values.
+        """
+        codificador = self._codificador(grupo)
+        return {codificador.decodificar(codigo) for codigo in codigos}
+
+    def estadisticas_por_codigos(self, grupo, codigos, columna):
+        """
+        Count, sum, minimum and maximum of a column over the rows of some codes.
+
+        Args:
+            grupo (str): 'autor' or 'genero'.
+            codigos (set): Codes of the group to include.
+            columna (str): Numeric column to aggregate.
+
+        Returns:
+            dict: {'cantidad', 'total', 'minimo', 'maximo'} (minimo/maximo None if no rows).
+        """
+        codigos_columna = self.columna(grupo)
+        valores = self.columna(columna)
+        if np is not None and len(valores):
+            seleccion = valores[np.isin(codigos_columna, list(codigos))]
+            if not len(seleccion):
+                return {'cantidad': 0, 'total': 0.0, 'minimo': None, 'maximo': None}
+            return {
+                'cantidad': int(len(seleccion)),
+                'total': float(seleccion.sum()),
+                'minimo': seleccion.min().item(),
+                'maximo': seleccion.max().item()
+            }
+
+        # Sin NumPy: la selección se hace con iteradores en C (compress/map)
+        mascara = array('b', map(codigos.__contains__, codigos_columna))
+        cantidad = sum(mascara)
+        if not cantidad:
+            return {'cantidad': 0, 'total': 0.0, 'minimo': None, 'maximo': None}
+        return {
+            'cantidad': cantidad,
+            'total': float(sum(compress(valores, mascara))),
+            'minimo': min(compress(valores, mascara)),
+            'maximo': max(compress(valores, mascara))
+        }
+
+    def estadisticas_autor(self, autor, columna):
+        """
+        Statistics of a column for the books of an author (partial match).
+
+        Args:
+            autor (str): Name or part of the name of the author.
+            columna (str): Numeric column ('valor', 'peso', ...).
+
+        Returns:
+            dict: {'cantidad', 'total', 'minimo', 'maximo', 'autores'} where
+                'autores' is the set of matching author names.
+        """
+        codigos = self.codigos_coincidentes('autor', autor)
+        estadisticas = self.estadisticas_por_codigos('autor', codigos, columna)
+        estadisticas['autores'] = self.valores_de_codigos('autor', codigos)
+        return estadisticas
+
+    def _codificador(self, grupo):
+        """Returns the encoder of a categorical column or raises ValueError."""
+        if grupo not in self._codificadores:
+            raise ValueError(f"Columna no codificada: {grupo}")
+        return self._codificadores[grupo]
+
+    def __contains__(self, isbn):
+        return isbn in self._fila_de
+
+    def __len__(self):
+        return len(self._isbns)
+
+    def __repr__(self):
+        motor = 'numpy' if np is not None else 'array'
+        return f"AlmacenColumnar(libros={len(self._isbns)}, motor={motor})"
@@ -1,16 +1,77 @@
+import weakref
+
+from controllers.indices.indice_invertido import IndiceInvertido
+from controllers.indices.indice_trigramas import IndiceTrigramas
+from controllers.indices.indice_prefijos import IndicePrefijos
+from controllers.indices.indice_ordenado import IndiceOrdenado
+from controllers.indices.indice_bitmap import IndiceBitmap
+from controllers.listas.vista_libros import VistaLibros
+from models.texto import plegar_consulta
+
 class InventarioGeneral:
     """
     Manage the overall inventory of books (in the order in which they were added) in the library.
 
     Attributes:
-        libros (list): List containing the books in the inventory.
+        libros (VistaLibros): Read-only snapshot of the books in the inventory.
+        version (int): Counter incremented on every addition or removal.
+        _ranuras (list): Slots with the books in insertion order (None = removed book).
+        _ranura_de (dict): Slot of each ISBN {isbn: ranura}.
+        _lapidas (int): Number of removed slots (tombstones) pending compaction.
+        _instantaneas (WeakValueDictionary): Live snapshots that share _ranuras {id: vista} (copy-on-write).
+        _indice_isbn (dict): Hash index {isbn: Libro} for O(1) lookups by ISBN.
+        _indice_titulos (IndiceInvertido): Word index over the titles.
+        _indice_autores (IndiceInvertido): Word index over the authors.
+        _trigramas_titulos (IndiceTrigramas): Substring index over the titles.
+        _trigramas_autores (IndiceTrigramas): Substring index over the authors.
+        _prefijos_titulos (IndicePrefijos): Autocomplete index over the titles.
+        _prefijos_autores (IndicePrefijos): Autocomplete index over the authors.
+        _indices_ordenados (dict): Sorted indexes {criterio: IndiceOrdenado} for range queries.
+        _facetas (IndiceBitmap): Bitmaps of genre, availability and shelf.
+        _longitud_max_isbn (int): Length of the longest ISBN ever added.
     """
 
+    # Criterios con índice ordenado -> atributo del libro por el que se ordena
+    CRITERIOS_RANGO = {
+        'valor': 'valor',
+        'peso': 'peso',
+        'genero': 'genero_plegado'
+    }
+
+    # Atributos de baja cardinalidad indexados con bitmaps
+    FACETAS = ('genero', 'disponible', 'estante_id')
+
+    # Se compacta cuando las ranuras eliminadas superan esta fracción del total
+    UMBRAL_COMPACTACION = 0.25
+    MINIMO_COMPACTACION = 64
+
     def __init__(self):
         """
         Initializes the general inventory with an empty list of books.
         """
-        self.libros = []
+        self._ranuras = []
+        self._ranura_de = {}
+        self._lapidas = 0
+        self._instantaneas = weakref.WeakValueDictionary()
+        self.version = 0
+        self._indice_isbn = {}
+        self._indice_titulos = IndiceInvertido()
+        self._indice_autores = IndiceInvertido()
+        self._trigramas_titulos = IndiceTrigramas()
+        self._trigramas_autores = IndiceTrigramas()
+        self._prefijos_titulos = IndicePrefijos()
+        self._prefijos_autores = IndicePrefijos()
+        self._indices_ordenados = {
+            criterio: IndiceOrdenado(atributo)
+            for criterio, atributo in self.CRITERIOS_RANGO.items()
+        }
+        self._facetas = IndiceBitmap(self.FACETAS)
+        self._longitud_max_isbn = 0
+
+    @property
+    def libros(self):
+        """Read-only snapshot of the books in insertion order."""
+        return self.instantanea()
 
     def agregar_libro(self, libro):
         """
@@ -22,11 +83,26 @@ class InventarioGeneral:
         Returns:
             bool: True if the book was added successfully. False if the ISBN already exists in the inventory.
         """
-        # Verificar que el ISBN no exista en el inventario
-        if self.buscar_por_isbn(libro.isbn):
+        # Verificar que el ISBN no exista en el inventario (índice hash, O(1))
+        if libro.isbn in self._indice_isbn:
             return False
         
-        self.libros.append(libro)
+        # Agregar al final no altera las instantáneas (cubren hasta su longitud)
+        self._ranura_de[libro.isbn] = len(self._ranuras)
+        self._ranuras.append(libro)
+        self.version += 1
+        self._indice_isbn[libro.isbn] = libro
+        self._longitud_max_isbn = max(self._longitud_max_isbn, len(libro.isbn))
+        # Los índices de texto reciben las claves ya plegadas del libro
+        self._indice_titulos.agregar(libro.isbn, libro.titulo_plegado)
+        self._indice_autores.agregar(libro.isbn, libro.autor_plegado)
+        self._trigramas_titulos.agregar(libro.isbn, libro.titulo_plegado)
+        self._trigramas_autores.agregar(libro.isbn, libro.autor_plegado)
+        self._prefijos_titulos.agregar(libro.isbn, libro.titulo, libro.titulo_plegado)
+        self._prefijos_autores.agregar(libro.isbn, libro.autor, libro.autor_plegado)
+        for indice in self._indices_ordenados.values():
+            indice.agregar(libro)
+        self._facetas.actualizar(libro.isbn, self._valores_facetas(libro))
         return True
     
     def agregar_libros(self, lista_libros):
@@ -49,36 +125,60 @@ class InventarioGeneral:
         """
         Removes a book from the general inventory by its ISBN.
 
+        The slot of the book is marked as removed (tombstone) in O(1); the
+        slots are compacted when the tombstones exceed UMBRAL_COMPACTACION,
+        so removals are O(1) amortized.
+
         Args:
             isbn (str): ISBN of the book to remove.
 
         Returns:
             bool: True if the book was removed, False if the book was not found.
         """
-        for i, libro in enumerate(self.libros):
-            if libro.isbn == isbn:
-                del self.libros[i]
-                return True
-        return False
+        if isbn not in self._indice_isbn:
+            return False
+        
+        if self._instantaneas:
+            # Copy-on-write: las instantáneas vivas conservan la lista anterior
+            self._ranuras = self._ranuras.copy()
+            self._instantaneas = weakref.WeakValueDictionary()
+        self._ranuras[self._ranura_de.pop(isbn)] = None
+        self._lapidas += 1
+        self.version += 1
+        libro = self._indice_isbn.pop(isbn)
+        self._indice_titulos.eliminar(isbn)
+        self._indice_autores.eliminar(isbn)
+        self._trigramas_titulos.eliminar(isbn)
+        self._trigramas_autores.eliminar(isbn)
+        self._prefijos_titulos.eliminar(isbn)
+        self._prefijos_autores.eliminar(isbn)
+        for indice in self._indices_ordenados.values():
+            indice.eliminar(libro)
+        self._facetas.eliminar(isbn)
+        if self._lapidas >= max(self.MINIMO_COMPACTACION, self.UMBRAL_COMPACTACION * len(self._ranuras)):
+            self._compactar()
+        return True
     
     def buscar_por_isbn(self, isbn):
         """
         Searches for a book in the inventory by its ISBN.
 
+        Uses the hash index, so the lookup is O(1).
+
         Args:
             isbn (str): ISBN of the book to search for.
 
         Returns:
             Libro o None: The book is found, None is not found.
         """
-        for libro in self.libros:
-            if libro.isbn == isbn:
-                return libro
-        return None
+        return self._indice_isbn.get(isbn)
     
     def buscar_por_titulo(self, titulo):
         """
-        Search for books in the inventory by their title.
+        Search for books in the inventory by their title (partial match).
+
+        Uses the trigram index to narrow the candidates before checking
+        the substring, instead of scanning the whole inventory.
 
         Args:
             titulo (str): Title of the book to search for.
@@ -86,17 +186,14 @@ class InventarioGeneral:
         Returns:
             list: List of books that match the title.
         """
-        titulo_lower = titulo.lower()
-        resultados = []
-
-        for libro in self.libros:
-            if titulo_lower in libro.titulo.lower():
-                resultados.append(libro)
-        return resultados
+        return [self._indice_isbn[isbn] for isbn in self._trigramas_titulos.buscar(titulo)]
     
     def buscar_por_autor(self, autor):
         """
-        Search for books in the inventory by their author.
+        Search for books in the inventory by their author (partial match).
+
+        Uses the trigram index to narrow the candidates before checking
+        the substring, instead of scanning the whole inventory.
 
         Args:
             autor (str): Author of the book to search for.
@@ -104,22 +201,315 @@ class InventarioGeneral:
         Returns:
             list: List of books that match the author.
         """
-        autor_lower = autor.lower()
-        resultados = []
+        return [self._indice_isbn[isbn] for isbn in self._trigramas_autores.buscar(autor)]
+    
+    def buscar_por_palabras(self, consulta, campo='titulo', relevancia=False):
+        """
+        Search for books whose title or author contains ALL the words of the query.
+
+        Uses the inverted word index, so only the books that share the
+        query words are visited.
+
+        Args:
+            consulta (str): One or more words (case-insensitive).
+            campo (str, optional): 'titulo' or 'autor'. Default: 'titulo'.
+            relevancia (bool, optional): If True, results are ranked by BM25.
+                Default: False (order in which they were added).
+
+        Returns:
+            list: List of books that match all the words.
+
+        Raises:
+            ValueError: If the field is not indexed.
+        """
+        if campo == 'titulo':
+            indice = self._indice_titulos
+        elif campo == 'autor':
+            indice = self._indice_autores
+        else:
+            raise ValueError(f"Campo no indexado: {campo}")
+        return [self._indice_isbn[isbn] for isbn in indice.buscar(consulta, relevancia)]
+    
+    def autocompletar(self, prefijo, campo='titulo', limite=10):
+        """
+        Obtains titles or authors that have a word starting with the prefix.
+
+        Args:
+            prefijo (str): Text typed so far.
+            campo (str, optional): 'titulo' or 'autor'. Default: 'titulo'.
+            limite (int, optional): Maximum number of suggestions. Default: 10.
+
+        Returns:
+            list: Distinct suggested titles or authors.
+
+        Raises:
+            ValueError: If the field is not indexed.
+        """
+        if campo == 'titulo':
+            return self._prefijos_titulos.completar(prefijo, limite)
+        elif campo == 'autor':
+            return self._prefijos_autores.completar(prefijo, limite)
+        raise ValueError(f"Campo no indexado: {campo}")
+    
+    def buscar_por_rango(self, criterio, minimo=None, maximo=None):
+        """
+        Search for books whose value, weight or genre is within [minimo, maximo].
+
+        Uses the sorted index of the criterion: O(log n + k).
+
+        Args:
+            criterio (str): 'valor', 'peso' or 'genero'.
+            minimo (optional): Lower bound (inclusive). None = no lower bound.
+            maximo (optional): Upper bound (inclusive). None = no upper bound.
+
+        Returns:
+            list: Books within the range, in ascending order of the criterion.
+
+        Raises:
+            ValueError: If the criterion is not indexed.
+        """
+        indice = self._obtener_indice_ordenado(criterio)
+        if criterio == 'genero':
+            # Los géneros se comparan plegados (sin mayúsculas ni acentos)
+            minimo = plegar_consulta(minimo) if minimo is not None else None
+            maximo = plegar_consulta(maximo) if maximo is not None else None
+        return indice.buscar_rango(minimo, maximo)
+    
+    def buscar_por_igualdad(self, criterio, valor):
+        """
+        Search for books whose value, weight or genre equals the given value.
+
+        Uses the sorted index of the criterion: O(log n + k).
+
+        Args:
+            criterio (str): 'valor', 'peso' or 'genero'.
+            valor: Value to search for (genre is case- and accent-insensitive).
+
+        Returns:
+            list: Books with that value, ordered by ISBN.
+
+        Raises:
+            ValueError: If the criterion is not indexed.
+        """
+        indice = self._obtener_indice_ordenado(criterio)
+        if criterio == 'genero':
+            valor = plegar_consulta(valor)
+        return indice.buscar_igual(valor)
+    
+    def _obtener_indice_ordenado(self, criterio):
+        """Returns the sorted index of a criterion or raises ValueError."""
+        if criterio not in self._indices_ordenados:
+            raise ValueError(f"Criterio no indexado: {criterio}")
+        return self._indices_ordenados[criterio]
+    
+    def actualizar_facetas(self, libro):
+        """
+        Refreshes the bitmaps of a book after a change of stock or shelf.
+
+        Must be called after loans, returns and shelving.
+
+        Args:
+            libro (Libro): Modified book.
+
+        Returns:
+            bool: True if the book is in the inventory, False otherwise.
+        """
+        if libro.isbn not in self._indice_isbn:
+            return False
+        self._facetas.actualizar(libro.isbn, self._valores_facetas(libro))
+        return True
+    
+    def filtrar_por_facetas(self, **criterios):
+        """
+        Search for books combining genre, availability and shelf filters.
+
+        The filters are resolved with bitwise AND/OR over the bitmaps.
+        The genre is compared case- and accent-insensitive, and a list of
+        values means any of them (OR).
+
+        Example: filtrar_por_facetas(genero='ficcion', disponible=True)
+
+        Args:
+            **criterios: genero=str|list, disponible=bool, estante_id=id|list|None.
+
+        Returns:
+            list: Books that meet all the criteria (order in which they were added).
+
+        Raises:
+            ValueError: If a criterion is not a facet.
+        """
+        if 'genero' in criterios:
+            generos = criterios['genero']
+            if isinstance(generos, str):
+                generos = [generos]
+            buscados = {plegar_consulta(genero) for genero in generos}
+            criterios['genero'] = [
+                genero for genero in self._facetas.valores('genero')
+                if plegar_consulta(genero) in buscados
+            ]
+        mapa = self._facetas.filtrar(**criterios)
+        return [self._indice_isbn[isbn] for isbn in self._facetas.identificadores(mapa)]
+    
+    def contar_por_faceta(self, faceta):
+        """
+        Counts the books of each value of a facet without scanning the inventory.
+
+        Args:
+            faceta (str): 'genero', 'disponible' or 'estante_id'.
+
+        Returns:
+            dict: {valor: cantidad de libros}.
+
+        Raises:
+            ValueError: If the facet is not indexed.
+        """
+        if faceta not in self.FACETAS:
+            raise ValueError(f"Faceta no indexada: {faceta}")
+        return self._facetas.conteos(faceta)
+    
+    def mapa_por_faceta(self, faceta, condicion):
+        """
+        Obtains the bitmap of the books whose facet value meets a condition.
+
+        The condition is evaluated once per distinct value of the facet,
+        not once per book.
+
+        Args:
+            faceta (str): 'genero', 'disponible' or 'estante_id'.
+            condicion (callable): Function valor -> bool.
+
+        Returns:
+            int: Bitmap (OR of the values that meet the condition).
+        """
+        valores = [valor for valor in self._facetas.valores(faceta) if condicion(valor)]
+        return self._facetas.mapa_cualquiera(faceta, valores)
+    
+    def libros_de_mapa(self, mapa):
+        """
+        Converts a facet bitmap into the list of books (order in which they were added).
+
+        Args:
+            mapa (int): Bitmap obtained from this inventory.
+
+        Returns:
+            list: Books of the bitmap.
+        """
+        return [self._indice_isbn[isbn] for isbn in self._facetas.identificadores(mapa)]
+    
+    def estimar_por_subcadena(self, campo, consulta):
+        """
+        Estimates the matches of a partial title or author search.
+
+        Args:
+            campo (str): 'titulo' or 'autor'.
+            consulta (str): Text fragment.
+
+        Returns:
+            int: Upper bound of matches according to the trigram index.
+
+        Raises:
+            ValueError: If the field is not indexed.
+        """
+        if campo == 'titulo':
+            return self._trigramas_titulos.estimar(consulta)
+        elif campo == 'autor':
+            return self._trigramas_autores.estimar(consulta)
+        raise ValueError(f"Campo no indexado: {campo}")
+    
+    def contar_por_rango(self, criterio, minimo=None, maximo=None):
+        """
+        Counts the books within a range of value, weight or genre in O(log n).
+
+        Args:
+            criterio (str): 'valor', 'peso' or 'genero'.
+            minimo (optional): Lower bound (inclusive). None = no lower bound.
+            maximo (optional): Upper bound (inclusive). None = no upper bound.
+
+        Returns:
+            int: Number of books within the range.
+        """
+        indice = self._obtener_indice_ordenado(criterio)
+        if criterio == 'genero':
+            minimo = plegar_consulta(minimo) if minimo is not None else None
+            maximo = plegar_consulta(maximo) if maximo is not None else None
+        return indice.contar_rango(minimo, maximo)
+    
+    def busqueda_isbn_exacta(self, fragmento):
+        """
+        Checks if a partial ISBN search can be answered by the hash index.
+
+        If the fragment is at least as long as the longest ISBN ever added,
+        the only ISBN that can contain it is the fragment itself.
+
+        Args:
+            fragmento (str): ISBN or part of an ISBN.
+
+        Returns:
+            bool: True if a hash lookup gives the same result as a partial search.
+        """
+        return len(fragmento) >= self._longitud_max_isbn
+    
+    def posicion_de(self, isbn):
+        """
+        Obtains the position of a book in the inventory list.
 
-        for libro in self.libros:
-            if autor_lower in libro.autor.lower():
-                resultados.append(libro)
-        return resultados
+        Args:
+            isbn (str): ISBN of the book.
+
+        Returns:
+            int: Position in the list, -1 if the book is not in the inventory.
+        """
+        # Sin ranuras eliminadas la ranura coincide con la posición
+        self._compactar()
+        return self._ranura_de.get(isbn, -1)
+    
+    def _compactar(self):
+        """Removes the tombstones and renumbers the slots and the bitmap positions in O(n)."""
+        if not self._lapidas:
+            return
+        self._ranuras = [libro for libro in self._ranuras if libro is not None]
+        self._ranura_de = {libro.isbn: i for i, libro in enumerate(self._ranuras)}
+        # Las posiciones de los bitmaps siguen a las ranuras
+        self._facetas.renumerar(self._ranura_de)
+        self._lapidas = 0
+        self._instantaneas = weakref.WeakValueDictionary()
+    
+    @staticmethod
+    def _valores_facetas(libro):
+        """Values of the bitmap facets of a book."""
+        return {
+            'genero': libro.genero,
+            'disponible': libro.esta_disponible(),
+            'estante_id': libro.estante_id
+        }
+    
+    def instantanea(self):
+        """
+        Obtains a stable snapshot of the books without copying them.
+
+        The snapshot is not affected by later additions or removals: the
+        inventory copies its list only if a book is removed while a snapshot
+        is still alive (copy-on-write). Pending removed slots are not
+        compacted here; the view skips them.
+
+        Returns:
+            VistaLibros: Read-only view of the books (order in which they were added).
+        """
+        vista = VistaLibros(self._ranuras, 0, len(self._ranuras), self.version, self._lapidas)
+        self._instantaneas[id(vista)] = vista
+        return vista
     
     def obtener_libros(self):
         """
         Obtains the complete list of books in the inventory.
 
+        Returns a read-only snapshot (O(1)); use `.copy()` on it to obtain
+        a mutable list.
+
         Returns:
-            list: Copy of all books in the inventory.
+            VistaLibros: Snapshot of all books in the inventory.
         """
-        return self.libros.copy()
+        return self.instantanea()
     
     def cantidad_libros(self):
         """
@@ -128,7 +518,7 @@ class InventarioGeneral:
         Returns:
             int: Total number of books in the inventory.
         """
-        return len(self.libros)
+        return len(self._ranura_de)
     
     def esta_vacio(self):
         """
@@ -137,13 +527,28 @@ class InventarioGeneral:
         Returns:
             bool: True if the inventory is empty, False otherwise.
         """
-        return len(self.libros) == 0
+        return len(self._ranura_de) == 0
     
     def limpiar_inventario(self):
         """
         Clears all books from the inventory.
         """
-        self.libros.clear()
+        self._ranuras = []
+        self._ranura_de.clear()
+        self._lapidas = 0
+        self._instantaneas = weakref.WeakValueDictionary()
+        self.version += 1
+        self._indice_isbn.clear()
+        self._indice_titulos.limpiar()
+        self._indice_autores.limpiar()
+        self._trigramas_titulos.limpiar()
+        self._trigramas_autores.limpiar()
+        self._prefijos_titulos.limpiar()
+        self._prefijos_autores.limpiar()
+        for indice in self._indices_ordenados.values():
+            indice.limpiar()
+        self._facetas.limpiar()
+        self._longitud_max_isbn = 0
 
     def obtener_por_indice(self, indice):
         """
@@ -155,10 +560,22 @@ class InventarioGeneral:
         Returns:
             Libro|None: The book if the index is valid, None if invalid.
         """
-        if 0 <= indice < len(self.libros):
-            return self.libros[indice]
+        if 0 <= indice < len(self._ranura_de):
+            self._compactar()
+            return self._ranuras[indice]
         return None
     
+    def __iter__(self):
+        """
+        Iterates the books in insertion order, skipping removed slots.
+
+        Yields:
+            Libro: Books of the inventory.
+        """
+        for libro in self._ranuras:
+            if libro is not None:
+                yield libro
+    
     def __len__(self):
         """
         Returns the number of books in the inventory when using len().
@@ -166,10 +583,10 @@ class InventarioGeneral:
         Returns:
             int: Total number of books in the inventory.
         """
-        return len(self.libros)
+        return len(self._ranura_de)
     
     def __str__(self):
-        return f"InventarioGeneral con {len(self.libros)} libros (orden de carga)."
+        return f"InventarioGeneral con {len(self)} libros (orden de carga)."
 
     def __repr__(self):
-        return f"InventarioGeneral(libros={len(self.libros)})"
\ No newline at end of file
+        return f"InventarioGeneral(libros={len(self)}, ranuras_eliminadas={self._lapidas})"
\ No newline at end of file
@@ -1,18 +1,44 @@
+from operator import attrgetter
+from controllers.ordenamiento.merge_sort import merge_sort, merge
+from controllers.listas.lista_bloques import ListaOrdenadaBloques
+
 class InventarioOrdenado:
     """
     Manage the organized inventory of books in the library (According to ISBN).
 
     When a book is added, an insertion algorithm is used to maintain order by ISBN.
 
+    Two storage engines are available:
+        - 'lista': a plain Python list (insertion by adjacent swaps, O(n)).
+        - 'bloques': a ListaOrdenadaBloques (sorted blocks, ~O(√n) insert/delete).
+    Both support indexing, ordered iteration and binary search.
+
     Attributes:
-        libros (list): List containing the books in the inventory ordered by ISBN.
+        libros (list|ListaOrdenadaBloques): Books in the inventory ordered by ISBN.
+        motor (str): Storage engine in use ('lista' or 'bloques').
+        _indice_isbn (dict): Hash index {isbn: Libro} for O(1) lookups by ISBN.
     """
 
-    def __init__(self):
+    MOTORES = ('lista', 'bloques')
+
+    def __init__(self, motor='lista'):
         """
         Initializes the general inventory with an empty list of books.
+
+        Args:
+            motor (str, optional): Storage engine, 'lista' or 'bloques'. Default: 'lista'.
+
+        Raises:
+            ValueError: If the storage engine is not supported.
         """
-        self.libros = []
+        if motor not in self.MOTORES:
+            raise ValueError(f"Motor de almacenamiento no soportado: {motor}")
+        self.motor = motor
+        if motor == 'bloques':
+            self.libros = ListaOrdenadaBloques(clave=attrgetter('isbn'))
+        else:
+            self.libros = []
+        self._indice_isbn = {}
 
     def agregar_libro(self, libro):
         """
@@ -26,10 +52,16 @@ class InventarioOrdenado:
         Returns:
             bool: True if the book was added successfully. False if the ISBN already exists in the inventory.
         """
-        # Verificar que el ISBN no exista en el inventario
-        if self.buscar_por_isbn(libro.isbn):
+        # Verificar que el ISBN no exista en el inventario (índice hash, O(1))
+        if libro.isbn in self._indice_isbn:
             return False
         
+        self._indice_isbn[libro.isbn] = libro
+        if self.motor == 'bloques':
+            # El contenedor de bloques ubica la posición con búsqueda binaria
+            self.libros.agregar(libro)
+            return True
+        
         # Agregar al final
         self.libros.append(libro)
         
@@ -45,17 +77,34 @@ class InventarioOrdenado:
         """
         Adds multiple books to the inventory ordered by ISBN.
 
+        Bulk path: the incoming batch is sorted once with Merge Sort, books whose
+        ISBN already exists (in the inventory or earlier in the batch) are
+        dropped, and the batch is merged linearly into the ordered list.
+        Total cost is O(k log k + n) instead of one insertion per book.
+        Use `agregar_libro` for single adds.
+
         Args:
             lista_libros (list): List of Book objects to add to the inventory.
 
         Returns:
             int: Number of books successfully added.
         """
-        agregados = 0
+        # Descartar duplicados contra el inventario y dentro del lote (se conserva el primero)
+        nuevos = {}
         for libro in lista_libros:
-            if self.agregar_libro(libro):
-                agregados += 1
-        return agregados
+            if libro.isbn not in self._indice_isbn and libro.isbn not in nuevos:
+                nuevos[libro.isbn] = libro
+        if not nuevos:
+            return 0
+        
+        # Ordenar el lote una sola vez y mezclarlo con la lista existente
+        lote_ordenado = merge_sort(list(nuevos.values()), criterio='isbn', orden='asc')
+        if self.motor == 'bloques':
+            self.libros.reconstruir(merge(self.libros.copy(), lote_ordenado, 'isbn', 'asc'))
+        else:
+            self.libros[:] = merge(self.libros, lote_ordenado, 'isbn', 'asc')
+        self._indice_isbn.update(nuevos)
+        return len(lote_ordenado)
     
     def eliminar_libro(self, isbn):
         """
@@ -66,16 +115,26 @@ class InventarioOrdenado:
         Returns:
             bool: True if the book was removed, False if the book was not found.
         """
+        if self.motor == 'bloques':
+            if self.libros.eliminar(isbn):
+                del self._indice_isbn[isbn]
+                return True
+            return False
+        
         # Se usa búsqueda binaria para encontrar el libro
         indice = self.buscar_indice_binario(isbn)
         if indice != -1:
             del self.libros[indice]
+            del self._indice_isbn[isbn]
             return True
         return False
     
     def buscar_por_isbn(self, isbn):
         """
-        Searches for a book in the inventory by its ISBN using binary search.
+        Searches for a book in the inventory by its ISBN.
+
+        Uses the hash index (O(1)); the ordered list is kept for range and
+        ordered access, and `buscar_indice_binario` still provides the position.
 
         Args:
             isbn (str): ISBN of the book to search for.
@@ -83,10 +142,7 @@ class InventarioOrdenado:
         Returns:
             Libro|None: Book object if found, None if not found.
         """
-        indice = self.buscar_indice_binario(isbn)
-        if indice != -1:
-            return self.libros[indice]
-        return None
+        return self._indice_isbn.get(isbn)
     
     def buscar_indice_binario(self, isbn):
         """
@@ -98,6 +154,9 @@ class InventarioOrdenado:
         Returns:
             int: Index of the book if found, -1 if not found.
         """
+        if self.motor == 'bloques':
+            return self.libros.indice_de(isbn)
+        
         izquierda = 0
         derecha = len(self.libros) - 1
         
@@ -117,7 +176,7 @@ class InventarioOrdenado:
         Obtains the complete list of books in the ordered inventory.
 
         Returns:
-            list: List of Book objects in the inventory.
+            list|ListaOrdenadaBloques: Books in the inventory ordered by ISBN.
         """
         return self.libros
 
@@ -144,6 +203,7 @@ class InventarioOrdenado:
         Clears all books from the ordered inventory.
         """
         self.libros.clear()
+        self._indice_isbn.clear()
 
     def verificar_orden(self):
         """
@@ -178,4 +238,4 @@ class InventarioOrdenado:
         return f"InventarioOrdenado con {len(self.libros)} libros ordenados por ISBN."
     
     def __repr__(self):
-        return f"InventarioOrdenado({self.libros})"
\ No newline at end of file
+        return f"InventarioOrdenado(motor={self.motor!r}, libros={self.libros})"
\ No newline at end of file
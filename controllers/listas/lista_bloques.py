@@ -0,0 +1,283 @@
+"""
+This structure is used as an optional storage engine for the Ordered Inventory.
+It keeps the elements sorted in a list of small sorted blocks plus an index
+with the maximum key of each block (a sorted-list / B+-tree style layout).
+
+Inserting or deleting only shifts elements inside one block, and the block is
+located with binary search over the block maxima.
+
+Time Complexity:
+    - Insert / delete: O(log b + m) where b = number of blocks and m = block size (~√n moves)
+    - Access by index: O(log b) (prefix offsets are rebuilt lazily after mutations)
+    - Search by key: O(log n)
+"""
+
+from bisect import bisect_left, bisect_right
+
+class ListaOrdenadaBloques:
+    """
+    Sorted container split into blocks with a bisectable index of block maxima.
+
+    Behaves like a read-only sorted list (len, indexing, slicing, iteration),
+    so it can be passed to the binary search algorithms of the system.
+
+    Attributes:
+        _clave (callable): Function that obtains the sort key of an element.
+        _bloques (list): List of sorted blocks (lists of elements).
+        _claves (list): Keys of each block, parallel to _bloques.
+        _maximos (list): Maximum key of each block.
+        _desplazamientos (list|None): Prefix offsets of each block (lazy cache).
+        _tamanio (int): Total number of elements.
+    """
+
+    TAMANIO_BLOQUE = 512 # Se divide un bloque cuando supera el doble de este tamaño
+
+    def __init__(self, elementos=None, clave=None):
+        """
+        Initializes the container.
+
+        Args:
+            elementos (iterable, optional): Initial elements (any order).
+            clave (callable, optional): Sort key function. Default: identity.
+        """
+        self._clave = clave if clave is not None else (lambda elemento: elemento)
+        self._bloques = []
+        self._claves = []
+        self._maximos = []
+        self._desplazamientos = None
+        self._tamanio = 0
+        if elementos:
+            self.reconstruir(sorted(elementos, key=self._clave))
+
+    def reconstruir(self, elementos_ordenados):
+        """
+        Replaces the content with an already sorted sequence in O(n).
+
+        Args:
+            elementos_ordenados (iterable): Elements already sorted by key.
+        """
+        elementos = list(elementos_ordenados)
+        self._bloques = []
+        self._claves = []
+        self._maximos = []
+        for inicio in range(0, len(elementos), self.TAMANIO_BLOQUE):
+            bloque = elementos[inicio:inicio + self.TAMANIO_BLOQUE]
+            claves = [self._clave(elemento) for elemento in bloque]
+            self._bloques.append(bloque)
+            self._claves.append(claves)
+            self._maximos.append(claves[-1])
+        self._tamanio = len(elementos)
+        self._desplazamientos = None
+
+    def agregar(self, elemento):
+        """
+        Inserts an element keeping the order (after any equal keys).
+
+        Args:
+            elemento: Element to insert.
+        """
+        clave = self._clave(elemento)
+        if not self._bloques:
+            self._bloques.append([elemento])
+            self._claves.append([clave])
+            self._maximos.append(clave)
+            self._tamanio = 1
+            self._desplazamientos = None
+            return
+
+        # Ubicar el bloque con búsqueda binaria sobre los máximos
+        b = bisect_right(self._maximos, clave)
+        if b == len(self._bloques):
+            b -= 1
+        claves = self._claves[b]
+        posicion = bisect_right(claves, clave)
+        self._bloques[b].insert(posicion, elemento)
+        claves.insert(posicion, clave)
+        self._maximos[b] = claves[-1]
+        self._tamanio += 1
+
+        if len(claves) > 2 * self.TAMANIO_BLOQUE:
+            self._dividir(b)
+        self._desplazamientos = None
+
+    def indice_de(self, clave):
+        """
+        Searches for the index of the first element with the given key.
+
+        Args:
+            clave: Key to search for.
+
+        Returns:
+            int: Index of the element if found, -1 if not found.
+        """
+        b = bisect_left(self._maximos, clave)
+        if b == len(self._bloques):
+            return -1
+        posicion = bisect_left(self._claves[b], clave)
+        if posicion < len(self._claves[b]) and self._claves[b][posicion] == clave:
+            return self._desplazamiento(b) + posicion
+        return -1
+
+    def buscar(self, clave):
+        """
+        Searches for the first element with the given key.
+
+        Args:
+            clave: Key to search for.
+
+        Returns:
+            any|None: Element if found, None otherwise.
+        """
+        b = bisect_left(self._maximos, clave)
+        if b == len(self._bloques):
+            return None
+        posicion = bisect_left(self._claves[b], clave)
+        if posicion < len(self._claves[b]) and self._claves[b][posicion] == clave:
+            return self._bloques[b][posicion]
+        return None
+
+    def iterar_desde(self, clave):
+        """
+        Iterates the elements in order starting at the first key >= clave.
+
+        Args:
+            clave: Lower bound key.
+
+        Yields:
+            any: Elements in ascending key order.
+        """
+        b = bisect_left(self._maximos, clave)
+        if b == len(self._bloques):
+            return
+        posicion = bisect_left(self._claves[b], clave)
+        yield from self._bloques[b][posicion:]
+        for bloque in self._bloques[b + 1:]:
+            yield from bloque
+
+    def eliminar(self, clave):
+        """
+        Removes the first element with the given key.
+
+        Args:
+            clave: Key of the element to remove.
+
+        Returns:
+            bool: True if an element was removed, False if not found.
+        """
+        b = bisect_left(self._maximos, clave)
+        if b == len(self._bloques):
+            return False
+        posicion = bisect_left(self._claves[b], clave)
+        if posicion < len(self._claves[b]) and self._claves[b][posicion] == clave:
+            self._eliminar_posicion(b, posicion)
+            return True
+        return False
+
+    def eliminar_en(self, indice):
+        """
+        Removes and returns the element at the given index.
+
+        Args:
+            indice (int): Index of the element to remove.
+
+        Returns:
+            any: The removed element.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        b, posicion = self._ubicar(indice)
+        elemento = self._bloques[b][posicion]
+        self._eliminar_posicion(b, posicion)
+        return elemento
+
+    def clear(self):
+        """Removes all elements."""
+        self.reconstruir([])
+
+    def copy(self):
+        """
+        Returns the elements as a new list.
+
+        Returns:
+            list: Sorted list with all elements.
+        """
+        return list(self)
+
+    def _eliminar_posicion(self, b, posicion):
+        """Removes the element at (block, position) and fixes the index."""
+        del self._bloques[b][posicion]
+        del self._claves[b][posicion]
+        self._tamanio -= 1
+        if self._claves[b]:
+            self._maximos[b] = self._claves[b][-1]
+        else:
+            # Eliminar bloques vacíos
+            del self._bloques[b]
+            del self._claves[b]
+            del self._maximos[b]
+        self._desplazamientos = None
+
+    def _dividir(self, b):
+        """Splits an oversized block in two halves."""
+        mitad = len(self._bloques[b]) // 2
+        self._bloques.insert(b + 1, self._bloques[b][mitad:])
+        self._claves.insert(b + 1, self._claves[b][mitad:])
+        del self._bloques[b][mitad:]
+        del self._claves[b][mitad:]
+        self._maximos[b] = self._claves[b][-1]
+        self._maximos.insert(b + 1, self._claves[b + 1][-1])
+
+    def _desplazamiento(self, b):
+        """Returns the global index of the first element of block b."""
+        if self._desplazamientos is None:
+            acumulado = 0
+            self._desplazamientos = []
+            for bloque in self._bloques:
+                self._desplazamientos.append(acumulado)
+                acumulado += len(bloque)
+        return self._desplazamientos[b]
+
+    def _ubicar(self, indice):
+        """Converts a global index into (block, position)."""
+        if indice < 0:
+            indice += self._tamanio
+        if not 0 <= indice < self._tamanio:
+            raise IndexError("Índice fuera de rango")
+        self._desplazamiento(0)
+        b = bisect_right(self._desplazamientos, indice) - 1
+        return b, indice - self._desplazamientos[b]
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fin, paso = indice.indices(self._tamanio)
+            if paso != 1:
+                return [self[i] for i in range(inicio, fin, paso)]
+            return self._rebanada(inicio, fin)
+        b, posicion = self._ubicar(indice)
+        return self._bloques[b][posicion]
+
+    def _rebanada(self, inicio, fin):
+        """Returns the elements in [inicio, fin) reading whole blocks."""
+        resultado = []
+        if inicio >= fin:
+            return resultado
+        b, posicion = self._ubicar(inicio)
+        restantes = fin - inicio
+        while restantes > 0:
+            parte = self._bloques[b][posicion:posicion + restantes]
+            resultado.extend(parte)
+            restantes -= len(parte)
+            b += 1
+            posicion = 0
+        return resultado
+
+    def __iter__(self):
+        for bloque in self._bloques:
+            yield from bloque
+
+    def __len__(self):
+        return self._tamanio
+
+    def __repr__(self):
+        return f"ListaOrdenadaBloques(elementos={self._tamanio}, bloques={len(self._bloques)})"
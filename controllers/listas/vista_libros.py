@@ -0,0 +1,115 @@
+"""
+This structure is used to hand out the books of the General Inventory
+without copying the whole catalog on every read.
+
+A VistaLibros is a read-only sequence over a range of a list. The inventory
+gives out views of its own list (snapshots) and applies copy-on-write: the
+list is only copied if a book is removed while a snapshot is alive. Books
+added later are appended after the end of the view, so they never alter it.
+
+The list may contain removed slots (None) that the inventory has not
+compacted yet. The view knows how many there are: iteration skips them, and
+the first access by index or slice compacts the range once inside the view.
+
+Time Complexity:
+    - Obtain a snapshot: O(1)
+    - Length: O(1)
+    - Access by index, slicing: O(1) (O(n) once if the range has removed slots)
+    - Iteration: O(n) with no extra copy
+"""
+
+from collections.abc import Sequence
+from itertools import islice
+
+class VistaLibros(Sequence):
+    """
+    Read-only zero-copy view over a range of a list of books.
+
+    Supports len(), indexing, slicing (which returns another view), iteration,
+    `in`, index() and count(). Use copy() to obtain a mutable list.
+
+    Attributes:
+        version (int): Version of the inventory when the view was created.
+        _lista (list): Underlying list (never modified through the view).
+        _inicio (int): First index of the range.
+        _fin (int): End of the range (exclusive).
+        _huecos (int): Removed slots (None) inside the range.
+        _origen (VistaLibros|None): View this one was sliced from (kept alive
+            so the source still sees its list as shared).
+    """
+
+    __slots__ = ('_lista', '_inicio', '_fin', '_huecos', '_origen', 'version', '__weakref__')
+
+    def __init__(self, lista, inicio=0, fin=None, version=0, huecos=0, origen=None):
+        """
+        Initializes the view.
+
+        Args:
+            lista (list): List to view.
+            inicio (int, optional): First index of the range. Default: 0.
+            fin (int, optional): End of the range (exclusive). Default: len(lista).
+            version (int, optional): Version of the source. Default: 0.
+            huecos (int, optional): Removed slots (None) inside the range. Default: 0.
+            origen (VistaLibros, optional): View this one was sliced from. Default: None.
+        """
+        self._lista = lista
+        self._inicio = inicio
+        self._fin = len(lista) if fin is None else fin
+        self._huecos = huecos
+        self._origen = origen
+        self.version = version
+
+    def __len__(self):
+        return self._fin - self._inicio - self._huecos
+
+    def __getitem__(self, indice):
+        if self._huecos:
+            self._compactar()
+        if isinstance(indice, slice):
+            inicio, fin, paso = indice.indices(len(self))
+            if paso != 1:
+                return VistaLibros(self.copy()[inicio:fin:paso], version=self.version)
+            fin = max(inicio, fin)
+            return VistaLibros(self._lista, self._inicio + inicio, self._inicio + fin, self.version,
+                               origen=self if self._origen is None else self._origen)
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fuera de rango")
+        return self._lista[self._inicio + indice]
+
+    def __iter__(self):
+        # Generador: la vista sigue viva (y la lista compartida) mientras se recorre
+        if self._huecos:
+            # Las ranuras eliminadas son None (los libros siempre son verdaderos)
+            yield from filter(None, islice(self._lista, self._inicio, self._fin))
+        elif self._inicio == 0 and self._fin == len(self._lista):
+            yield from self._lista
+        else:
+            yield from islice(self._lista, self._inicio, self._fin)
+
+    def copy(self):
+        """
+        Obtains a mutable copy of the books of the view.
+
+        Returns:
+            list: New list with the books.
+        """
+        if self._huecos:
+            return list(filter(None, islice(self._lista, self._inicio, self._fin)))
+        return self._lista[self._inicio:self._fin]
+
+    def _compactar(self):
+        """Replaces the range with a private list without removed slots (O(n), once)."""
+        self._lista = self.copy()
+        self._inicio, self._fin, self._huecos = 0, len(self._lista), 0
+
+    def __eq__(self, otro):
+        if isinstance(otro, (VistaLibros, list, tuple)):
+            return len(self) == len(otro) and all(a is b or a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"VistaLibros(libros={len(self)}, version={self.version})"
@@ -4,14 +4,32 @@ adapted to work with Book objects:
 
 - Insertion Sort: To maintain the inventory ordered by ISBN
 - Merge Sort: To generate global reports ordered by any criteria
+- Bounded heap selection: To list only the first K books of a report
+- External Merge Sort: To report catalog files larger than memory
+- Parallel Merge Sort: To sort millions of books with several processes
 Use:
     from controllers.ordenamiento import ordenar_por_insercion, merge_sort
     
     # Insertion Sort
     ordenar_por_insercion(libros, criterio='isbn')
     
+    # Importación casi ordenada: detectar tramos ya ordenados y mezclarlos
+    ordenamiento_insercion(libros, criterio='isbn', metodo='tramos')
+    
     # Merge Sort
     libros_ordenados = merge_sort(libros, criterio='valor', orden='desc')
+    
+    # Varios criterios en una sola pasada estable
+    reporte = merge_sort(libros, [('genero', 'asc'), ('autor', 'asc'), ('valor', 'desc')])
+    
+    # Solo los 100 más valiosos (O(n log K))
+    primeros = seleccionar_primeros(libros, 100, criterio='valor', orden='desc')
+    
+    # Varios procesos (por debajo del umbral se ordena en serie)
+    libros_ordenados = merge_sort(libros, 'titulo', procesos=None)
+    
+    # Catálogos más grandes que la memoria (tramos en archivos temporales)
+    generar_reporte_externo(['union_1.csv', 'union_2.json'], 'titulo', 'asc', formato='csv')
 """
 
 from .insercion import (
@@ -23,7 +41,32 @@ from .insercion import (
 
 from .merge_sort import (
     merge_sort,
-    generar_reporte_global
+    merge_sort_recursivo,
+    generar_reporte_global,
+    generar_reporte_externo,
+    interpretar_criterios,
+    interpretar_limite,
+    describir_criterios
+)
+
+from .merge_sort_iterativo import (
+    merge_sort_iterativo,
+    extraer_claves,
+    ordenar_posiciones,
+    normalizar_criterios,
+    ClaveInversa
+)
+
+from .seleccion import seleccionar_primeros
+
+from .merge_sort_paralelo import (
+    merge_sort_paralelo,
+    ordenar_posiciones_paralelo
+)
+
+from .merge_sort_externo import (
+    OrdenamientoExterno,
+    ordenar_externo
 )
 
 __all__ = [
@@ -32,5 +75,20 @@ __all__ = [
     'verificar_orden',
     'contar_comparaciones_insercion',
     'merge_sort',
-    'generar_reporte_global'
+    'merge_sort_recursivo',
+    'generar_reporte_global',
+    'generar_reporte_externo',
+    'interpretar_criterios',
+    'interpretar_limite',
+    'describir_criterios',
+    'merge_sort_iterativo',
+    'extraer_claves',
+    'ordenar_posiciones',
+    'normalizar_criterios',
+    'ClaveInversa',
+    'seleccionar_primeros',
+    'merge_sort_paralelo',
+    'ordenar_posiciones_paralelo',
+    'OrdenamientoExterno',
+    'ordenar_externo'
 ]
\ No newline at end of file
@@ -3,15 +3,36 @@ This algorithm is used to keep the inventory sorted every time
 a new book is added to the system, ensuring that the list is always 
 ordered by ISBN in ascending order to allow binary search.
 
+Three methods are available (metodo):
+    - 'lineal': classic Insertion Sort, scanning back one book at a time.
+    - 'binaria': the keys are read once, the insertion point is found by
+      binary search (bisect) and the books are moved with one slice shift.
+    - 'tramos': already sorted stretches (natural runs) are detected, short
+      ones are extended with binary insertion and the runs are merged.
+      Suited to nearly sorted imports (e.g. a nightly export by ISBN).
+All three are stable and leave the same result.
+
 Time Complexity:
     - Best case: O(n) -> the list is already sorted
-    - Average case: O(n²)
-    - Worst case: O(n²)
+    - Average case: O(n²) moves ('lineal' also O(n²) comparisons,
+      'binaria' O(n log n) comparisons), O(n log n) for 'tramos'
+    - Worst case: O(n²), O(n log n) for 'tramos'
 
-Space Complexity: O(1) - in-place sorting
+Space Complexity: O(1) - in-place sorting ('binaria' O(n) for the keys,
+'tramos' O(n) for the keys and the merges)
 """
 
-def ordenamiento_insercion(lista_libros, criterio='isbn', orden='asc'):
+from bisect import bisect_right
+from operator import gt, lt
+
+from controllers.ordenamiento.merge_sort_iterativo import extraer_claves
+
+METODOS = ('lineal', 'binaria', 'tramos')
+
+# Tamaño mínimo de un tramo antes de mezclar (por debajo: inserción binaria)
+MINIMO_TRAMO = 32
+
+def ordenamiento_insercion(lista_libros, criterio='isbn', orden='asc', metodo='lineal'):
     """
     Sorts a list of books using the insertion sort algorithm.
 
@@ -25,10 +46,25 @@ def ordenamiento_insercion(lista_libros, criterio='isbn', orden='asc'):
             Default: 'isbn'.
         orden (str, optional): 'asc' for ascending, 'desc' for descending.
             Default: 'asc'.
+        metodo (str, optional): 'lineal', 'binaria' or 'tramos'.
+            Default: 'lineal'.
     
     Returns:
         list: The same sorted list (modified in-place).
+
+    Raises:
+        ValueError: If the method is not supported.
     """
+    if metodo not in METODOS:
+        raise ValueError(f"Método no soportado: {metodo}")
+    if metodo != 'lineal':
+        claves = extraer_claves(lista_libros, criterio)
+        if metodo == 'binaria':
+            _insercion_binaria(lista_libros, claves, 0, 1, len(lista_libros), orden == 'desc')
+        else:
+            _ordenar_por_tramos(lista_libros, claves, orden == 'desc')
+        return lista_libros
+
     n = len(lista_libros)
 
     # Iterar sobre el segundo elemento
@@ -61,6 +97,8 @@ def insertar_libro_ordenado(lista_ordenada, libro_nuevo, criterio='isbn'):
     
     This is an optimization of Insertion Sort to add a single element
     to a list that is already sorted. Used in the Ordered Inventory.
+    The position is found by binary search (after the equal ones) and the
+    list is shifted once by list.insert.
     
     Args:
         lista_ordenada (list): Already sorted list of books.
@@ -72,15 +110,16 @@ def insertar_libro_ordenado(lista_ordenada, libro_nuevo, criterio='isbn'):
         int: Index where the book was inserted.
     """
     valor_nuevo = obtener_valor_criterio(libro_nuevo, criterio)
-    # Agregar al final
-    lista_ordenada.append(libro_nuevo)
-    # Encontrar la posición correcta y mover hacia atrás
-    i = len(lista_ordenada) - 1
-    while i > 0 and obtener_valor_criterio(lista_ordenada[i - 1], criterio) > valor_nuevo:
-        # Intercambiar con el elemento anterior
-        lista_ordenada[i], lista_ordenada[i - 1] = lista_ordenada[i - 1], lista_ordenada[i] 
-        i -= 1
-    return i
+    # Búsqueda binaria: primera posición con un valor mayor (estable)
+    inicio, fin = 0, len(lista_ordenada)
+    while inicio < fin:
+        medio = (inicio + fin) // 2
+        if valor_nuevo < obtener_valor_criterio(lista_ordenada[medio], criterio):
+            fin = medio
+        else:
+            inicio = medio + 1
+    lista_ordenada.insert(inicio, libro_nuevo)
+    return inicio
 
 def obtener_valor_criterio(libro, criterio):
     """
@@ -127,19 +166,36 @@ def verificar_orden(lista_libros, criterio='isbn', orden='asc'):
                 return False
     return True
 
-def contar_comparaciones_insercion(lista_libros, criterio='isbn'):
+def contar_comparaciones_insercion(lista_libros, criterio='isbn', metodo='lineal'):
     """
     Counts the number of comparisons made during Insertion Sort.
     
-    Useful for complexity analysis and algorithm demonstration.
+    Useful for complexity analysis and algorithm demonstration. A movement
+    is every book written to a new position (a shift, the insertion itself
+    or a book placed by a merge).
     
     Args:
         lista_libros (list): List of Book objects to sort.
         criterio (str, optional): Attribute by which to sort. Default: 'isbn'.
+        metodo (str, optional): 'lineal', 'binaria' or 'tramos'. Default: 'lineal'.
     
     Returns:
         tuple: (lista_ordenada, num_comparaciones, num_movimientos)
+
+    Raises:
+        ValueError: If the method is not supported.
     """
+    if metodo not in METODOS:
+        raise ValueError(f"Método no soportado: {metodo}")
+    if metodo != 'lineal':
+        contador = {'comparaciones': 0, 'movimientos': 0}
+        claves = extraer_claves(lista_libros, criterio)
+        if metodo == 'binaria':
+            _insercion_binaria(lista_libros, claves, 0, 1, len(lista_libros), False, contador)
+        else:
+            _ordenar_por_tramos(lista_libros, claves, False, contador)
+        return lista_libros, contador['comparaciones'], contador['movimientos']
+
     n = len(lista_libros)
     comparaciones = 0
     movimientos = 0
@@ -159,4 +215,119 @@ def contar_comparaciones_insercion(lista_libros, criterio='isbn'):
         lista_libros[j + 1] = libro_actual
         if j + 1 != i:
             movimientos += 1
-    return lista_libros, comparaciones, movimientos
\ No newline at end of file
+    return lista_libros, comparaciones, movimientos
+
+def _insercion_binaria(lista_libros, claves, inicio, ordenado_hasta, fin, descendente, contador=None):
+    """
+    Extends the sorted stretch [inicio, ordenado_hasta) to [inicio, fin), in place.
+
+    The keys are kept parallel to the books. A book already in place costs
+    one comparison; otherwise the insertion point is found by binary search
+    after the equal keys (stable) and both lists are shifted with one slice
+    assignment.
+    """
+    for i in range(max(ordenado_hasta, inicio + 1), fin):
+        clave = claves[i]
+        if contador is not None:
+            contador['comparaciones'] += 1
+        # Ya está en su lugar (caso común en listas casi ordenadas)
+        if not ((clave > claves[i - 1]) if descendente else (clave < claves[i - 1])):
+            continue
+        if contador is None and not descendente:
+            destino = bisect_right(claves, clave, inicio, i - 1)
+        else:
+            destino = _posicion_binaria(claves, clave, inicio, i - 1, descendente, contador)
+        libro = lista_libros[i]
+        # Desplazar el tramo en una sola operación de corte
+        lista_libros[destino + 1:i + 1] = lista_libros[destino:i]
+        claves[destino + 1:i + 1] = claves[destino:i]
+        lista_libros[destino] = libro
+        claves[destino] = clave
+        if contador is not None:
+            contador['movimientos'] += i - destino + 1
+
+def _posicion_binaria(claves, clave, inicio, fin, descendente, contador=None):
+    """Position of a key in the sorted claves[inicio:fin], after the equal ones."""
+    while inicio < fin:
+        medio = (inicio + fin) // 2
+        if contador is not None:
+            contador['comparaciones'] += 1
+        if (clave > claves[medio]) if descendente else (clave < claves[medio]):
+            fin = medio
+        else:
+            inicio = medio + 1
+    return inicio
+
+def _ordenar_por_tramos(lista_libros, claves, descendente, contador=None):
+    """
+    Natural-run Insertion Sort: detects the sorted stretches, extends the
+    short ones to MINIMO_TRAMO with binary insertion and merges them bottom-up.
+    """
+    # precede(a, b): a debe ir estrictamente antes que b
+    precede = gt if descendente else lt
+    n = len(lista_libros)
+    inicios = []
+    inicio = 0
+    while inicio < n:
+        fin = inicio + 1
+        if fin < n:
+            if contador is not None:
+                contador['comparaciones'] += 1
+            if precede(claves[fin], claves[inicio]):
+                # Tramo estrictamente invertido: se invierte (estable)
+                while fin + 1 < n and precede(claves[fin + 1], claves[fin]):
+                    fin += 1
+                fin += 1
+                lista_libros[inicio:fin] = lista_libros[inicio:fin][::-1]
+                claves[inicio:fin] = claves[inicio:fin][::-1]
+                if contador is not None:
+                    contador['comparaciones'] += fin - inicio - 2 + (fin < n)
+                    contador['movimientos'] += fin - inicio
+            else:
+                while fin + 1 < n and not precede(claves[fin + 1], claves[fin]):
+                    fin += 1
+                fin += 1
+                if contador is not None:
+                    contador['comparaciones'] += fin - inicio - 2 + (fin < n)
+        # Tramo corto: extenderlo con inserción binaria
+        if fin - inicio < MINIMO_TRAMO and fin < n:
+            limite = min(n, inicio + MINIMO_TRAMO)
+            _insercion_binaria(lista_libros, claves, inicio, fin, limite, descendente, contador)
+            fin = limite
+        inicios.append(inicio)
+        inicio = fin
+    inicios.append(n)
+
+    # Mezclar tramos vecinos hasta que quede uno
+    while len(inicios) > 2:
+        for t in range(0, len(inicios) - 2, 2):
+            _mezclar_tramos(lista_libros, claves, inicios[t], inicios[t + 1], inicios[t + 2], precede, contador)
+        inicios = inicios[::2] + ([n] if len(inicios) % 2 == 0 else [])
+
+def _mezclar_tramos(lista_libros, claves, inicio, medio, fin, precede, contador=None):
+    """Merges the sorted stretches [inicio, medio) and [medio, fin) in place (stable)."""
+    if contador is not None:
+        contador['comparaciones'] += 1
+    # Tramos ya en orden entre sí: nada que mover
+    if not precede(claves[medio], claves[medio - 1]):
+        return
+    izquierda = lista_libros[inicio:medio]
+    claves_izquierda = claves[inicio:medio]
+    i, j, k = 0, medio, inicio
+    largo = medio - inicio
+    while i < largo and j < fin:
+        if precede(claves[j], claves_izquierda[i]):
+            lista_libros[k] = lista_libros[j]
+            claves[k] = claves[j]
+            j += 1
+        else:
+            lista_libros[k] = izquierda[i]
+            claves[k] = claves_izquierda[i]
+            i += 1
+        k += 1
+    if contador is not None:
+        contador['comparaciones'] += (i + j - medio)
+        contador['movimientos'] += k - inicio + (largo - i)
+    # Los restantes de la derecha ya están en su lugar
+    lista_libros[k:k + largo - i] = izquierda[i:]
+    claves[k:k + largo - i] = claves_izquierda[i:]
@@ -5,18 +5,76 @@ and guarantees a performance of O(n log n).
 
 Time Complexity: O(n log n) in all cases
 Space Complexity: O(n) - requires additional space for merging
+
+merge_sort runs on the bottom-up engine of merge_sort_iterativo (keys
+extracted once, natural runs, one auxiliary buffer); the classic recursive
+version is kept as merge_sort_recursivo.
+
+Reports limited to the first K books (limite) use the bounded heap of
+seleccion.seleccionar_primeros instead of sorting the whole inventory.
+
+Catalog files larger than memory are reported with generar_reporte_externo,
+which streams them through the External Merge Sort (merge_sort_externo) into
+the csv/json writers.
 """
 
 import csv
 import json
 from datetime import datetime
+from itertools import islice
 import os
+import textwrap
 
 from models import libro
+from controllers.ordenamiento.merge_sort_iterativo import merge_sort_iterativo, normalizar_criterios, ORDENES
+from controllers.ordenamiento.seleccion import seleccionar_primeros
+from controllers.ordenamiento.merge_sort_paralelo import merge_sort_paralelo
+from controllers.ordenamiento.merge_sort_externo import (
+    CAMPOS_REGISTRO,
+    MAXIMO_EN_MEMORIA,
+    OrdenamientoExterno,
+    registro_libro
+)
+from controllers.adquisicion.lector_archivo import LectorArchivo
+
+# Columnas de los reportes csv/json
+CAMPOS_FILA = ('posicion',) + CAMPOS_REGISTRO
+
+# Columnas por las que el usuario puede ordenar un reporte
+CAMPOS_ORDENABLES = frozenset(CAMPOS_REGISTRO)
+
+def merge_sort(lista_libros, criterio='valor', orden='asc', procesos=1):
+    """
+    Sorts a list of books using Merge Sort (stable).
+
+    Uses the bottom-up engine: the keys are read once, already sorted
+    stretches are detected and merged with a single auxiliary buffer.
+    With procesos != 1, large lists are sorted in fragments by several
+    processes (merge_sort_paralelo); small ones stay serial.
+    
+    Example: merge_sort(libros, [('genero', 'asc'), ('autor', 'asc'), ('valor', 'desc')])
+    
+    Args:
+        lista_libros (list): List of Book objects to sort.
+        criterio (str|list, optional): Attribute by which to sort, or a list
+            of (attribute, orden) pairs compiled into a single composite key.
+            Options: 'isbn', 'title', 'author', 'weight', 'value'.
+            Default: 'value'.
+        orden (str, optional): 'asc' for ascending, 'desc' for descending.
+            Default: 'asc'.
+        procesos (int, optional): Worker processes; None uses every core.
+            Default: 1 (serial).
+    
+    Returns:
+        list: New sorted list (does not modify the original).
+    """
+    if procesos != 1:
+        return merge_sort_paralelo(lista_libros, criterio, orden, procesos)
+    return merge_sort_iterativo(lista_libros, criterio, orden)
 
-def merge_sort(lista_libros, criterio='valor', orden='asc'):
+def merge_sort_recursivo(lista_libros, criterio='valor', orden='asc'):
     """
-    Sorts a list of books using the Merge Sort algorithm.
+    Sorts a list of books using the classic recursive Merge Sort algorithm.
 
     This algorithm recursively divides the list into halves, 
     sorts them, and then merges them. Efficient for large lists.
@@ -40,8 +98,8 @@ def merge_sort(lista_libros, criterio='valor', orden='asc'):
     izquierda = lista_libros[:medio]
     derecha = lista_libros[medio:]
     # Ordenar recursivamente cada mitad
-    izquierda_ordenada = merge_sort(izquierda, criterio, orden)
-    derecha_ordenada = merge_sort(derecha, criterio, orden)
+    izquierda_ordenada = merge_sort_recursivo(izquierda, criterio, orden)
+    derecha_ordenada = merge_sort_recursivo(derecha, criterio, orden)
     # Combinar las dos mitades ordenadas
     return merge(izquierda_ordenada, derecha_ordenada, criterio, orden)
 
@@ -97,7 +155,67 @@ def obtener_valor_criterio(libro, criterio):
         raise AttributeError(f"El libro no tiene el atributo '{criterio}'")
     return getattr(libro, criterio)
 
-def generar_reporte_global(lista_libros, criterio='valor', orden='desc', formato='txt', ruta_archivo=None):
+def interpretar_criterios(texto, orden='asc'):
+    """
+    Reads sorting criteria typed by the user, e.g. "genero asc, autor, valor desc".
+    
+    Args:
+        texto (str): Comma-separated attributes, each optionally followed by 'asc' or 'desc'.
+        orden (str, optional): Direction of the attributes typed without one. Default: 'asc'.
+    
+    Returns:
+        list: List of (campo, orden) pairs.
+    
+    Raises:
+        ValueError: If there are no criteria, an attribute is not a report
+            column (CAMPOS_ORDENABLES) or a direction is not 'asc'/'desc'.
+    """
+    criterios = []
+    for parte in texto.split(','):
+        palabras = parte.split()
+        if not palabras:
+            continue
+        if len(palabras) > 2 or (len(palabras) == 2 and palabras[1].lower() not in ORDENES):
+            raise ValueError(f"Criterio no válido: {parte.strip()}")
+        if palabras[0] not in CAMPOS_ORDENABLES:
+            raise ValueError(f"Campo no válido: {palabras[0]} (opciones: {', '.join(CAMPOS_REGISTRO)})")
+        criterios.append((palabras[0], palabras[1].lower() if len(palabras) == 2 else orden))
+    return normalizar_criterios(criterios)
+
+def interpretar_limite(texto):
+    """
+    Reads the number of books of a report typed by the user (empty = all).
+    
+    Args:
+        texto (str): Positive integer, or an empty string.
+    
+    Returns:
+        int|None: Number of books, or None to list the whole inventory.
+    
+    Raises:
+        ValueError: If the text is not a positive integer.
+    """
+    texto = texto.strip()
+    if not texto:
+        return None
+    if not texto.isdigit() or int(texto) == 0:
+        raise ValueError(f"Cantidad no válida: {texto}")
+    return int(texto)
+
+def describir_criterios(criterio, orden='asc'):
+    """
+    Describes the sorting criteria for a report header, e.g. "GENERO (ASC), VALOR (DESC)".
+    
+    Args:
+        criterio (str|list): Attribute or list of (attribute, orden) pairs.
+        orden (str, optional): Direction of a single attribute. Default: 'asc'.
+    
+    Returns:
+        str: Description of the criteria.
+    """
+    return ", ".join(f"{campo.upper()} ({direccion.upper()})" for campo, direccion in normalizar_criterios(criterio, orden))
+
+def generar_reporte_global(lista_libros, criterio='valor', orden='desc', formato='txt', ruta_archivo=None, totales=None, limite=None, procesos=1):
     """
     Generates a comprehensive inventory report sorted by a criterion.
     
@@ -106,46 +224,48 @@ def generar_reporte_global(lista_libros, criterio='valor', orden='desc', formato
     
     Args:
         lista_libros (list): List of Book objects.
-        criterio (str, optional): Attribute by which to sort. Default: 'value'.
-        orden (str, optional): 'asc' or 'desc'. Default: 'desc'.
+        criterio (str|list, optional): Attribute by which to sort, or a list
+            of (attribute, orden) pairs (e.g. genero asc, autor asc, valor desc)
+            sorted in a single stable pass. Default: 'value'.
+        orden (str, optional): 'asc' or 'desc' (for a single attribute). Default: 'desc'.
         formato (str, optional): Report format: 'txt', 'csv', 'json'.
             Default: 'txt'.
         ruta_archivo (str, optional): Path to save the report.
             If None, it is automatically generated in the reports/ folder.
+        totales (tuple, optional): (valor_total, peso_total) of lista_libros
+            already computed by the caller (e.g. GestorBiblioteca.totales_inventario()).
+            Default: None (totals computed from the Book objects).
+        limite (int, optional): Only list the first K books (e.g. the 100
+            most valuable), selected with a bounded heap in O(n log K).
+            The totals still cover the whole inventory. Default: None (all).
+        procesos (int, optional): Worker processes for the full sort (None
+            uses every core; small inventories stay serial). Default: 1.
     
     Returns:
         str|list: Generated report (format depends on the type).
+
+    Raises:
+        ValueError: If the limit is negative.
     """
-    # Crear carpeta reports/ si no existe y se va a guardar archivo
-    reports = 'reports'
-    if not os.path.exists(reports):
-        os.makedirs(reports)
-        print(f"Carpeta '{reports}/' creada")
-    
-    # Ordenar libros usando Merge Sort
-    libros_ordenados = merge_sort(lista_libros, criterio, orden)
-    
-    # Generar ruta por defecto si no se especificó
-    if ruta_archivo is None:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        if formato == 'txt':
-            ruta_archivo = os.path.join(reports, f'reporte_{criterio}_{timestamp}.txt')
-        elif formato == 'csv':
-            ruta_archivo = os.path.join(reports, f'reporte_{criterio}_{timestamp}.csv')
-        elif formato == 'json':
-            ruta_archivo = os.path.join(reports, f'reporte_{criterio}_{timestamp}.json')
+    # Ordenar libros usando Merge Sort (una sola pasada aunque haya varios criterios)
+    criterios = normalizar_criterios(criterio, orden)
+    if limite is None:
+        libros_ordenados = merge_sort(lista_libros, criterios, procesos=procesos)
     else:
-        # Si se especificó ruta pero no incluye la carpeta reports/, agregarla
-        if not ruta_archivo.startswith(reports):
-            ruta_archivo = os.path.join(reports, os.path.basename(ruta_archivo))
+        # Solo los primeros K: montículo acotado, sin ordenar todo el inventario
+        libros_ordenados = seleccionar_primeros(lista_libros, limite, criterios)
+    nombre_criterio = "_".join(campo for campo, _ in criterios)
+    if limite is not None:
+        nombre_criterio = f"top{limite}_{nombre_criterio}"
+    ruta_archivo = _ruta_reporte(ruta_archivo, formato, nombre_criterio)
 
     # Generar reporte según el formato
     if formato == 'txt':
-        reporte = _generar_reporte_txt(libros_ordenados, criterio, orden)
+        reporte = _generar_reporte_txt(libros_ordenados, criterios, orden, totales, lista_libros)
     elif formato == 'csv':
         reporte = _generar_reporte_csv(libros_ordenados, ruta_archivo)
     elif formato == 'json':
-        reporte = _generar_reporte_json(libros_ordenados, ruta_archivo)
+        reporte = _generar_reporte_json(libros_ordenados, ruta_archivo, len(lista_libros))
     else:
         raise ValueError(f"Formato no soportado: {formato}")
     
@@ -156,14 +276,107 @@ def generar_reporte_global(lista_libros, criterio='valor', orden='desc', formato
         print(f"✓ Reporte guardado en: {ruta_archivo}")
     return reporte
 
-def _generar_reporte_txt(libros_ordenados, criterio, orden):
+def generar_reporte_externo(rutas_entrada, criterio='valor', orden='desc', formato='csv', ruta_archivo=None,
+                            limite=None, maximo_en_memoria=MAXIMO_EN_MEMORIA, directorio_temporal=None):
+    """
+    Generates a csv/json report of catalog files larger than memory.
+
+    The books are streamed from the files (LectorArchivo.iterar_libros),
+    sorted with the External Merge Sort (runs of maximo_en_memoria books
+    spilled to temporary files) and the k-way merge is written straight to
+    the report, so memory does not depend on the size of the catalog.
+    
+    Example: generar_reporte_externo(['union_1.csv', 'union_2.json'], 'titulo', 'asc', formato='json')
+
+    Args:
+        rutas_entrada (str|list): Path or paths of .csv/.json catalog files.
+        criterio (str|list, optional): Attribute by which to sort, or a list
+            of (attribute, orden) pairs. Default: 'valor'.
+        orden (str, optional): 'asc' or 'desc' (for a single attribute). Default: 'desc'.
+        formato (str, optional): Report format: 'csv' or 'json'. Default: 'csv'.
+        ruta_archivo (str, optional): Path to save the report.
+            If None, it is automatically generated in the reports/ folder.
+        limite (int, optional): Only write the first K books. Default: None (all).
+        maximo_en_memoria (int, optional): Books sorted in memory per run
+            (peak memory). Default: MAXIMO_EN_MEMORIA.
+        directorio_temporal (str, optional): Where to spill the runs.
+            Default: None (system temporary directory).
+
+    Returns:
+        dict: {'ruta_archivo', 'total_libros', 'libros_listados', 'tramos'}.
+
+    Raises:
+        FileNotFoundError: If an input file does not exist.
+        ValueError: If the format, the limit or an input file is not valid.
+    """
+    if formato not in ('csv', 'json'):
+        raise ValueError(f"Formato no soportado para el ordenamiento externo: {formato}")
+    if limite is not None and limite < 0:
+        raise ValueError(f"El límite debe ser mayor o igual a 0: {limite}")
+    if isinstance(rutas_entrada, str):
+        rutas_entrada = [rutas_entrada]
+
+    criterios = normalizar_criterios(criterio, orden)
+    nombre_criterio = "_".join(campo for campo, _ in criterios)
+    if limite is not None:
+        nombre_criterio = f"top{limite}_{nombre_criterio}"
+    ruta_archivo = _ruta_reporte(ruta_archivo, formato, nombre_criterio)
+
+    with OrdenamientoExterno(criterios, maximo_en_memoria=maximo_en_memoria,
+                             directorio_temporal=directorio_temporal) as ordenamiento:
+        for ruta in rutas_entrada:
+            ordenamiento.agregar(LectorArchivo.iterar_libros(ruta))
+        tramos = len(ordenamiento.tramos)
+        registros = ordenamiento.registros()
+        libros_listados = ordenamiento.total
+        if limite is not None:
+            registros = islice(registros, limite)
+            libros_listados = min(limite, ordenamiento.total)
+        if formato == 'csv':
+            _escribir_csv(registros, ruta_archivo)
+        else:
+            _escribir_json(registros, ruta_archivo, ordenamiento.total, libros_listados)
+
+    print(f"Reporte {formato.upper()} guardado en: {ruta_archivo} "
+          f"({libros_listados} de {ordenamiento.total} libros, {tramos} tramos)")
+    return {
+        'ruta_archivo': ruta_archivo,
+        'total_libros': ordenamiento.total,
+        'libros_listados': libros_listados,
+        'tramos': tramos
+    }
+
+def _ruta_reporte(ruta_archivo, formato, nombre_criterio):
+    """Path of a report inside the reports/ folder (created if needed)."""
+    # Crear carpeta reports/ si no existe y se va a guardar archivo
+    reports = 'reports'
+    if not os.path.exists(reports):
+        os.makedirs(reports)
+        print(f"Carpeta '{reports}/' creada")
+
+    # Generar ruta por defecto si no se especificó
+    if ruta_archivo is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if formato in ('txt', 'csv', 'json'):
+            ruta_archivo = os.path.join(reports, f'reporte_{nombre_criterio}_{timestamp}.{formato}')
+    else:
+        # Si se especificó ruta pero no incluye la carpeta reports/, agregarla
+        if not ruta_archivo.startswith(reports):
+            ruta_archivo = os.path.join(reports, os.path.basename(ruta_archivo))
+    return ruta_archivo
+
+def _generar_reporte_txt(libros_ordenados, criterio, orden, totales=None, inventario=None):
     """
     Generates a plain text report.
     
     Args:
         libros_ordenados (list): Already sorted list of books.
-        criterio (str): Sorting criterion used.
-        orden (str): Applied order ('asc' or 'desc').
+        criterio (str|list): Sorting criterion used, or (attribute, orden) pairs.
+        orden (str): Applied order ('asc' or 'desc') of a single criterion.
+        totales (tuple, optional): (valor_total, peso_total) of the inventory,
+            already computed. Default: None.
+        inventario (list, optional): Whole inventory when only the first K
+            books are listed (totals are computed over it). Default: None.
     
     Returns:
         str: Report formatted as text.
@@ -171,13 +384,20 @@ def _generar_reporte_txt(libros_ordenados, criterio, orden):
     lineas = []
     lineas.append("REPORTE GLOBAL DE INVENTARIO")
     lineas.append(f"Fecha de generación: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lineas.append(f"Ordenado por: {criterio.upper()} ({orden.upper()})")
-    lineas.append(f"Total de libros: {len(libros_ordenados)}")
+    lineas.append(f"Ordenado por: {describir_criterios(criterio, orden)}")
+    if inventario is None:
+        inventario = libros_ordenados
+    lineas.append(f"Total de libros: {len(inventario)}")
+    if len(libros_ordenados) < len(inventario):
+        lineas.append(f"Mostrando los primeros {len(libros_ordenados)} libros")
     lineas.append("")
 
-    # Calcular totales
-    valor_total = sum(libro.valor * libro.cantidad_total for libro in libros_ordenados)
-    peso_total = sum(libro.peso * libro.cantidad_total for libro in libros_ordenados)
+    # Calcular totales (salvo que el llamador ya los tenga)
+    if totales is not None:
+        valor_total, peso_total = totales
+    else:
+        valor_total = sum(libro.valor * libro.cantidad_total for libro in inventario)
+        peso_total = sum(libro.peso * libro.cantidad_total for libro in inventario)
 
     lineas.append(f"Valor total del inventario: ${valor_total:,.2f} COP")
     lineas.append(f"Peso total del inventario: {peso_total:.2f} Kg")
@@ -212,32 +432,38 @@ def _generar_reporte_csv(libros_ordenados, ruta_archivo):
     if not ruta_archivo:
         ruta_archivo = f"reporte_inventario_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-    with open(ruta_archivo, 'w', encoding='utf-8', newline='') as f:
-        campos = ['posicion', 'isbn', 'titulo', 'autor', 'peso', 'valor', 'genero', 'cantidad_disponible', 'cantidad_total']
-        escritor = csv.DictWriter(f, fieldnames=campos)
-        escritor.writeheader()
-        for i, libro in enumerate(libros_ordenados, 1):
-            escritor.writerow({
-                'posicion': i,
-                'isbn': libro.isbn,
-                'titulo': libro.titulo,
-                'autor': libro.autor,
-                'peso': libro.peso,
-                'valor': libro.valor,
-                'genero': libro.genero,
-                'cantidad_disponible': libro.cantidad_disponible,
-                'cantidad_total': libro.cantidad_total
-            })
+    _escribir_csv(map(registro_libro, libros_ordenados), ruta_archivo)
     print(f"Reporte CSV guardado en: {ruta_archivo}")
-    return [libro.__dict__ for libro in libros_ordenados]
+    return [libro.a_diccionario() for libro in libros_ordenados]
 
-def _generar_reporte_json(libros_ordenados, ruta_archivo):
+def _escribir_csv(registros, ruta_archivo):
+    """
+    Writes sorted registros to a CSV file row by row (streaming).
+    
+    Args:
+        registros (iterable): Tuples of CAMPOS_REGISTRO, already sorted.
+        ruta_archivo (str): Path of the CSV file.
+    
+    Returns:
+        int: Number of rows written.
+    """
+    cantidad = 0
+    with open(ruta_archivo, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(CAMPOS_FILA)
+        for cantidad, registro in enumerate(registros, 1):
+            escritor.writerow((cantidad,) + registro)
+    return cantidad
+
+def _generar_reporte_json(libros_ordenados, ruta_archivo, total_libros=None):
     """
     Generates a report in JSON format.
     
     Args:
         libros_ordenados (list): Already sorted list of books.
         ruta_archivo (str): Path to save the JSON file.
+        total_libros (int, optional): Size of the whole inventory when only
+            the first K books are listed. Default: None (all are listed).
     
     Returns:
         list: List of dictionaries with the data.
@@ -247,7 +473,8 @@ def _generar_reporte_json(libros_ordenados, ruta_archivo):
     
     datos = {
         'fecha_generacion': datetime.now().isoformat(),
-        'total_libros': len(libros_ordenados),
+        'total_libros': len(libros_ordenados) if total_libros is None else total_libros,
+        'libros_listados': len(libros_ordenados),
         'libros': [
             {
                 'posicion': i,
@@ -267,4 +494,35 @@ def _generar_reporte_json(libros_ordenados, ruta_archivo):
     with open(ruta_archivo, 'w', encoding='utf-8') as f:
         json.dump(datos, f, indent=2, ensure_ascii=False)
     print(f"Reporte JSON guardado en: {ruta_archivo}")
-    return datos
\ No newline at end of file
+    return datos
+
+def _escribir_json(registros, ruta_archivo, total_libros, libros_listados):
+    """
+    Writes sorted registros to a JSON file book by book (streaming), with the
+    same layout as _generar_reporte_json.
+    
+    Args:
+        registros (iterable): Tuples of CAMPOS_REGISTRO, already sorted.
+        ruta_archivo (str): Path of the JSON file.
+        total_libros (int): Size of the whole catalog.
+        libros_listados (int): Number of registros that will be written.
+    
+    Returns:
+        int: Number of books written.
+    """
+    cabecera = {
+        'fecha_generacion': datetime.now().isoformat(),
+        'total_libros': total_libros,
+        'libros_listados': libros_listados
+    }
+    cantidad = 0
+    with open(ruta_archivo, 'w', encoding='utf-8') as f:
+        f.write('{\n')
+        for clave, valor in cabecera.items():
+            f.write(f'  {json.dumps(clave)}: {json.dumps(valor, ensure_ascii=False)},\n')
+        f.write('  "libros": [')
+        for cantidad, registro in enumerate(registros, 1):
+            fila = json.dumps(dict(zip(CAMPOS_FILA, (cantidad,) + registro)), indent=2, ensure_ascii=False)
+            f.write(('\n' if cantidad == 1 else ',\n') + textwrap.indent(fila, '    '))
+        f.write('\n  ]\n}' if cantidad else ']\n}')
+    return cantidad
@@ -0,0 +1,227 @@
+"""
+External Merge Sort for catalogs that do not fit in memory.
+
+The books arrive as a stream (e.g. LectorArchivo.iterar_libros) and are
+never all in memory at the same time:
+
+    1. Runs: up to maximo_en_memoria books are read, sorted with the Merge
+       Sort engine (keys compiled once) and spilled to a temporary file as
+       (clave, registro) pairs, written in blocks of tamano_bloque pairs.
+       The registro is a plain tuple with the report fields (CAMPOS_REGISTRO),
+       not the Libro object.
+    2. Merge: the runs are merged with a heap (k-way, heapq.merge), reading
+       one block of each run at a time. If there are more than maximo_tramos
+       runs, groups of them are first merged into longer runs (several passes).
+
+Runs are created and merged in input order and heapq.merge resolves ties in
+favor of the earlier run, so the result is stable: the same order as
+merge_sort over the whole list.
+
+Peak memory depends on maximo_en_memoria (first phase) and on
+maximo_tramos * tamano_bloque (merge), never on the size of the catalog.
+
+Time Complexity: O(n log n) comparisons, O(n * pasadas) disk I/O
+Space Complexity: O(maximo_en_memoria + maximo_tramos * tamano_bloque) in memory, O(n) on disk
+"""
+
+import os
+import pickle
+import tempfile
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+
+from controllers.ordenamiento.merge_sort_iterativo import (
+    extraer_claves_compuestas,
+    normalizar_criterios,
+    ordenar_posiciones
+)
+
+# Libros ordenados en memoria por tramo (cota del pico de memoria)
+MAXIMO_EN_MEMORIA = 100_000
+
+# Pares (clave, registro) por bloque escrito/leído en los archivos temporales
+TAMANO_BLOQUE = 1_000
+
+# Tramos abiertos a la vez durante una mezcla
+MAXIMO_TRAMOS = 64
+
+# Campos de cada registro, en orden
+CAMPOS_REGISTRO = ('isbn', 'titulo', 'autor', 'peso', 'valor', 'genero', 'cantidad_disponible', 'cantidad_total')
+
+obtener_registro = itemgetter(1)
+
+def registro_libro(libro):
+    """
+    Converts a book into the plain tuple stored in the runs.
+
+    Args:
+        libro (Libro): Book.
+
+    Returns:
+        tuple: Values of CAMPOS_REGISTRO.
+    """
+    return (libro.isbn, libro.titulo, libro.autor, libro.peso, libro.valor,
+            libro.genero, libro.cantidad_disponible, libro.cantidad_total)
+
+class OrdenamientoExterno:
+    """
+    External Merge Sort in two phases, with its temporary files removed on exit.
+
+    Example:
+        with OrdenamientoExterno('valor', 'desc', maximo_en_memoria=50_000) as ordenamiento:
+            ordenamiento.agregar(LectorArchivo.iterar_libros('catalogo.csv'))
+            for registro in ordenamiento.registros():
+                ...
+
+    Attributes:
+        criterios (list): (campo, orden) pairs.
+        maximo_en_memoria (int): Books sorted in memory per run.
+        tamano_bloque (int): Pairs per block of the temporary files.
+        maximo_tramos (int): Runs merged at a time.
+        total (int): Books added.
+        tramos (list): Paths of the run files.
+    """
+
+    def __init__(self, criterio='valor', orden='asc', maximo_en_memoria=MAXIMO_EN_MEMORIA,
+                 tamano_bloque=TAMANO_BLOQUE, maximo_tramos=MAXIMO_TRAMOS, directorio_temporal=None):
+        """
+        Initializes the sort.
+
+        Args:
+            criterio (str|list, optional): Attribute, or list of (attribute,
+                orden) pairs. Default: 'valor'.
+            orden (str, optional): 'asc' or 'desc' (for a single attribute). Default: 'asc'.
+            maximo_en_memoria (int, optional): Books sorted in memory per run. Default: MAXIMO_EN_MEMORIA.
+            tamano_bloque (int, optional): Pairs per block of the temporary files. Default: TAMANO_BLOQUE.
+            maximo_tramos (int, optional): Runs merged at a time (at least 2). Default: MAXIMO_TRAMOS.
+            directorio_temporal (str, optional): Where to create the temporary
+                files. Default: None (system temporary directory).
+
+        Raises:
+            ValueError: If a size or the criteria are not valid.
+        """
+        if maximo_en_memoria < 1 or tamano_bloque < 1 or maximo_tramos < 2:
+            raise ValueError("maximo_en_memoria y tamano_bloque deben ser >= 1 y maximo_tramos >= 2")
+        self.criterios = normalizar_criterios(criterio, orden)
+        self.maximo_en_memoria = maximo_en_memoria
+        self.tamano_bloque = tamano_bloque
+        self.maximo_tramos = maximo_tramos
+        self.total = 0
+        self.tramos = []
+        self._directorio = tempfile.TemporaryDirectory(prefix='merge_sort_externo_', dir=directorio_temporal)
+        self._siguiente = 0
+
+    def agregar(self, libros):
+        """
+        Reads books in runs of maximo_en_memoria, sorts and spills each run.
+
+        Args:
+            libros (iterable): Books to add (consumed once).
+
+        Returns:
+            int: Number of books added.
+
+        Raises:
+            AttributeError: If a book does not have one of the attributes.
+        """
+        libros = iter(libros)
+        agregados = 0
+        while True:
+            lote = list(islice(libros, self.maximo_en_memoria))
+            if not lote:
+                break
+            claves = extraer_claves_compuestas(lote, self.criterios)
+            pares = ((claves[i], registro_libro(lote[i])) for i in ordenar_posiciones(claves))
+            self.tramos.append(self._escribir_tramo(pares))
+            agregados += len(lote)
+            del lote, claves
+        self.total += agregados
+        return agregados
+
+    def registros(self):
+        """
+        Merges the runs (k-way, with a heap).
+
+        Returns:
+            generator: Sorted registros (tuples of CAMPOS_REGISTRO).
+        """
+        # Mezclas intermedias hasta poder abrir todos los tramos a la vez
+        while len(self.tramos) > self.maximo_tramos:
+            agrupados = []
+            for inicio in range(0, len(self.tramos), self.maximo_tramos):
+                grupo = self.tramos[inicio:inicio + self.maximo_tramos]
+                if len(grupo) > 1:
+                    agrupados.append(self._escribir_tramo(_mezclar_tramos(grupo)))
+                    for ruta in grupo:
+                        os.remove(ruta)
+                else:
+                    agrupados.append(grupo[0])
+            self.tramos = agrupados
+        return map(obtener_registro, _mezclar_tramos(self.tramos))
+
+    def cerrar(self):
+        """Removes the temporary files."""
+        self.tramos = []
+        self._directorio.cleanup()
+
+    def _escribir_tramo(self, pares):
+        """Writes sorted (clave, registro) pairs to a new run file, by blocks. Returns its path."""
+        ruta = os.path.join(self._directorio.name, f'tramo_{self._siguiente:06d}.bin')
+        self._siguiente += 1
+        with open(ruta, 'wb') as archivo:
+            while True:
+                bloque = list(islice(pares, self.tamano_bloque))
+                if not bloque:
+                    break
+                pickle.dump(bloque, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        return ruta
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def __repr__(self):
+        return f"OrdenamientoExterno(libros={self.total}, tramos={len(self.tramos)})"
+
+def ordenar_externo(libros, criterio='valor', orden='asc', **opciones):
+    """
+    Sorts a stream of books using temporary files (External Merge Sort).
+
+    Example:
+        for registro in ordenar_externo(LectorArchivo.iterar_libros('catalogo.csv'), 'valor', 'desc'):
+            ...
+
+    Args:
+        libros (iterable): Books to sort (consumed once).
+        criterio (str|list, optional): Attribute, or list of (attribute, orden)
+            pairs. Default: 'valor'.
+        orden (str, optional): 'asc' or 'desc' (for a single attribute). Default: 'asc'.
+        **opciones: maximo_en_memoria, tamano_bloque, maximo_tramos and
+            directorio_temporal of OrdenamientoExterno.
+
+    Yields:
+        tuple: Sorted registros (values of CAMPOS_REGISTRO).
+    """
+    with OrdenamientoExterno(criterio, orden, **opciones) as ordenamiento:
+        ordenamiento.agregar(libros)
+        yield from ordenamiento.registros()
+
+def _leer_tramo(ruta):
+    """Yields the (clave, registro) pairs of a run file, one block in memory at a time."""
+    with open(ruta, 'rb') as archivo:
+        while True:
+            try:
+                bloque = pickle.load(archivo)
+            except EOFError:
+                return
+            yield from bloque
+
+def _mezclar_tramos(rutas):
+    """K-way merge of run files with a heap (stable: ties go to the earlier run)."""
+    # Con un solo tramo no hay nada que mezclar
+    if len(rutas) == 1:
+        return _leer_tramo(rutas[0])
+    return merge(*(_leer_tramo(ruta) for ruta in rutas), key=itemgetter(0))
@@ -0,0 +1,314 @@
+"""
+Optimized engine of Merge Sort used by merge_sort and the reports.
+
+The recursive version slices new lists at every level and reads the
+attribute of the books (hasattr + getattr) on every comparison. This engine:
+
+    1. Extracts the key of every book once (decorate-sort-undecorate) and
+       sorts the positions of the books, not the books.
+    2. Detects natural runs (already sorted stretches; strictly descending
+       ones are reversed) and extends the short ones to MINIMO_RUN elements
+       with binary insertion sort.
+    3. Merges the runs bottom-up (no recursion), alternating between the
+       array of positions and a single auxiliary buffer allocated once.
+
+It is stable: equal keys keep their original order, also in descending
+order (the list is sorted ascending over its reversed positions and the
+result is reversed back).
+
+Several criteria with their own direction (e.g. genero asc, autor asc,
+valor desc) are compiled once into a tuple key: descending numbers are
+negated and other descending values are wrapped in ClaveInversa, so the
+whole report is a single stable ascending sort.
+
+Time Complexity: O(n log n) worst case, O(n) for already sorted input
+Space Complexity: O(n) - keys, positions and one buffer
+"""
+
+from bisect import bisect_right
+from numbers import Number
+from operator import attrgetter
+
+# Tamaño mínimo de un tramo antes de mezclar (por debajo: inserción binaria)
+MINIMO_RUN = 64
+
+ORDENES = ('asc', 'desc')
+
+class ClaveInversa:
+    """
+    Wraps a value so that it compares in reverse order (descending field of
+    a composite key whose values cannot be negated, e.g. strings).
+
+    Attributes:
+        valor: Wrapped value.
+    """
+    __slots__ = ('valor',)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __eq__(self, otra):
+        return self.valor == otra.valor
+
+    def __lt__(self, otra):
+        return otra.valor < self.valor
+
+    def __le__(self, otra):
+        return otra.valor <= self.valor
+
+    def __gt__(self, otra):
+        return otra.valor > self.valor
+
+    def __ge__(self, otra):
+        return otra.valor >= self.valor
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ClaveInversa({self.valor!r})"
+
+def normalizar_criterios(criterio, orden='asc'):
+    """
+    Converts a criterion or a list of criteria into (campo, orden) pairs.
+
+    Example: normalizar_criterios([('genero', 'asc'), 'autor', ('valor', 'desc')])
+
+    Args:
+        criterio (str|list): Attribute, or list of attributes and/or
+            (attribute, orden) pairs.
+        orden (str, optional): Direction of the items given without one. Default: 'asc'.
+
+    Returns:
+        list: List of (campo, orden) pairs.
+
+    Raises:
+        ValueError: If the list is empty or a direction is not 'asc'/'desc'.
+    """
+    elementos = [criterio] if isinstance(criterio, str) else list(criterio)
+    if not elementos:
+        raise ValueError("Se requiere al menos un criterio de ordenamiento")
+    criterios = []
+    for elemento in elementos:
+        campo, direccion = (elemento, orden) if isinstance(elemento, str) else elemento
+        if direccion not in ORDENES:
+            raise ValueError(f"Orden no soportado: {direccion}")
+        criterios.append((campo, direccion))
+    return criterios
+
+def compilar_clave(criterios, muestra):
+    """
+    Compiles (campo, orden) pairs into a single key function.
+
+    Args:
+        criterios (list): (campo, orden) pairs, most significant first.
+        muestra (Libro): A book used to decide, per descending field, whether
+            its values can be negated (numbers) or must be wrapped.
+
+    Returns:
+        callable: clave(libro) -> tuple.
+    """
+    obtener = attrgetter(*(campo for campo, _ in criterios))
+    if len(criterios) == 1:
+        # attrgetter de un solo campo no devuelve tupla
+        obtener_uno = obtener
+        obtener = lambda libro: (obtener_uno(libro),)
+    transformaciones = []
+    for posicion, (campo, direccion) in enumerate(criterios):
+        if direccion == 'asc':
+            continue
+        valor = getattr(muestra, campo)
+        if isinstance(valor, Number) and not isinstance(valor, bool):
+            transformaciones.append((posicion, lambda v: -v))
+        else:
+            transformaciones.append((posicion, ClaveInversa))
+    if not transformaciones:
+        return obtener
+
+    def clave(libro):
+        valores = list(obtener(libro))
+        for posicion, transformar in transformaciones:
+            valores[posicion] = transformar(valores[posicion])
+        return tuple(valores)
+    return clave
+
+def extraer_claves_compuestas(lista_libros, criterios):
+    """
+    Obtains the composite key of every book in a single pass.
+
+    Args:
+        lista_libros (list): List of Book objects.
+        criterios (list): (campo, orden) pairs, most significant first.
+
+    Returns:
+        list: Key of each book; sorting them ascending applies every direction.
+
+    Raises:
+        AttributeError: If a book does not have one of the attributes.
+    """
+    if not len(lista_libros):
+        return []
+    try:
+        return list(map(compilar_clave(criterios, lista_libros[0]), lista_libros))
+    except AttributeError as error:
+        campo = getattr(error, 'name', None) or ', '.join(campo for campo, _ in criterios)
+        raise AttributeError(f"El libro no tiene el atributo '{campo}'") from None
+
+def extraer_claves(lista_libros, criterio):
+    """
+    Obtains the value of the attribute of every book in a single pass.
+
+    Args:
+        lista_libros (list): List of Book objects.
+        criterio (str): Name of the attribute.
+
+    Returns:
+        list: Key of each book (same positions as the list).
+
+    Raises:
+        AttributeError: If a book does not have the attribute.
+    """
+    try:
+        return list(map(attrgetter(criterio), lista_libros))
+    except AttributeError:
+        raise AttributeError(f"El libro no tiene el atributo '{criterio}'") from None
+
+def ordenar_posiciones(claves, descendente=False, minimo_run=MINIMO_RUN):
+    """
+    Stable sort of the positions of a list of keys.
+
+    Args:
+        claves (list): Keys to sort by.
+        descendente (bool, optional): True for descending order. Default: False.
+        minimo_run (int, optional): Minimum length of a run; shorter runs are
+            extended with binary insertion sort. Default: MINIMO_RUN.
+
+    Returns:
+        list: Positions of the keys in sorted order.
+    """
+    n = len(claves)
+    # Descendente estable: ordenar ascendente las posiciones invertidas y
+    # revertir el resultado (los iguales conservan su orden original)
+    posiciones = list(range(n - 1, -1, -1)) if descendente else list(range(n))
+    if n > 1:
+        tramos = _detectar_tramos(posiciones, claves, minimo_run)
+        posiciones = _mezclar_tramos(posiciones, claves, tramos)
+    if descendente:
+        posiciones.reverse()
+    return posiciones
+
+def merge_sort_iterativo(lista_libros, criterio='valor', orden='asc'):
+    """
+    Sorts a list of books with the bottom-up natural Merge Sort engine.
+
+    Args:
+        lista_libros (list): List of Book objects to sort.
+        criterio (str|list, optional): Attribute by which to sort, or a list
+            of (attribute, orden) pairs, most significant first. Default: 'valor'.
+        orden (str, optional): 'asc' or 'desc' (for a single attribute or the
+            items of the list given without a direction). Default: 'asc'.
+
+    Returns:
+        list: New sorted list (does not modify the original).
+    """
+    criterios = normalizar_criterios(criterio, orden)
+    if len(criterios) == 1:
+        campo, direccion = criterios[0]
+        claves = extraer_claves(lista_libros, campo)
+        return [lista_libros[i] for i in ordenar_posiciones(claves, direccion == 'desc')]
+    claves = extraer_claves_compuestas(lista_libros, criterios)
+    return [lista_libros[i] for i in ordenar_posiciones(claves)]
+
+def _detectar_tramos(posiciones, claves, minimo_run):
+    """
+    Splits the positions into sorted runs, in place.
+
+    Returns:
+        list: Start of each run, followed by n.
+    """
+    n = len(posiciones)
+    inicios = []
+    inicio = 0
+    while inicio < n:
+        fin = inicio + 1
+        if fin < n:
+            if claves[posiciones[fin]] < claves[posiciones[inicio]]:
+                # Tramo estrictamente descendente: se invierte (estable)
+                while fin + 1 < n and claves[posiciones[fin + 1]] < claves[posiciones[fin]]:
+                    fin += 1
+                fin += 1
+                posiciones[inicio:fin] = posiciones[inicio:fin][::-1]
+            else:
+                while fin + 1 < n and claves[posiciones[fin + 1]] >= claves[posiciones[fin]]:
+                    fin += 1
+                fin += 1
+        # Tramo corto: extenderlo con inserción binaria
+        if fin - inicio < minimo_run and fin < n:
+            limite = min(n, inicio + minimo_run)
+            _insercion_binaria(posiciones, claves, inicio, fin, limite)
+            fin = limite
+        inicios.append(inicio)
+        inicio = fin
+    inicios.append(n)
+    return inicios
+
+def _insercion_binaria(posiciones, claves, inicio, ordenado_hasta, fin):
+    """Extends the sorted stretch [inicio, ordenado_hasta) to [inicio, fin)."""
+    claves_tramo = [claves[p] for p in posiciones[inicio:ordenado_hasta]]
+    for i in range(ordenado_hasta, fin):
+        posicion = posiciones[i]
+        clave = claves[posicion]
+        # Después de los iguales: estable
+        destino = bisect_right(claves_tramo, clave)
+        claves_tramo.insert(destino, clave)
+        # Desplazar el tramo en una sola operación de corte
+        posiciones[inicio + destino + 1:i + 1] = posiciones[inicio + destino:i]
+        posiciones[inicio + destino] = posicion
+
+def _mezclar_tramos(posiciones, claves, inicios):
+    """Merges adjacent runs bottom-up, alternating with one auxiliary buffer."""
+    origen = posiciones
+    destino = [0] * len(posiciones)
+    while len(inicios) > 2:
+        nuevos = []
+        for t in range(0, len(inicios) - 1, 2):
+            inicio = inicios[t]
+            nuevos.append(inicio)
+            if t + 2 < len(inicios):
+                _mezclar(origen, destino, claves, inicio, inicios[t + 1], inicios[t + 2])
+            else:
+                # Tramo impar: se copia tal cual
+                destino[inicio:inicios[t + 1]] = origen[inicio:inicios[t + 1]]
+        nuevos.append(inicios[-1])
+        inicios = nuevos
+        origen, destino = destino, origen
+    return origen
+
+def _mezclar(origen, destino, claves, inicio, medio, fin):
+    """Merges origen[inicio:medio] and origen[medio:fin] into destino[inicio:fin]."""
+    # Tramos ya en orden entre sí: copiar sin comparar
+    if claves[origen[medio - 1]] <= claves[origen[medio]]:
+        destino[inicio:fin] = origen[inicio:fin]
+        return
+    i, j, k = inicio, medio, inicio
+    clave_i = claves[origen[i]]
+    clave_j = claves[origen[j]]
+    while True:
+        if clave_j < clave_i:
+            destino[k] = origen[j]
+            k += 1
+            j += 1
+            if j == fin:
+                break
+            clave_j = claves[origen[j]]
+        else:
+            destino[k] = origen[i]
+            k += 1
+            i += 1
+            if i == medio:
+                break
+            clave_i = claves[origen[i]]
+    # Agregar los elementos restantes
+    if i < medio:
+        destino[k:fin] = origen[i:medio]
+    else:
+        destino[k:fin] = origen[j:fin]
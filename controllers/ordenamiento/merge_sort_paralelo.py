@@ -0,0 +1,104 @@
+"""
+Parallel Merge Sort over several processes for large reports.
+
+The keys are extracted once in the parent process (as in the Merge Sort
+engine) and split into contiguous fragments. Each worker of a
+ProcessPoolExecutor receives only its fragment of keys (numbers, strings or
+tuples, never the Libro objects), sorts it with ordenar_posiciones and
+returns the sorted local positions. The parent merges the fragments with a
+heap (k-way, heapq.merge).
+
+Fragments are contiguous and merged in order, and heapq.merge resolves ties
+in favor of the earlier fragment (also in reverse), so the result is stable:
+the same order as merge_sort.
+
+Below UMBRAL_PARALELO books the cost of starting the processes and sending
+the keys is larger than the gain, and the sort stays serial.
+
+Time Complexity: O((n/p) log(n/p)) per worker + O(n log p) for the merge
+Space Complexity: O(n) - keys, positions and the copies sent to the workers
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+
+from controllers.ordenamiento.merge_sort_iterativo import (
+    extraer_claves,
+    extraer_claves_compuestas,
+    normalizar_criterios,
+    ordenar_posiciones
+)
+
+# Por debajo de este número de libros se ordena en el proceso actual
+UMBRAL_PARALELO = 100_000
+
+# Libros mínimos por fragmento (evita procesos con muy poco trabajo)
+MINIMO_FRAGMENTO = 25_000
+
+def ordenar_posiciones_paralelo(claves, descendente=False, procesos=None, umbral=UMBRAL_PARALELO,
+                                minimo_fragmento=MINIMO_FRAGMENTO):
+    """
+    Stable sort of the positions of a list of keys using several processes.
+
+    Args:
+        claves (list): Keys to sort by (must be picklable).
+        descendente (bool, optional): True for descending order. Default: False.
+        procesos (int, optional): Number of worker processes. Default: None
+            (os.cpu_count()).
+        umbral (int, optional): Below this number of keys the sort is serial.
+            Default: UMBRAL_PARALELO.
+        minimo_fragmento (int, optional): Minimum keys per worker (limits the
+            number of processes). Default: MINIMO_FRAGMENTO.
+
+    Returns:
+        list: Positions of the keys in sorted order.
+    """
+    n = len(claves)
+    procesos = min(procesos or os.cpu_count() or 1, n // max(minimo_fragmento, 1))
+    if n < umbral or procesos < 2:
+        return ordenar_posiciones(claves, descendente)
+
+    # Fragmentos contiguos de tamaño similar
+    limites = [n * i // procesos for i in range(procesos + 1)]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [
+            ejecutor.submit(_ordenar_fragmento, claves[inicio:fin], descendente)
+            for inicio, fin in zip(limites, limites[1:])
+        ]
+        fragmentos = [
+            [inicio + posicion for posicion in futuro.result()]
+            for inicio, futuro in zip(limites, futuros)
+        ]
+    return list(merge(*fragmentos, key=claves.__getitem__, reverse=descendente))
+
+def merge_sort_paralelo(lista_libros, criterio='valor', orden='asc', procesos=None, umbral=UMBRAL_PARALELO):
+    """
+    Sorts a list of books with the parallel Merge Sort.
+
+    Args:
+        lista_libros (list): List of Book objects to sort.
+        criterio (str|list, optional): Attribute, or list of (attribute,
+            orden) pairs. Default: 'valor'.
+        orden (str, optional): 'asc' or 'desc' (for a single attribute). Default: 'asc'.
+        procesos (int, optional): Number of worker processes. Default: None (os.cpu_count()).
+        umbral (int, optional): Below this number of books the sort is serial.
+            Default: UMBRAL_PARALELO.
+
+    Returns:
+        list: New sorted list (does not modify the original).
+    """
+    criterios = normalizar_criterios(criterio, orden)
+    if len(criterios) == 1:
+        campo, direccion = criterios[0]
+        claves = extraer_claves(lista_libros, campo)
+        descendente = direccion == 'desc'
+    else:
+        claves = extraer_claves_compuestas(lista_libros, criterios)
+        descendente = False
+    posiciones = ordenar_posiciones_paralelo(claves, descendente, procesos, umbral)
+    return [lista_libros[i] for i in posiciones]
+
+def _ordenar_fragmento(claves, descendente):
+    """Worker: sorted local positions of a fragment of keys."""
+    return ordenar_posiciones(claves, descendente)
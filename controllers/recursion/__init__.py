@@ -12,6 +12,10 @@ for calculations on collections of books by author:
   * Uses explicit accumulators
   * Optimizable (Tail Call Optimization)
 
+Both run on a stack-safe engine (motor.py): tail calls on a trampoline and
+stack recursion on an explicit stack, so catalogs of any size work without
+RecursionError and the narrated demos print a bounded trace.
+
 Use:
     from controllers.recursion import (
         calcular_valor_total_recursivo,
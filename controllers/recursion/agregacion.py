@@ -0,0 +1,69 @@
+"""
+Fused aggregation kernel for the per-author analyses.
+
+calcular_estadisticas_peso and analizar_valor_por_autor used to traverse
+the inventory once per statistic (total, count, minimum, maximum, matching
+books and the global minimum-value book). All of those are accumulators of
+the same tail recursion, so they are fused into a single traversal that
+updates every accumulator per book. Being a tail recursion, it runs as a
+loop: no call per book and no stack growth.
+
+Time Complexity:
+    - agregar_autor: O(n) in one pass, O(k) extra memory for the k books of the author
+"""
+
+from models.diccionario_valores import AUTORES
+
+def agregar_autor(lista_libros, autor):
+    """
+    Computes every statistic of an author's books and the global
+    minimum-value book in a single pass.
+
+    Args:
+        lista_libros (list): List (or view) of Book objects.
+        autor (str): Name or part of the name of the author.
+
+    Returns:
+        dict: {'cantidad', 'valor_total', 'peso_total', 'peso_minimo',
+            'peso_maximo', 'libros', 'libro_menor', 'valor_menor'} where
+            peso_minimo/peso_maximo are None if the author has no books and
+            libro_menor/valor_menor are None if the list is empty.
+    """
+    # Autores coincidentes (valores internados): pertenencia por identidad
+    autores = AUTORES.coincidentes(autor)
+    libros = []
+    agregar = libros.append
+    valor_total = 0.0
+    peso_total = 0.0
+    peso_minimo = float('inf')
+    peso_maximo = float('-inf')
+    libro_menor = None
+    valor_menor = None
+
+    for libro in lista_libros:
+        valor = libro.valor
+        # Mínimo global (el primer libro con el menor valor, como el recorrido recursivo)
+        if libro_menor is None or valor < valor_menor:
+            libro_menor = libro
+            valor_menor = valor
+        if libro.autor in autores:
+            agregar(libro)
+            valor_total += valor
+            peso = libro.peso
+            peso_total += peso
+            if peso < peso_minimo:
+                peso_minimo = peso
+            if peso > peso_maximo:
+                peso_maximo = peso
+
+    cantidad = len(libros)
+    return {
+        'cantidad': cantidad,
+        'valor_total': valor_total,
+        'peso_total': peso_total,
+        'peso_minimo': peso_minimo if cantidad else None,
+        'peso_maximo': peso_maximo if cantidad else None,
+        'libros': libros,
+        'libro_menor': libro_menor,
+        'valor_menor': valor_menor
+    }
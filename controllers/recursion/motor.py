@@ -0,0 +1,162 @@
+"""
+Stack-safe execution engine for the recursive algorithms.
+
+Python does not optimize tail calls and limits the call stack to about 1000
+frames, so a recursion of one call per book fails on larger catalogs. This
+module keeps the recursive structure of the algorithms but runs it without
+growing the interpreter stack:
+
+- Tail recursion -> trampoline: each step returns the next call (Llamada)
+  instead of making it, and trampolin() runs the steps in a loop.
+
+- Stack recursion -> explicit stack: the descent pushes the frames whose
+  work is pending onto a list (heap memory), and the return phase pops them
+  and combines each one with the result of the rest, in the same order as
+  the recursive version.
+
+The narrated demonstrations print through a Traza, which keeps the first
+and last lines and summarizes the ones in between, so a trace over millions
+of books stays bounded.
+
+Time Complexity:
+    - trampolin / recursion_pila: O(n) steps, O(1) interpreter stack
+    - recursion_pila: O(k) heap memory for k pending frames
+"""
+
+from collections import deque
+
+class Llamada:
+    """
+    Deferred call returned by a trampolined step.
+
+    Attributes:
+        funcion (callable): Step to call next.
+        argumentos (tuple): Positional arguments of the call.
+    """
+    __slots__ = ('funcion', 'argumentos')
+
+    def __init__(self, funcion, *argumentos):
+        self.funcion = funcion
+        self.argumentos = argumentos
+
+    def __repr__(self):
+        return f"Llamada({self.funcion.__name__}, argumentos={len(self.argumentos)})"
+
+def trampolin(funcion, *argumentos):
+    """
+    Runs a tail-recursive function written as trampolined steps.
+
+    Each step returns either a Llamada (the tail call to make next) or the
+    final result.
+
+    Args:
+        funcion (callable): First step.
+        *argumentos: Arguments of the first step.
+
+    Returns:
+        any: Result of the last step.
+    """
+    resultado = funcion(*argumentos)
+    while type(resultado) is Llamada:
+        resultado = resultado.funcion(*resultado.argumentos)
+    return resultado
+
+def recursion_pila(lista, indice, incluir, caso_base, combinar, al_bajar=None, al_caso_base=None, al_regresar=None):
+    """
+    Runs a stack recursion over a list with an explicit stack.
+
+    Equivalent to:
+        f(i) = caso_base                              if i >= len(lista)
+        f(i) = combinar(lista[i], f(i + 1))           if incluir(lista[i])
+        f(i) = f(i + 1)                               otherwise
+
+    Args:
+        lista (list): Elements to traverse.
+        indice (int): First index.
+        incluir (callable): incluir(elemento) -> bool, whether the frame has
+            work pending on return.
+        caso_base: Result at the end of the list.
+        combinar (callable): combinar(elemento, resultado_resto) -> resultado.
+        al_bajar (callable, optional): al_bajar(elemento, nivel) called when
+            a frame is pushed (for narrated demos). Default: None.
+        al_caso_base (callable, optional): al_caso_base(nivel) called when
+            the end of the list is reached. Default: None.
+        al_regresar (callable, optional): al_regresar(elemento, nivel,
+            resultado_resto, resultado) called when a frame is popped.
+            Default: None.
+
+    Returns:
+        any: Result of the recursion.
+    """
+    # Descenso: apilar los marcos que tienen trabajo pendiente
+    pila = []
+    for posicion in range(indice, len(lista)):
+        elemento = lista[posicion]
+        if incluir(elemento):
+            if al_bajar is not None:
+                al_bajar(elemento, len(pila))
+            pila.append(elemento)
+
+    if al_caso_base is not None:
+        al_caso_base(len(pila))
+
+    # Regreso: desapilar combinando cada marco con el resultado del resto
+    resultado = caso_base
+    while pila:
+        elemento = pila.pop()
+        resto = resultado
+        resultado = combinar(elemento, resto)
+        if al_regresar is not None:
+            al_regresar(elemento, len(pila), resto, resultado)
+    return resultado
+
+class Traza:
+    """
+    Bounded console trace for the narrated demonstrations.
+
+    Prints the first lines immediately, keeps only the last ones in a ring
+    buffer and, when closed, reports how many were skipped before printing
+    the tail.
+
+    Attributes:
+        limite (int): Lines shown at the start and at the end.
+        omitidas (int): Lines skipped so far.
+        _cola (deque): Last lines seen after the head was printed.
+    """
+
+    # Niveles de sangría antes de dejar de desplazar el texto
+    MAXIMA_SANGRIA = 20
+
+    def __init__(self, limite=40):
+        """
+        Initializes the trace.
+
+        Args:
+            limite (int, optional): Lines shown at the start and at the end. Default: 40.
+        """
+        self.limite = limite
+        self.omitidas = 0
+        self._impresas = 0
+        self._cola = deque(maxlen=limite)
+
+    def margen(self, nivel):
+        """Indentation of a depth level (capped at MAXIMA_SANGRIA)."""
+        return "  " * min(nivel, self.MAXIMA_SANGRIA)
+
+    def __call__(self, linea):
+        """Emits a line (printed now or kept for the tail)."""
+        if self._impresas < self.limite:
+            print(linea)
+            self._impresas += 1
+            return
+        if len(self._cola) == self._cola.maxlen:
+            self.omitidas += 1
+        self._cola.append(linea)
+
+    def cerrar(self):
+        """Prints the summary of the skipped lines and the tail."""
+        if self.omitidas:
+            print(f"  ... ({self.omitidas:,} líneas omitidas) ...")
+        while self._cola:
+            print(self._cola.popleft())
+        self.omitidas = 0
@@ -4,12 +4,37 @@ weight of all books by an author. The work is done before the
 recursive call, using accumulators.
 """
 
+from models.diccionario_valores import AUTORES
+from controllers.recursion.agregacion import agregar_autor
+from controllers.recursion.motor import Llamada, Traza, trampolin
+
+def _paso_peso_promedio(lista_libros, autores, indice, peso_acumulado, cantidad_libros):
+    """One step of calcular_peso_promedio (returns the tail call or the result)."""
+    # Caso base: llegamos al final de la lista
+    if indice >= len(lista_libros):
+        # Calcular promedio final
+        if cantidad_libros > 0:
+            return peso_acumulado / cantidad_libros
+        return 0.0
+    libro_actual = lista_libros[indice]
+    # Verificar si el libro es del autor buscado
+    if libro_actual.autor in autores:
+        # Antes de la recursión: actualizar acumuladores
+        nuevo_peso = peso_acumulado + libro_actual.peso
+        nueva_cantidad = cantidad_libros + 1
+        # Llamada recursiva de cola (última operación)
+        return Llamada(_paso_peso_promedio, lista_libros, autores, indice + 1, nuevo_peso, nueva_cantidad)
+    else:
+        # Si no es del autor, continuar sin actualizar acumuladores
+        return Llamada(_paso_peso_promedio, lista_libros, autores, indice + 1, peso_acumulado, cantidad_libros)
+
 def calcular_peso_promedio(lista_libros, autor, indice=0, peso_acumulado=0.0, cantidad_libros=0):
     """
     Calculates the average weight of books by an author using tail recursion.
     
     This function demonstrates tail recursion where the calculation is done
-    before the recursive call. It uses accumulators to maintain state.
+    before the recursive call. It uses accumulators to maintain state. The
+    tail calls run on a trampoline, so the call stack does not grow.
     
     Args:
         lista_libros (list): List of Book objects.
@@ -21,29 +46,46 @@ def calcular_peso_promedio(lista_libros, autor, indice=0, peso_acumulado=0.0, ca
     Returns:
         float: Average weight of the author's books.
     """
-    # Caso base: llegamos al final de la lista
+    return trampolin(
+        _paso_peso_promedio, lista_libros, AUTORES.coincidentes(autor),
+        indice, peso_acumulado, cantidad_libros
+    )
+
+def _paso_peso_promedio_con_demostracion(lista_libros, autores, indice, peso_acumulado, cantidad_libros, nivel, traza):
+    """One narrated step of calcular_peso_promedio_con_demostracion."""
+    margen = traza.margen(nivel)
+    # Caso base
     if indice >= len(lista_libros):
-        # Calcular promedio final
-        if cantidad_libros > 0:
-            return peso_acumulado / cantidad_libros
-        return 0.0
+        promedio = peso_acumulado / cantidad_libros if cantidad_libros > 0 else 0.0
+        traza(f"{margen}[Caso base] Fin de la lista")
+        traza(f"{margen}  Peso acumulado: {peso_acumulado:.2f} Kg")
+        traza(f"{margen}  Cantidad de libros: {cantidad_libros}")
+        traza(f"{margen}  Promedio final: {promedio:.2f} Kg")
+        return promedio
     libro_actual = lista_libros[indice]
-    # Verificar si el libro es del autor buscado
-    if autor.lower() in libro_actual.autor.lower():
-        # Antes de la recursión: actualizar acumuladores
+
+    if libro_actual.autor in autores:
+        # Actualizar acumuladores ANTES de la llamada recursiva
         nuevo_peso = peso_acumulado + libro_actual.peso
         nueva_cantidad = cantidad_libros + 1
+        traza(f"{margen}[{nivel}] Libro #{indice+1}: {libro_actual.titulo[:40]}")
+        traza(f"{margen}    Peso: {libro_actual.peso} Kg")
+        traza(f"{margen}    → Acumulando: {peso_acumulado:.2f} + {libro_actual.peso} = {nuevo_peso:.2f} Kg")
+        traza(f"{margen}    → Libros contados: {nueva_cantidad}")
+        traza(f"{margen}    → Llamada recursiva (TAIL CALL)...")
         # Llamada recursiva de cola (última operación)
-        return calcular_peso_promedio(
-            lista_libros, autor, indice + 1, nuevo_peso, nueva_cantidad
+        return Llamada(
+            _paso_peso_promedio_con_demostracion,
+            lista_libros, autores, indice + 1, nuevo_peso, nueva_cantidad, nivel + 1, traza
         )
     else:
-        # Si no es del autor, continuar sin actualizar acumuladores
-        return calcular_peso_promedio(
-            lista_libros, autor, indice + 1, peso_acumulado, cantidad_libros
+        # No es del autor, continuar sin modificar acumuladores
+        return Llamada(
+            _paso_peso_promedio_con_demostracion,
+            lista_libros, autores, indice + 1, peso_acumulado, cantidad_libros, nivel, traza
         )
 
-def calcular_peso_promedio_con_demostracion(lista_libros, autor, indice=0, peso_acumulado=0.0, cantidad_libros=0, nivel=0):
+def calcular_peso_promedio_con_demostracion(lista_libros, autor, indice=0, peso_acumulado=0.0, cantidad_libros=0, nivel=0, traza=None):
     """
     Version that demonstrates the tail recursion process in the console.
     
@@ -57,107 +99,67 @@ def calcular_peso_promedio_con_demostracion(lista_libros, autor, indice=0, peso_
         peso_acumulado (float, optional): Accumulated weight. Default: 0.0.
         cantidad_libros (int, optional): Count of books found. Default: 0.
         nivel (int, optional): Depth level. Default: 0.
+        traza (Traza, optional): Bounded trace to print to. Default: a new one.
     
     Returns:
         float: Calculated average weight.
     """
-    margen = "  " * nivel
-    # Caso base
-    if indice >= len(lista_libros):
-        promedio = peso_acumulado / cantidad_libros if cantidad_libros > 0 else 0.0
-        print(f"{margen}[Caso base] Fin de la lista")
-        print(f"{margen}  Peso acumulado: {peso_acumulado:.2f} Kg")
-        print(f"{margen}  Cantidad de libros: {cantidad_libros}")
-        print(f"{margen}  Promedio final: {promedio:.2f} Kg")
-        return promedio
-    libro_actual = lista_libros[indice]
+    traza = traza or Traza()
+    promedio = trampolin(
+        _paso_peso_promedio_con_demostracion, lista_libros, AUTORES.coincidentes(autor),
+        indice, peso_acumulado, cantidad_libros, nivel, traza
+    )
+    traza.cerrar()
+    return promedio
 
-    if autor.lower() in libro_actual.autor.lower():
-        # Actualizar acumuladores ANTES de la llamada recursiva
-        nuevo_peso = peso_acumulado + libro_actual.peso
-        nueva_cantidad = cantidad_libros + 1
-        print(f"{margen}[{nivel}] Libro #{indice+1}: {libro_actual.titulo[:40]}")
-        print(f"{margen}    Peso: {libro_actual.peso} Kg")
-        print(f"{margen}    → Acumulando: {peso_acumulado:.2f} + {libro_actual.peso} = {nuevo_peso:.2f} Kg")
-        print(f"{margen}    → Libros contados: {nueva_cantidad}")
-        print(f"{margen}    → Llamada recursiva (TAIL CALL)...")
-        # Llamada recursiva de cola (última operación)
-        return calcular_peso_promedio_con_demostracion(
-            lista_libros, autor, indice + 1, nuevo_peso, nueva_cantidad, nivel + 1
-        )
-    else:
-        # No es del autor, continuar sin modificar acumuladores
-        return calcular_peso_promedio_con_demostracion(
-            lista_libros, autor, indice + 1, peso_acumulado, cantidad_libros, nivel
-        )
-
-def calcular_estadisticas_peso(lista_libros, autor):
+def calcular_estadisticas_peso(lista_libros, autor, resumen=None):
     """
-    Calculates comprehensive weight statistics using tail recursion.
+    Calculates comprehensive weight statistics of an author in a single pass.
     
     Args:
         lista_libros (list): List of Book objects.
         autor (str): Name of the author.
+        resumen (dict, optional): Summary of the same author over the same
+            books (GestorBiblioteca.resumen_autor). If given, the statistics
+            are read from it without scanning. Default: None.
     
     Returns:
         dict: Dictionary with comprehensive statistics.
     """
-    # Funciones auxiliares con recursión de cola
-    def calcular_peso_total(libros, indice=0, acumulado=0.0):
-        if indice >= len(libros):
-            return acumulado
-        libro = libros[indice]
-        if autor.lower() in libro.autor.lower():
-            return calcular_peso_total(libros, indice + 1, acumulado + libro.peso)
-        return calcular_peso_total(libros, indice + 1, acumulado)
-    
-    def contar_libros(libros, indice=0, contador=0):
-        if indice >= len(libros):
-            return contador
-        libro = libros[indice]
-        if autor.lower() in libro.autor.lower():
-            return contar_libros(libros, indice + 1, contador + 1)
-        return contar_libros(libros, indice + 1, contador)
-    
-    def calcular_peso_minimo(libros, indice=0, minimo=float('inf')):
-        if indice >= len(libros):
-            return minimo if minimo != float('inf') else 0.0
-        libro = libros[indice]
-        if autor.lower() in libro.autor.lower():
-            nuevo_minimo = min(minimo, libro.peso)
-            return calcular_peso_minimo(libros, indice + 1, nuevo_minimo)
-        return calcular_peso_minimo(libros, indice + 1, minimo)
+    if resumen is not None:
+        cantidad = resumen['cantidad']
+        return {
+            'autor': autor,
+            'cantidad_libros': cantidad,
+            'peso_total': resumen['peso_total'],
+            'peso_promedio': resumen['peso_promedio'],
+            'peso_minimo': resumen['peso_minimo'] if cantidad > 0 else 0.0,
+            'peso_maximo': max(0.0, resumen['peso_maximo']) if cantidad > 0 else 0.0
+        }
     
-    def calcular_peso_maximo(libros, indice=0, maximo=0.0):
-        if indice >= len(libros):
-            return maximo
-        libro = libros[indice]
-        if autor.lower() in libro.autor.lower():
-            nuevo_maximo = max(maximo, libro.peso)
-            return calcular_peso_maximo(libros, indice + 1, nuevo_maximo)
-        return calcular_peso_maximo(libros, indice + 1, maximo)
-    # Calcular todas las estadísticas
-    peso_total = calcular_peso_total(lista_libros)
-    cantidad = contar_libros(lista_libros)
-    peso_promedio = peso_total / cantidad if cantidad > 0 else 0.0
-    peso_minimo = calcular_peso_minimo(lista_libros)
-    peso_maximo = calcular_peso_maximo(lista_libros)
+    # Un solo recorrido con todos los acumuladores (total, cantidad, mínimo
+    # y máximo) en lugar de una recursión de cola por estadística
+    agregado = agregar_autor(lista_libros, autor)
+    cantidad = agregado['cantidad']
+    peso_total = agregado['peso_total']
     return {
         'autor': autor,
         'cantidad_libros': cantidad,
         'peso_total': peso_total,
-        'peso_promedio': peso_promedio,
-        'peso_minimo': peso_minimo,
-        'peso_maximo': peso_maximo
+        'peso_promedio': peso_total / cantidad if cantidad > 0 else 0.0,
+        'peso_minimo': agregado['peso_minimo'] if cantidad > 0 else 0.0,
+        'peso_maximo': max(0.0, agregado['peso_maximo']) if cantidad > 0 else 0.0
     }
 
-def demostrar_recursion_cola(lista_libros, autor):
+def demostrar_recursion_cola(lista_libros, autor, resumen=None):
     """
     Visually demonstrate the tail recursion process.
     
     Args:
         lista_libros (list): List of Book objects.
         autor (str): Name of the author.
+        resumen (dict, optional): Summary of the author used for the final
+            statistics (GestorBiblioteca.resumen_autor). Default: None.
     
     Returns:
         float: Calculated average weight.
@@ -169,7 +171,7 @@ def demostrar_recursion_cola(lista_libros, autor):
     peso_promedio = calcular_peso_promedio_con_demostracion(lista_libros, autor)
     print(f"\nRESULTADO FINAL: {peso_promedio:.2f} Kg")
     # Estadísticas adicionales
-    stats = calcular_estadisticas_peso(lista_libros, autor)
+    stats = calcular_estadisticas_peso(lista_libros, autor, resumen=resumen)
     print(f"\nEstadísticas completas de {autor}:")
     print(f"  • Libros encontrados: {stats['cantidad_libros']}")
     print(f"  • Peso total: {stats['peso_total']:.2f} Kg")
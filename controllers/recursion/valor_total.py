@@ -4,12 +4,17 @@ of all books by a specific author. The work is done when "returning"
 from the recursive calls.
 """
 
+from models.diccionario_valores import AUTORES
+from controllers.recursion.agregacion import agregar_autor
+from controllers.recursion.motor import Llamada, Traza, recursion_pila, trampolin
+
 def calcular_valor_total(lista_libros, autor, indice=0):
     """
     Calculates the total value of all books by an author using stack recursion.
     
     This function demonstrates stack recursion where the calculation is done
-    when RETURNING from recursive calls. The result accumulates in the call stack.
+    when RETURNING from recursive calls. The result accumulates in the call stack,
+    which is run as an explicit stack (no RecursionError on large catalogs).
     
     Args:
         lista_libros (list): List of Book objects.
@@ -19,31 +24,19 @@ def calcular_valor_total(lista_libros, autor, indice=0):
     Returns:
         float: Total accumulated value of the author's books.
     """
-    # Caso base: llegamos al final de la lista
-    if indice >= len(lista_libros):
-        return 0.0
-    libro_actual = lista_libros[indice]
-    # Verificar si el libro es del autor buscado
-    if autor.lower() in libro_actual.autor.lower():
-        # Recursión: obtener el valor del resto de los libros
-        valor_resto = calcular_valor_total(lista_libros, autor, indice + 1)
+    autores = AUTORES.coincidentes(autor)
+    return recursion_pila(
+        lista_libros, indice,
+        # Verificar si el libro es del autor buscado
+        lambda libro: libro.autor in autores,
+        # Caso base: llegamos al final de la lista
+        0.0,
         # El trabajo se hace al regresar: Sumar el valor del libro actual con el resto
-        return libro_actual.valor + valor_resto
-    else:
-        # Si no es del autor, solo continuar con el siguiente
-        return calcular_valor_total(lista_libros, autor, indice + 1)
-
-def calcular_valor_menor(libros: list, indice: int = 0, menor_actual: dict = None):
-    # Caso base: llegamos al final de la lista
-    if not libros:
-        return None
-    # Primera llamada: Inicializar
-    if menor_actual is None:
-        menor_actual = {
-            'libro': libros[0],
-            'valor_menor': libros[0].valor
-        }
+        lambda libro, valor_resto: libro.valor + valor_resto
+    )
 
+def _paso_valor_menor(libros, indice, menor_actual):
+    """One step of calcular_valor_menor (returns the tail call or the result)."""
     # Caso base: Llegamos al final
     if indice >= len(libros):
         return menor_actual
@@ -56,10 +49,33 @@ def calcular_valor_menor(libros: list, indice: int = 0, menor_actual: dict = Non
         menor_actual['libro'] = libro_actual
         menor_actual['valor_menor'] = libro_actual.valor
 
-    # Llamada recursiva
-    return calcular_valor_menor(libros, indice + 1, menor_actual)
+    # Llamada recursiva (de cola)
+    return Llamada(_paso_valor_menor, libros, indice + 1, menor_actual)
 
-def calcular_valor_total_con_demostracion(lista_libros, autor, indice=0, nivel=0):
+def calcular_valor_menor(libros: list, indice: int = 0, menor_actual: dict = None):
+    """
+    Finds the book with the lowest value using tail recursion (trampolined).
+    
+    Args:
+        libros (list): List of Book objects.
+        indice (int, optional): Current index. Default: 0.
+        menor_actual (dict, optional): Minimum found so far. Default: None.
+    
+    Returns:
+        dict|None: {'libro', 'valor_menor'}, or None if the list is empty.
+    """
+    # Caso base: llegamos al final de la lista
+    if not libros:
+        return None
+    # Primera llamada: Inicializar
+    if menor_actual is None:
+        menor_actual = {
+            'libro': libros[0],
+            'valor_menor': libros[0].valor
+        }
+    return trampolin(_paso_valor_menor, libros, indice, menor_actual)
+
+def calcular_valor_total_con_demostracion(lista_libros, autor, indice=0, nivel=0, traza=None):
     """
     Version that demonstrates the stack recursion process in the console.
     
@@ -70,34 +86,36 @@ def calcular_valor_total_con_demostracion(lista_libros, autor, indice=0, nivel=0
         autor (str): Name of the author to search for.
         indice (int, optional): Current index. Default: 0.
         nivel (int, optional): Depth level (for indentation). Default: 0.
+        traza (Traza, optional): Bounded trace to print to. Default: a new one.
     
     Returns:
         float: Calculated total value.
     """
-    margen = "  " * nivel
-    # Caso base
-    if indice >= len(lista_libros):
-        print(f"{margen}[Caso base] Fin de la lista, retornando 0")
-        return 0.0
-    
-    libro_actual = lista_libros[indice]
-    
-    if autor.lower() in libro_actual.autor.lower():
-        print(f"{margen}→ [{nivel}] Libro: {libro_actual.titulo[:40]}")
-        print(f"{margen}   Valor: ${libro_actual.valor:,.0f} | Llamando recursivamente...")
-        # Llamada recursiva (bajando por la pila)
-        valor_resto = calcular_valor_total_con_demostracion(
-            lista_libros, autor, indice + 1, nivel + 1
-        )
+    traza = traza or Traza()
+    autores = AUTORES.coincidentes(autor)
+    
+    def al_bajar(libro, profundidad):
+        margen = traza.margen(nivel + profundidad)
+        traza(f"{margen}→ [{nivel + profundidad}] Libro: {libro.titulo[:40]}")
+        traza(f"{margen}   Valor: ${libro.valor:,.0f} | Llamando recursivamente...")
+    
+    def al_caso_base(profundidad):
+        traza(f"{traza.margen(nivel + profundidad)}[Caso base] Fin de la lista, retornando 0")
+    
+    def al_regresar(libro, profundidad, valor_resto, valor_total):
         # Trabajo al regresar (subiendo por la pila)
-        valor_total = libro_actual.valor + valor_resto
-        print(f"{margen}← [{nivel}] Regresando: ${libro_actual.valor:,.0f} + ${valor_resto:,.0f} = ${valor_total:,.0f}")
-        return valor_total
-    else:
-        # No es del autor, seguir buscando
-        return calcular_valor_total_con_demostracion(
-            lista_libros, autor, indice + 1, nivel
-        )
+        margen = traza.margen(nivel + profundidad)
+        traza(f"{margen}← [{nivel + profundidad}] Regresando: ${libro.valor:,.0f} + ${valor_resto:,.0f} = ${valor_total:,.0f}")
+    
+    valor_total = recursion_pila(
+        lista_libros, indice,
+        lambda libro: libro.autor in autores,
+        0.0,
+        lambda libro, valor_resto: libro.valor + valor_resto,
+        al_bajar, al_caso_base, al_regresar
+    )
+    traza.cerrar()
+    return valor_total
 
 def contar_libros_autor(lista_libros, autor, indice=0):
     """
@@ -111,15 +129,13 @@ def contar_libros_autor(lista_libros, autor, indice=0):
     Returns:
         int: Number of books by the author.
     """
-    if indice >= len(lista_libros):
-        return 0
-    
-    libro_actual = lista_libros[indice]
-    
-    if autor.lower() in libro_actual.autor.lower():
-        return 1 + contar_libros_autor(lista_libros, autor, indice + 1)
-    else:
-        return contar_libros_autor(lista_libros, autor, indice + 1)
+    autores = AUTORES.coincidentes(autor)
+    return recursion_pila(
+        lista_libros, indice,
+        lambda libro: libro.autor in autores,
+        0,
+        lambda libro, cantidad_resto: 1 + cantidad_resto
+    )
 
 def obtener_libros_autor(lista_libros, autor, indice=0):
     """
@@ -133,20 +149,25 @@ def obtener_libros_autor(lista_libros, autor, indice=0):
     Returns:
         list: List of books by the author.
     """
-    if indice >= len(lista_libros):
-        return []
-    
-    libro_actual = lista_libros[indice]
-    libros_resto = obtener_libros_autor(lista_libros, autor, indice + 1)
-    
-    if autor.lower() in libro_actual.autor.lower():
-        return [libro_actual] + libros_resto
-    else:
+    autores = AUTORES.coincidentes(autor)
+
+    def anteponer(libro, libros_resto):
+        # [libro] + libros_resto copiaría la lista en cada regreso (O(k²)):
+        # se agrega al final y la lista se invierte una sola vez
+        libros_resto.append(libro)
         return libros_resto
 
+    libros = recursion_pila(lista_libros, indice, lambda libro: libro.autor in autores, [], anteponer)
+    libros.reverse()
+    return libros
+
 def analizar_valor_por_autor(lista_libros, autor):
     """
-    Complete analysis of the value of books by an author using recursion.
+    Complete analysis of the value of books by an author.
+    
+    The books of the author, the sum, the count and the global minimum-value
+    book are obtained in a single fused pass (agregar_autor) instead of one
+    recursive traversal per statistic.
     
     Args:
         lista_libros (list): List of Book objects.
@@ -155,13 +176,9 @@ def analizar_valor_por_autor(lista_libros, autor):
     Returns:
         dict: Dictionary with complete analysis.
     """
-    # Calcular usando recursión de pila
-    valor_total = calcular_valor_total(lista_libros, autor)
-    cantidad_libros = contar_libros_autor(lista_libros, autor)
-    libros_encontrados = obtener_libros_autor(lista_libros, autor)
-    
-    resultado_menor = calcular_valor_menor(lista_libros)
-
+    agregado = agregar_autor(lista_libros, autor)
+    valor_total = agregado['valor_total']
+    cantidad_libros = agregado['cantidad']
     valor_promedio = valor_total / cantidad_libros if cantidad_libros > 0 else 0
     
     return {
@@ -169,18 +186,21 @@ def analizar_valor_por_autor(lista_libros, autor):
         'cantidad_libros': cantidad_libros,
         'valor_total': valor_total,
         'valor_promedio': valor_promedio,
-        'libros': libros_encontrados,
-        'valor_menor': resultado_menor['valor_menor'] if resultado_menor else 0,
-        'libro_menor': resultado_menor['libro'] if resultado_menor else None,
+        'libros': agregado['libros'],
+        'valor_menor': agregado['valor_menor'] if agregado['libro_menor'] is not None else 0,
+        'libro_menor': agregado['libro_menor'],
     }
 
-def demostrar_recursion_pila(lista_libros, autor):
+def demostrar_recursion_pila(lista_libros, autor, analisis=None):
     """
     Visually demonstrate the stack recursion process.
     
     Args:
         lista_libros (list): List of Book objects.
         autor (str): Name of the author.
+        analisis (dict, optional): Analysis of the same books used for the
+            final statistics (GestorBiblioteca.analizar_valor_autor). Default:
+            None (computed with analizar_valor_por_autor).
     
     Returns:
         float: Calculated total value.
@@ -194,14 +214,17 @@ def demostrar_recursion_pila(lista_libros, autor):
     
     print(f"\nRESULTADO FINAL: ${valor_total:,.0f} COP")
     # Análisis adicional
-    analisis = analizar_valor_por_autor(lista_libros, autor)
+    if analisis is None:
+        analisis = analizar_valor_por_autor(lista_libros, autor)
     print(f"\nEstadísticas:")
     print(f"  • Libros encontrados: {analisis['cantidad_libros']}")
     print(f"  • Valor total: ${analisis['valor_total']:,.0f} COP")
     print(f"  • Valor promedio por libro: ${analisis['valor_promedio']:,.0f} COP")
     print(f"\nLibros de {autor}:")
+    traza = Traza()
     for i, libro in enumerate(analisis['libros'], 1):
-        print(f"  {i}. {libro.titulo} - ${libro.valor:,.0f} COP")
+        traza(f"  {i}. {libro.titulo} - ${libro.valor:,.0f} COP")
+    traza.cerrar()
     print("EXPLICACIÓN:")
     print("  • Recursión de PILA: El cálculo se hace AL REGRESAR")
     print("  • Cada llamada espera el resultado de la siguiente")
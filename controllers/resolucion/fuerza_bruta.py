@@ -3,6 +3,7 @@ This algorithm finds all possible combinations that
 exceed the risk threshold of 8 Kg. (deficient shelving).
 """
 
+from array import array
 from itertools import combinations
 
 def encontrar_combinaciones(lista_libros, num_libros=4, peso_maximo=8.0):
@@ -25,14 +26,18 @@ def encontrar_combinaciones(lista_libros, num_libros=4, peso_maximo=8.0):
     """
     combinaciones_peligrosas = []
     total_combinaciones = 0
+    # Columna de pesos: se lee cada libro una sola vez, no en cada combinación
+    pesos = array('d', (libro.peso for libro in lista_libros))
     
     # Generar todas las combinaciones posibles de 'num_libros' libros
+    # (las combinaciones de pesos avanzan en paralelo con las de libros)
     print(f"\nExplorando todas las combinaciones de {num_libros} libros...")
-    for combinacion in combinations(lista_libros, num_libros):
+    for combinacion, pesos_combinacion in zip(combinations(lista_libros, num_libros),
+                                              combinations(pesos, num_libros)):
         total_combinaciones += 1
     
         # Calcular peso total de esta combinación
-        peso_total = sum(libro.peso for libro in combinacion)
+        peso_total = sum(pesos_combinacion)
     
         # Si excede el límite, es peligrosa
         if peso_total > peso_maximo:
@@ -73,10 +78,12 @@ def demostrar_exploracion_fuerza_bruta(lista_libros, num_libros=4, peso_maximo=8
     combinaciones_peligrosas = []
     combinacion_num = 0
     peligrosas_encontradas = 0
+    pesos = array('d', (libro.peso for libro in lista_libros))
     
-    for combinacion in combinations(lista_libros, num_libros):
+    for combinacion, pesos_combinacion in zip(combinations(lista_libros, num_libros),
+                                              combinations(pesos, num_libros)):
         combinacion_num += 1
-        peso_total = sum(libro.peso for libro in combinacion)
+        peso_total = sum(pesos_combinacion)
 
         # Mostrar solo las primeras N combinaciones
         if combinacion_num <= mostrar_primeras:
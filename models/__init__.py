@@ -1,5 +1,8 @@
 """
 This package contains all the system data models.
+
+The shared intern pools (AUTORES, GENEROS, ESTANTES) keep one canonical
+object per distinct author, genre and shelf value.
 """
 
 from .libro import Libro
@@ -7,11 +10,19 @@ from .usuario import Usuario
 from .prestamo import Prestamo
 from .reserva import Reserva
 from .estante import Estante
+from .diccionario_valores import DiccionarioValores, AUTORES, GENEROS, ESTANTES, DICCIONARIOS
 
 __all__ = [
     'Libro',
     'Usuario',
     'Prestamo',
     'Reserva',
-    'Estante'
-]
\ No newline at end of file
+    'Estante',
+
+    # Diccionarios de valores compartidos
+    'DiccionarioValores',
+    'AUTORES',
+    'GENEROS',
+    'ESTANTES',
+    'DICCIONARIOS'
+]
@@ -0,0 +1,203 @@
+"""
+Shared intern pools (dictionary encoders) for the repeated text attributes
+of the books: author, genre and shelf.
+
+Each distinct value is stored once and every Libro that has it points to the
+same object, with its folded key computed once. Every value also gets a
+stable integer code, which the columnar store reuses as its encoding.
+
+Because values are canonical, a partial search ("garcia" in the author) is
+resolved once per distinct value with coincidentes(); the books are then
+checked by set membership, which compares by identity instead of running a
+substring search on every book.
+
+The pools are module-level singletons shared by every GestorBiblioteca in
+the process, and values are never removed: authors, genres and shelves of
+deleted books (or of other managers) stay interned until the program ends.
+Structures that only want the values currently in use must keep their own
+set and intersect it with coincidentes() (e.g. IndiceAutores).
+
+Time Complexity:
+    - Intern / code of a value: O(1)
+    - Matching values of a query: O(d) the first time for d distinct values,
+      then O(new values) while the query stays cached
+"""
+
+from models.texto import plegar_consulta, plegar_texto
+
+class DiccionarioValores:
+    """
+    Intern pool with dictionary encoding for one attribute.
+
+    Values are never removed (codes stay stable while the program runs).
+
+    Attributes:
+        nombre (str): Name of the attribute the pool serves.
+        _codigos (dict): Code of each canonical value {valor: codigo}.
+        _valores (list): Canonical value of each code.
+        _plegados (list): Folded key of each code (None for non-text values).
+        _coincidencias (dict): Cached matching values {consulta plegada: [revisados, set]}.
+    """
+
+    # Consultas distintas que se recuerdan antes de vaciar la caché
+    MAXIMO_CONSULTAS = 256
+
+    def __init__(self, nombre):
+        """
+        Initializes an empty pool.
+
+        Args:
+            nombre (str): Name of the attribute ('autor', 'genero', 'estante_id').
+        """
+        self.nombre = nombre
+        self._codigos = {}
+        self._valores = []
+        self._plegados = []
+        self._coincidencias = {}
+
+    def internar(self, valor):
+        """
+        Obtains the canonical object of a value, registering it if new.
+
+        Args:
+            valor: Value to intern (None is returned unchanged).
+
+        Returns:
+            any: Canonical object equal to valor.
+        """
+        if valor is None:
+            return None
+        codigo = self._codigos.get(valor)
+        if codigo is None:
+            codigo = self._registrar(valor)
+        return self._valores[codigo]
+
+    def codificar(self, valor):
+        """
+        Obtains the code of a value, registering it if new.
+
+        Args:
+            valor: Value to encode.
+
+        Returns:
+            int: Code of the value.
+        """
+        codigo = self._codigos.get(valor)
+        if codigo is None:
+            codigo = self._registrar(valor)
+        return codigo
+
+    def codigo_de(self, valor):
+        """
+        Obtains the code of a value without registering it.
+
+        Args:
+            valor: Value to look up.
+
+        Returns:
+            int|None: Code of the value, None if it was never interned.
+        """
+        return self._codigos.get(valor)
+
+    def decodificar(self, codigo):
+        """
+        Obtains the canonical value of a code.
+
+        Args:
+            codigo (int): Code to decode.
+
+        Returns:
+            any: Canonical value.
+        """
+        return self._valores[codigo]
+
+    def plegado(self, valor):
+        """
+        Obtains the folded key of a text value (computed once per distinct value).
+
+        Args:
+            valor (str): Value to fold.
+
+        Returns:
+            str: Folded value.
+        """
+        return self._plegados[self.codificar(valor)]
+
+    def valores(self):
+        """
+        Obtains all the canonical values (position = code).
+
+        Returns:
+            list: Values in code order.
+        """
+        return list(self._valores)
+
+    def codigos_coincidentes(self, consulta):
+        """
+        Obtains the codes of the text values that contain the query
+        (partial, case- and accent-insensitive).
+
+        Args:
+            consulta (str): Text to search for.
+
+        Returns:
+            set: Codes of the matching values.
+        """
+        return {self._codigos[valor] for valor in self.coincidentes(consulta)}
+
+    def coincidentes(self, consulta):
+        """
+        Obtains the canonical values that contain the query (partial, case-
+        and accent-insensitive), so books can be checked by membership.
+
+        The result is cached per query and extended only with the values
+        interned since the last call. It must not be modified.
+
+        Args:
+            consulta (str): Text to search for.
+
+        Returns:
+            set: Matching canonical values.
+        """
+        consulta_plegada = plegar_consulta(consulta)
+        entrada = self._coincidencias.get(consulta_plegada)
+        if entrada is None:
+            if len(self._coincidencias) >= self.MAXIMO_CONSULTAS:
+                self._coincidencias.clear()
+            entrada = self._coincidencias[consulta_plegada] = [0, set()]
+        revisados, encontrados = entrada
+        # Solo se revisan los valores registrados después de la última consulta
+        for codigo in range(revisados, len(self._valores)):
+            plegado = self._plegados[codigo]
+            if plegado is not None and consulta_plegada in plegado:
+                encontrados.add(self._valores[codigo])
+        entrada[0] = len(self._valores)
+        return encontrados
+
+    def _registrar(self, valor):
+        """Registers a new value and returns its code."""
+        codigo = len(self._valores)
+        self._codigos[valor] = codigo
+        self._valores.append(valor)
+        self._plegados.append(plegar_texto(valor) if isinstance(valor, str) else None)
+        return codigo
+
+    def __contains__(self, valor):
+        return valor in self._codigos
+
+    def __len__(self):
+        return len(self._valores)
+
+    def __repr__(self):
+        return f"DiccionarioValores(nombre={self.nombre}, valores={len(self._valores)})"
+
+# Diccionarios compartidos por los cargadores, los modelos y el almacén columnar
+AUTORES = DiccionarioValores('autor')
+GENEROS = DiccionarioValores('genero')
+ESTANTES = DiccionarioValores('estante_id')
+
+DICCIONARIOS = {
+    'autor': AUTORES,
+    'genero': GENEROS,
+    'estante_id': ESTANTES
+}
@@ -12,6 +12,8 @@ class Estante:
 
     PESO_MAXIMO = 8.0 # en kilogramos
 
+    __slots__ = ('id', 'cantidad', 'peso_maximo', 'peso_actual', 'libros_asignados')
+
     def __init__(self, id: str, cantidad: int, peso_maximo: float = None):
         self.id = id
         self.cantidad = cantidad
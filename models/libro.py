@@ -1,3 +1,6 @@
+from models.texto import plegar_texto
+from models.diccionario_valores import AUTORES, ESTANTES, GENEROS
+
 class Libro:
     """
     Model corresponding to the books within the system
@@ -12,8 +15,21 @@ class Libro:
         cantidad_disponible (int): The number of available copies in inventory.
         cantidad_total (int): The total number of copies in inventory.
         estante_id (int): The identifier of the shelf where the book is located.
+        titulo_plegado (str): Folded title used by searches (derived, cached).
+        autor_plegado (str): Folded author used by searches (derived, cached).
+        genero_plegado (str): Folded genre used by searches (derived, cached).
     """
 
+    # Campos de texto con clave plegada precalculada
+    CAMPOS_PLEGADOS = ('titulo', 'autor', 'genero')
+
+    # Sin __dict__ por instancia: atributos en ranuras fijas (menos memoria)
+    __slots__ = (
+        'isbn', '_titulo', '_autor', 'peso', 'valor', '_genero',
+        'cantidad_disponible', 'cantidad_total', '_estante_id',
+        'titulo_plegado', 'autor_plegado', 'genero_plegado'
+    )
+
     def __init__(self, isbn, titulo, autor, peso, valor, genero, cantidad_disponible=1, cantidad_total=1, estante_id=None):
         self.isbn = isbn
         self.titulo = titulo
@@ -25,10 +41,85 @@ class Libro:
         self.cantidad_total = cantidad_total
         self.estante_id = estante_id
 
+    # Las claves plegadas se recalculan al cambiar el campo
+
+    @property
+    def titulo(self):
+        return self._titulo
+
+    @titulo.setter
+    def titulo(self, valor):
+        # El valor se guarda tal cual; la clave plegada siempre es un str
+        self._titulo = valor
+        self.titulo_plegado = plegar_texto(valor if isinstance(valor, str) else '' if valor is None else str(valor))
+
+    @property
+    def autor(self):
+        return self._autor
+
+    @autor.setter
+    def autor(self, valor):
+        # Valor canónico compartido: un objeto y un plegado por autor distinto
+        self._autor = AUTORES.internar(valor)
+        self.autor_plegado = AUTORES.plegado(self._autor)
+
+    @property
+    def genero(self):
+        return self._genero
+
+    @genero.setter
+    def genero(self, valor):
+        self._genero = GENEROS.internar(valor)
+        self.genero_plegado = GENEROS.plegado(self._genero)
+
+    @property
+    def estante_id(self):
+        return self._estante_id
+
+    @estante_id.setter
+    def estante_id(self, valor):
+        self._estante_id = ESTANTES.internar(valor)
+
+    def obtener_plegado(self, atributo):
+        """
+        Obtains the folded value of a text attribute.
+
+        Uses the cached key for 'titulo', 'autor' and 'genero'; other
+        attributes are folded on demand.
+
+        Args:
+            atributo (str): Name of the attribute.
+
+        Returns:
+            str: Folded value.
+        """
+        if atributo in Libro.CAMPOS_PLEGADOS:
+            return getattr(self, atributo + '_plegado')
+        return plegar_texto(getattr(self, atributo))
+
+    def a_diccionario(self):
+        """
+        Converts the book into a dictionary with its public attributes.
+
+        Returns:
+            dict: Book data.
+        """
+        return {
+            'isbn': self.isbn,
+            'titulo': self.titulo,
+            'autor': self.autor,
+            'peso': self.peso,
+            'valor': self.valor,
+            'genero': self.genero,
+            'cantidad_disponible': self.cantidad_disponible,
+            'cantidad_total': self.cantidad_total,
+            'estante_id': self.estante_id
+        }
+
     def esta_disponible(self):
         """
         Checks if the book is available for loan.
-        
+
         Returns:
             bool: True if there is at least one copy available, False otherwise.
         """
@@ -36,6 +127,6 @@ class Libro:
 
     def __str__(self):
         return f"Libro: {self.titulo} (ISBN: {self.isbn})"
-    
+
     def __repr__(self):
-        return (f"Libro(isbn={self.isbn}, titulo={self.titulo}, autor={self.autor},)")
\ No newline at end of file
+        return (f"Libro(isbn={self.isbn}, titulo={self.titulo}, autor={self.autor},)")
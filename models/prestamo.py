@@ -12,6 +12,11 @@ class Prestamo:
         estado (str): Status of the loan.
     """
 
+    __slots__ = (
+        'id', 'usuario_id', 'libro_isbn', 'fecha_prestamo',
+        'fecha_devolucion_esperada', 'fecha_devolucion_real', 'estado'
+    )
+
     def __init__(self, id: str, usuario_id: str, libro_isbn: str, fecha_prestamo: str, fecha_devolucion_esperada: str,
                 fecha_devolucion_real=None, estado="prestado"):
         self.id = id
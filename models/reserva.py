@@ -10,6 +10,8 @@ class Reserva:
         estado (str): Status of the reservation.
     """
 
+    __slots__ = ('id', 'usuario_id', 'libro_isbn', 'fecha_reserva', 'estado')
+
     def __init__(self, id: str, usuario_id: str, libro_isbn: str, fecha_reserva: str, estado="pendiente"):
         self.id = id
         self.usuario_id = usuario_id
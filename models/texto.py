@@ -0,0 +1,31 @@
+"""
+Text folding used by every text comparison of the system (searches,
+indexes and intern pools).
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Bloques Unicode de marcas diacríticas combinantes (acentos, tildes, diéresis...)
+_MARCAS_COMBINANTES = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+
+def plegar_texto(texto):
+    """
+    Folds a text for comparisons: case folding plus accent removal (Unicode NFKD).
+
+    "García", "GARCIA" and "garcia" all fold to "garcia".
+
+    Args:
+        texto (str): Text to fold.
+
+    Returns:
+        str: Folded text.
+    """
+    if texto.isascii():
+        # Camino rápido: sin acentos que eliminar
+        return texto.casefold()
+    return _MARCAS_COMBINANTES.sub('', unicodedata.normalize('NFKD', texto.casefold()))
+
+# Las consultas se repiten (p. ej. en cada llamada recursiva): se guardan en caché
+plegar_consulta = lru_cache(maxsize=1024)(plegar_texto)
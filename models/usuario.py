@@ -10,6 +10,8 @@ class Usuario:
         historial_prestamos (stack): List of loans made by the user.
     """
 
+    __slots__ = ('id', 'nombre', 'apellidos', 'direccion', 'historial_prestamos')
+
     def __init__(self, id: str, nombre: str, apellidos: str, direccion: str):
         self.id = id
         self.nombre = nombre
@@ -6,7 +6,7 @@ for interacting with all system functionalities.
 from controllers.gestor_biblioteca import GestorBiblioteca
 from controllers.adquisicion.lector_archivo import LectorArchivo
 from models import Libro, Usuario, Estante
-from controllers.ordenamiento.merge_sort import generar_reporte_global
+from controllers.ordenamiento.merge_sort import generar_reporte_global, interpretar_criterios, interpretar_limite
 from controllers.resolucion.fuerza_bruta import demostrar_exploracion_fuerza_bruta
 from controllers.resolucion.backtracking import demostrar_backtracking
 from controllers.recursion.valor_total import demostrar_recursion_pila
@@ -85,7 +85,7 @@ def cargar_libros():
     
     try:
         libros = LectorArchivo.cargar_libros(ruta)
-        agregados = sum(1 for libro in libros if gestor.agregar_libro(libro))
+        agregados = gestor.agregar_libros(libros)
         print(f"\n {agregados}/{len(libros)} libros agregados")
     except Exception as e:
         print(f"\n Error: {e}")
@@ -431,6 +431,7 @@ def menu_reportes():
         print("[2] Reporte inventario (Merge Sort)")
         print("[3] Valor por autor (Recursión Pila)")
         print("[4] Peso por autor (Recursión Cola)")
+        print("[5] Resumen por autor y género")
         print("[0] Volver")
         
         op = input("\nOpción: ").strip()
@@ -439,6 +440,7 @@ def menu_reportes():
         elif op == "2": reporte_inventario()
         elif op == "3": valor_autor()
         elif op == "4": peso_autor()
+        elif op == "5": resumen_grupos()
         elif op == "0": break
 
 def estadisticas():
@@ -449,15 +451,30 @@ def estadisticas():
     print(f"Préstamos activos: {stats['prestamos_activos']}")
     print(f"Reservas: {stats['total_reservas']}")
     print(f"Estantes: {stats['total_estantes']}")
+    print(f"Disponibles: {stats['libros_disponibles']} | Agotados: {stats['libros_agotados']}")
+    print(f"Sin estante: {stats['libros_sin_estante']}")
+    if stats['libros_por_genero']:
+        print("\nLibros por género:")
+        for genero, cantidad in sorted(stats['libros_por_genero'].items()):
+            print(f"  • {genero}: {cantidad}")
     pausar()
 
 def reporte_inventario():
     """Generate report."""
     libros = gestor.obtener_todos_los_libros()
     if libros:
-        generar_reporte_global(libros, criterio='valor', orden='desc', 
-                                formato='txt', ruta_archivo='reporte.txt')
-        print("\nReporte en reports/reporte.txt")
+        print("\nCriterios separados por coma, p. ej.: genero asc, autor asc, valor desc")
+        texto = input("Ordenar por (valor desc): ").strip() or "valor desc"
+        cantidad = input("Cantidad de libros (Enter = todos): ")
+        try:
+            criterios = interpretar_criterios(texto)
+            generar_reporte_global(libros, criterio=criterios,
+                                    formato='txt', ruta_archivo='reporte.txt',
+                                    totales=gestor.totales_inventario(),
+                                    limite=interpretar_limite(cantidad))
+            print("\nReporte en reports/reporte.txt")
+        except (ValueError, AttributeError) as e:
+            print(f"\nError: {e}")
     else:
         print("\nSin libros")
     pausar()
@@ -466,7 +483,8 @@ def valor_autor():
     """Calculate total value by author."""
     libros = gestor.obtener_todos_los_libros()
     if libros:
-        demostrar_recursion_pila(libros, input("\nAutor: "))
+        autor = input("\nAutor: ")
+        demostrar_recursion_pila(libros, autor, analisis=gestor.analizar_valor_autor(autor))
     else:
         print("\nSin libros")
     pausar()
@@ -475,11 +493,27 @@ def peso_autor():
     """Calculate average weight per author."""
     libros = gestor.obtener_todos_los_libros()
     if libros:
-        demostrar_recursion_cola(libros, input("\nAutor: "))
+        autor = input("\nAutor: ")
+        demostrar_recursion_cola(libros, autor, resumen=gestor.resumen_autor(autor))
     else:
         print("\nSin libros")
     pausar()
 
+def resumen_grupos():
+    """Show value and weight of every author and genre."""
+    for grupo, titulo in (('autor', 'AUTOR'), ('genero', 'GÉNERO')):
+        resumen = gestor.resumen_por(grupo)
+        if not resumen:
+            print("\nSin libros")
+            break
+        print(f"\n RESUMEN POR {titulo} ")
+        for nombre, fila in sorted(resumen.items(), key=lambda item: -item[1]['valor_total']):
+            print(f"  • {nombre}: {fila['cantidad']} libro(s) | "
+                    f"Valor: ${fila['valor_total']:,.0f} (prom. ${fila['valor_promedio']:,.0f}, "
+                    f"{fila['valor_minimo']:,.0f}-{fila['valor_maximo']:,.0f}) | "
+                    f"Peso: {fila['peso_total']:.2f} Kg (prom. {fila['peso_promedio']:.2f})")
+    pausar()
+
 # Algoritmos
 
 def menu_algoritmos():
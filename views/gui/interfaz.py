@@ -12,6 +12,9 @@ from models import Libro, Usuario, Estante
 class BibliotecaGUI:
     """Main class for the graphical interface."""
     
+    # Espera (ms) tras la última tecla antes de autocompletar y buscar
+    RETARDO_AUTOCOMPLETADO = 250
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Sistema de Gestión de Bibliotecas")
@@ -20,6 +23,10 @@ class BibliotecaGUI:
         # Gestor
         self.gestor = GestorBiblioteca()
         
+        # Búsqueda mientras se escribe (debounce)
+        self._autocompletado_pendiente = None
+        self._campo_sugerencias = 'titulo'
+        
         # Crear interfaz
         self.crear_interfaz()
     
@@ -73,6 +80,17 @@ class BibliotecaGUI:
         ttk.Button(frame_busqueda, text="Buscar", 
                     command=self.buscar_por_autor).pack(side='left', padx=2)
         
+        # Búsqueda mientras se escribe
+        self.entry_buscar_titulo.bind('<KeyRelease>', lambda e: self.programar_autocompletado('titulo'))
+        self.entry_buscar_autor.bind('<KeyRelease>', lambda e: self.programar_autocompletado('autor'))
+        
+        # Sugerencias de autocompletado
+        frame_sugerencias = ttk.LabelFrame(tab, text="Sugerencias")
+        frame_sugerencias.pack(fill='x', padx=5, pady=5)
+        self.lista_sugerencias = tk.Listbox(frame_sugerencias, height=5)
+        self.lista_sugerencias.pack(fill='x', padx=2, pady=2)
+        self.lista_sugerencias.bind('<<ListboxSelect>>', self.seleccionar_sugerencia)
+        
         # Treeview
         frame_tree = ttk.Frame(tab)
         frame_tree.pack(fill='both', expand=True, padx=5, pady=5)
@@ -100,7 +118,7 @@ class BibliotecaGUI:
         if ruta:
             try:
                 libros = LectorArchivo.cargar_libros(ruta)
-                agregados = sum(1 for libro in libros if self.gestor.agregar_libro(libro))
+                agregados = self.gestor.agregar_libros(libros)
                 messagebox.showinfo("Éxito", f"Se agregaron {agregados}/{len(libros)} libros")
                 self.actualizar_lista_libros()
             except Exception as e:
@@ -180,6 +198,49 @@ class BibliotecaGUI:
             libros = self.gestor.buscar_libros_por_autor(autor)
             self.mostrar_libros_en_tree(libros)
     
+    def programar_autocompletado(self, campo):
+        """Schedule autocomplete and search after the user stops typing (debounce)."""
+        if self._autocompletado_pendiente is not None:
+            self.root.after_cancel(self._autocompletado_pendiente)
+        self._autocompletado_pendiente = self.root.after(
+            self.RETARDO_AUTOCOMPLETADO, lambda: self.autocompletar(campo)
+        )
+    
+    def autocompletar(self, campo):
+        """Show suggestions for the typed text and search as you type."""
+        self._autocompletado_pendiente = None
+        self._campo_sugerencias = campo
+        entry = self.entry_buscar_titulo if campo == 'titulo' else self.entry_buscar_autor
+        texto = entry.get()
+        
+        self.lista_sugerencias.delete(0, 'end')
+        if len(texto.strip()) < 2:
+            # Sin consulta: volver a mostrar todo el inventario
+            self.actualizar_lista_libros()
+            return
+        for sugerencia in self.gestor.autocompletar(texto, campo=campo, limite=10):
+            self.lista_sugerencias.insert('end', sugerencia)
+        
+        if campo == 'titulo':
+            self.buscar_por_titulo()
+        else:
+            self.buscar_por_autor()
+    
+    def seleccionar_sugerencia(self, event):
+        """Fill the search box with the selected suggestion and search."""
+        seleccion = self.lista_sugerencias.curselection()
+        if not seleccion:
+            return
+        texto = self.lista_sugerencias.get(seleccion[0])
+        if self._campo_sugerencias == 'titulo':
+            self.entry_buscar_titulo.delete(0, 'end')
+            self.entry_buscar_titulo.insert(0, texto)
+            self.buscar_por_titulo()
+        else:
+            self.entry_buscar_autor.delete(0, 'end')
+            self.entry_buscar_autor.insert(0, texto)
+            self.buscar_por_autor()
+    
     def actualizar_lista_libros(self):
         """Update the list of books."""
         libros = self.gestor.obtener_todos_los_libros()
@@ -612,6 +673,8 @@ class BibliotecaGUI:
                     command=self.peso_por_autor).pack(pady=10)
         ttk.Button(tab, text="Menor Valor de Libros",
                     command=self.valor_menor).pack(pady=10)
+        ttk.Button(tab, text="Resumen por Autor y Género",
+                    command=self.resumen_grupos).pack(pady=10)
     
     def mostrar_estadisticas(self):
         """Shows general statistics."""
@@ -621,18 +684,44 @@ class BibliotecaGUI:
         msg += f"Usuarios: {stats['total_usuarios']}\n"
         msg += f"Préstamos activos: {stats['prestamos_activos']}\n"
         msg += f"Reservas: {stats['total_reservas']}\n"
-        msg += f"Estantes: {stats['total_estantes']}"
+        msg += f"Estantes: {stats['total_estantes']}\n"
+        msg += f"Disponibles: {stats['libros_disponibles']} | Agotados: {stats['libros_agotados']}\n"
+        msg += f"Sin estante: {stats['libros_sin_estante']}"
+        if stats['libros_por_genero']:
+            msg += "\n\nLibros por género:\n"
+            for genero, cantidad in sorted(stats['libros_por_genero'].items()):
+                msg += f"  {genero}: {cantidad}\n"
         messagebox.showinfo("Estadísticas", msg)
     
     def generar_reporte(self):
         """Generate inventory report."""
-        from controllers.ordenamiento.merge_sort import generar_reporte_global
+        from controllers.ordenamiento.merge_sort import generar_reporte_global, interpretar_criterios, interpretar_limite
         libros = self.gestor.obtener_todos_los_libros()
         
         if libros:
-            generar_reporte_global(libros, criterio='valor', orden='desc',
-                                    formato='txt', ruta_archivo='reporte_gui.txt')
-            messagebox.showinfo("Éxito", "Reporte en reports/reporte_gui.txt")
+            from tkinter import simpledialog
+            texto = simpledialog.askstring(
+                "Generar Reporte",
+                "Ordenar por (separados por coma):\nej. genero asc, autor asc, valor desc",
+                initialvalue="valor desc"
+            )
+            if texto is None:
+                return
+            cantidad = simpledialog.askstring(
+                "Generar Reporte",
+                "Cantidad de libros (vacío = todos):\nej. 100 para los 100 primeros"
+            )
+            if cantidad is None:
+                return
+            try:
+                criterios = interpretar_criterios(texto or "valor desc")
+                generar_reporte_global(libros, criterio=criterios,
+                                        formato='txt', ruta_archivo='reporte_gui.txt',
+                                        totales=self.gestor.totales_inventario(),
+                                        limite=interpretar_limite(cantidad))
+                messagebox.showinfo("Éxito", "Reporte en reports/reporte_gui.txt")
+            except (ValueError, AttributeError) as e:
+                messagebox.showerror("Error", str(e))
         else:
             messagebox.showwarning("Advertencia", "Sin libros")
     
@@ -651,9 +740,7 @@ class BibliotecaGUI:
         if not autor:
             return
         
-        from controllers.recursion.valor_total import analizar_valor_por_autor
-        
-        analisis = analizar_valor_por_autor(libros, autor)
+        analisis = self.gestor.analizar_valor_autor(autor)
         
         if analisis['cantidad_libros'] == 0:
             messagebox.showinfo("Resultado", f"No se encontraron libros del autor: {autor}")
@@ -694,9 +781,7 @@ class BibliotecaGUI:
         if not autor:
             return
         
-        from controllers.recursion.peso_promedio import calcular_estadisticas_peso
-        
-        stats = calcular_estadisticas_peso(libros, autor)
+        stats = self.gestor.estadisticas_peso_autor(autor)
         
         if stats['cantidad_libros'] == 0:
             messagebox.showinfo("Resultado", f"No se encontraron libros del autor: {autor}")
@@ -719,6 +804,23 @@ class BibliotecaGUI:
         
         messagebox.showinfo("Peso por Autor", msg)
 
+    def resumen_grupos(self):
+        """Shows value and weight of every author and genre."""
+        resumen_autores = self.gestor.resumen_por('autor')
+        if not resumen_autores:
+            messagebox.showwarning("Advertencia", "No hay libros disponibles")
+            return
+        
+        msg = ""
+        for titulo, resumen in (("AUTOR", resumen_autores), ("GÉNERO", self.gestor.resumen_por('genero'))):
+            msg += f"RESUMEN POR {titulo}:\n"
+            for nombre, fila in sorted(resumen.items(), key=lambda item: -item[1]['valor_total']):
+                msg += f"  {nombre}: {fila['cantidad']} libro(s)\n"
+                msg += f"     Valor: ${fila['valor_total']:,.0f} (prom. ${fila['valor_promedio']:,.0f})\n"
+                msg += f"     Peso: {fila['peso_total']:.2f} Kg (prom. {fila['peso_promedio']:.2f} Kg)\n"
+            msg += "\n"
+        messagebox.showinfo("Resumen por Autor y Género", msg)
+
     def valor_menor(self):
         libros = self.gestor.obtener_todos_los_libros()
         